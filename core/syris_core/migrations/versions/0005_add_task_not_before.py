@@ -0,0 +1,36 @@
+"""add tasks.not_before for deferred retries
+
+Revision ID: 0005
+Revises: 031a9f693983
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+
+revision: str = "0005"
+down_revision: Union[str, None] = "031a9f693983"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("not_before", TIMESTAMP(timezone=True), nullable=True),
+    )
+    # Claim path: pending tasks ordered by age, filtered on not_before
+    op.create_index(
+        "ix_tasks_pending_not_before",
+        "tasks",
+        ["not_before"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_pending_not_before", table_name="tasks")
+    op.drop_column("tasks", "not_before")
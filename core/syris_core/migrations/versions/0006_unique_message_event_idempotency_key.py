@@ -0,0 +1,48 @@
+"""make message_events.idempotency_key unique (partial, non-null keys)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the key only on the earliest event per key; later duplicates were
+    # re-runs of the same input and keep their rows, just not the key.
+    op.execute(
+        """
+        UPDATE message_events AS m
+        SET idempotency_key = NULL
+        WHERE m.idempotency_key IS NOT NULL
+          AND EXISTS (
+              SELECT 1 FROM message_events AS o
+              WHERE o.idempotency_key = m.idempotency_key
+                AND (o.created_at, o.event_id) < (m.created_at, m.event_id)
+          )
+        """
+    )
+    op.drop_index("ix_message_events_idempotency_key", table_name="message_events")
+    op.create_index(
+        "ux_message_events_idempotency_key",
+        "message_events",
+        ["idempotency_key"],
+        unique=True,
+        postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_message_events_idempotency_key", table_name="message_events")
+    op.create_index(
+        "ix_message_events_idempotency_key", "message_events", ["idempotency_key"]
+    )
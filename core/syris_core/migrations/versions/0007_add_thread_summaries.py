@@ -0,0 +1,40 @@
+"""add thread_summaries and a thread/created_at index on message_events
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID as PGUUID
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "thread_summaries",
+        sa.Column("thread_id", PGUUID(as_uuid=True), primary_key=True),
+        sa.Column("summary", sa.Text(), nullable=False, server_default=""),
+        sa.Column("covered_through", TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("covered_event_id", PGUUID(as_uuid=True), nullable=False),
+        sa.Column("turns_folded", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", TIMESTAMP(timezone=True), nullable=False),
+    )
+    # Context window reads the newest N events of one thread
+    op.create_index(
+        "ix_message_events_thread_id_created_at",
+        "message_events",
+        ["thread_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_message_events_thread_id_created_at", table_name="message_events")
+    op.drop_table("thread_summaries")
@@ -0,0 +1,37 @@
+"""add llm_response_cache
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_response_cache",
+        sa.Column("cache_key", sa.Text(), primary_key=True),
+        sa.Column("provider", sa.Text(), nullable=False),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("response", JSONB(), nullable=False),
+        sa.Column("created_at", TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("expires_at", TIMESTAMP(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_llm_response_cache_expires_at", "llm_response_cache", ["expires_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_response_cache_expires_at", table_name="llm_response_cache")
+    op.drop_table("llm_response_cache")
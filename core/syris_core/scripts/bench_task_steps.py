@@ -0,0 +1,84 @@
+"""Benchmark: wall time and SQL statement count for long multi-step tasks.
+
+Submits tasks with N no-op steps, drives each with TaskEngine.claim_and_run()
+and reports wall time plus the number of SQL statements issued per task.
+Both engines issue O(N) statements (the cursor saves one per step), but the
+old per-iteration re-read fetched every step row each time, O(N^2) rows,
+which shows up in wall time as N grows.
+
+Runs against SYRIS_DATABASE_URL (a disposable database — it creates tasks):
+
+    uv run python scripts/bench_task_steps.py --steps 100 --tasks 5
+
+Compare against the previous engine by running the same command on a
+checkout from before the change.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import event
+
+from syris_core.config import Settings
+from syris_core.observability.audit import AuditWriter
+from syris_core.schemas.tasks import StepSpec, TaskSubmit
+from syris_core.storage.db import create_engine, create_sessionmaker, init_db
+from syris_core.tasks.engine import TaskEngine
+
+
+async def _noop(input_payload: dict[str, Any]) -> dict[str, Any]:
+    return {"ok": True}
+
+
+async def main(steps: int, tasks: int) -> None:
+    settings = Settings()
+    engine = create_engine(settings.database_url)
+    sessionmaker = create_sessionmaker(engine)
+    await init_db(engine)
+
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    audit = AuditWriter(sessionmaker)
+    task_engine = TaskEngine(sessionmaker, audit, handlers={"noop": _noop})
+
+    wall: list[float] = []
+    per_task_statements: list[int] = []
+    for _ in range(tasks):
+        await task_engine.submit(
+            TaskSubmit(
+                trace_id=uuid.uuid4(),
+                handler="bench",
+                steps=[StepSpec(tool_name="noop") for _ in range(steps)],
+            )
+        )
+        statements = 0
+        start = time.perf_counter()
+        ran = await task_engine.claim_and_run()
+        wall.append(time.perf_counter() - start)
+        per_task_statements.append(statements)
+        assert ran, "no pending task claimed — is another worker draining the queue?"
+
+    await engine.dispose()
+
+    print(f"steps/task={steps} tasks={tasks}")
+    print(
+        f"wall_s  median={statistics.median(wall):.3f} "
+        f"min={min(wall):.3f} max={max(wall):.3f}"
+    )
+    print(f"sql_statements/task median={statistics.median(per_task_statements):.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.steps, args.tasks))
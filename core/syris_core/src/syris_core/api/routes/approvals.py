@@ -9,6 +9,7 @@ from syris_core.observability.audit import AuditWriter
 from syris_core.schemas.safety import ApproveRequest, DenyRequest
 from syris_core.storage.db import session_scope
 from syris_core.storage.models import ApprovalRow, TaskRow, TaskStepRow
+from syris_core.storage.notify import notify
 from syris_core.storage.repos.approvals import ApprovalRepo
 from syris_core.storage.repos.tasks import TaskRepo
 from syris_core.tasks.state import assert_step_transition, assert_task_transition
@@ -117,6 +118,7 @@ async def approve(
                     .values(status="pending", updated_at=datetime.now(timezone.utc))
                 )
                 await session.execute(stmt)
+                await notify(session, "tasks")
 
     await audit.emit(
         trace_id,
@@ -127,6 +129,7 @@ async def approve(
         ref_task_id=ref_task_id,
         ref_step_id=ref_step_id,
         ref_approval_id=approval_id,
+        durable=True,
     )
 
 
@@ -182,4 +185,5 @@ async def deny(
         ref_task_id=ref_task_id,
         ref_step_id=ref_step_id,
         ref_approval_id=approval_id,
+        durable=True,
     )
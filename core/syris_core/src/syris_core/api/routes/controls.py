@@ -29,6 +29,7 @@ async def set_autonomy(body: SetAutonomyRequest, request: Request) -> None:
         ),
         outcome="success",
         autonomy_level=body.level,
+        durable=True,
     )
 
 
@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from datetime import datetime, timezone
 from typing import Any
 
@@ -19,6 +20,19 @@ async def health(request: Request) -> dict[str, Any]:
     run_id = getattr(app.state, "run_id", None)
     heartbeat = getattr(app.state, "heartbeat", None)
     sessionmaker = getattr(app.state, "sessionmaker", None)
+    audit_writer = getattr(app.state, "audit_writer", None)
+    task_workers = getattr(app.state, "task_workers", None)
+    llm_provider = getattr(app.state, "llm_provider", None)
+    llm_http = llm_provider.http_stats() if llm_provider else None
+    backend_snapshots = getattr(llm_provider, "backend_snapshots", None)
+    context_builder = getattr(app.state, "context_builder", None)
+    thread_summarizer = getattr(app.state, "thread_summarizer", None)
+    llm_cache = getattr(app.state, "llm_cache", None)
+    llm_client = getattr(app.state, "llm_client", None)
+    llm_admission = getattr(app.state, "llm_admission", None)
+    event_bus = getattr(app.state, "event_bus", None)
+    pipeline_queue = getattr(app.state, "pipeline_queue", None)
+    pipeline_dispatcher = getattr(app.state, "pipeline_dispatcher", None)
 
     uptime_s = int((now - started_at).total_seconds()) if started_at else None
     last_heartbeat_at = heartbeat.snapshot().last_beat_at if heartbeat else None
@@ -47,5 +61,23 @@ async def health(request: Request) -> dict[str, Any]:
         "uptime_s": uptime_s,
         "db": {"ok": db_ok, "error": db_error},
         "last_heartbeat_at": last_heartbeat_at.isoformat() if last_heartbeat_at else None,
+        "audit": asdict(audit_writer.snapshot()) if audit_writer else None,
+        "task_workers": asdict(task_workers.snapshot()) if task_workers else None,
+        "pipeline_queue": asdict(pipeline_queue.snapshot()) if pipeline_queue else None,
+        "pipeline_dispatcher": (
+            asdict(pipeline_dispatcher.snapshot()) if pipeline_dispatcher else None
+        ),
+        "llm_http": asdict(llm_http) if llm_http else None,
+        "llm_backends": (
+            [asdict(b) for b in backend_snapshots()] if backend_snapshots else None
+        ),
+        "llm_prompt_prefix": (
+            asdict(context_builder.prefix_snapshot()) if context_builder else None
+        ),
+        "thread_summarizer": asdict(thread_summarizer.snapshot()) if thread_summarizer else None,
+        "llm_cache": asdict(llm_cache.snapshot()) if llm_cache else None,
+        "llm_coalescing": asdict(llm_client.coalescing_snapshot()) if llm_client else None,
+        "llm_admission": asdict(llm_admission.snapshot()) if llm_admission else None,
+        "event_bus": asdict(event_bus.snapshot()) if event_bus else None,
         "now": now.isoformat(),
     }
\ No newline at end of file
@@ -1,14 +1,47 @@
-from fastapi import APIRouter, Request
+from typing import Union
 
-from ...pipeline.run import run_pipeline
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from ...pipeline.queue import PipelineQueueFull
+from ...pipeline.run import run_pipeline, run_pipeline_batch
 from ...schemas.events import RawInput
-from ...schemas.pipeline import IngestResponse
+from ...schemas.pipeline import BatchIngestResponse, IngestAccepted, IngestResponse
 
 router = APIRouter(tags=["pipeline"])
 
+# Suggested client back-off when the async ingest queue is full
+_RETRY_AFTER_S = 1
+
+
+@router.post(
+    "/ingest",
+    response_model=Union[IngestResponse, IngestAccepted],
+    responses={202: {"model": IngestAccepted}, 429: {"description": "Ingest queue full"}},
+)
+async def ingest(
+    request: Request,
+    response: Response,
+    body: RawInput,
+    async_: bool = Query(default=False, alias="async"),
+) -> Union[IngestResponse, IngestAccepted]:
+    """Run the pipeline for *body*.
+
+    By default the whole pipeline runs before responding, after any earlier
+    input on the same thread has finished. With
+    ``async=true`` the event is only normalized and persisted here, then
+    queued for a pipeline worker; the response is 202 with the event_id and
+    trace_id to follow on /stream/events, or 429 when the queue is full.
+    """
+    if async_:
+        try:
+            accepted = await request.app.state.pipeline_queue.submit(body)
+        except PipelineQueueFull as exc:
+            raise HTTPException(
+                status_code=429, detail=str(exc), headers={"Retry-After": str(_RETRY_AFTER_S)}
+            )
+        response.status_code = 202
+        return accepted
 
-@router.post("/ingest", response_model=IngestResponse)
-async def ingest(request: Request, body: RawInput) -> IngestResponse:
     return await run_pipeline(
         body,
         normalizer=request.app.state.normalizer,
@@ -16,4 +49,36 @@ async def ingest(request: Request, body: RawInput) -> IngestResponse:
         executor=request.app.state.executor,
         responder=request.app.state.responder,
         notifier=request.app.state.notifier,
+        rules_engine=request.app.state.rules_engine,
+        idempotency=request.app.state.idempotency_cache,
+        dispatcher=request.app.state.pipeline_dispatcher,
+    )
+
+
+@router.post("/ingest/batch", response_model=BatchIngestResponse)
+async def ingest_batch(request: Request, body: list[RawInput]) -> BatchIngestResponse:
+    """Run the pipeline for every input in *body*; one result item per input.
+
+    All events are persisted in a single insert and rules are evaluated
+    over the whole batch; routing onwards runs with bounded concurrency.
+    A failed item does not fail the request.
+    """
+    settings = request.app.state.settings.ingest
+    if len(body) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"batch of {len(body)} exceeds batch_max_items={settings.batch_max_items}",
+        )
+    items = await run_pipeline_batch(
+        body,
+        normalizer=request.app.state.normalizer,
+        router=request.app.state.router,
+        executor=request.app.state.executor,
+        responder=request.app.state.responder,
+        notifier=request.app.state.notifier,
+        rules_engine=request.app.state.rules_engine,
+        idempotency=request.app.state.idempotency_cache,
+        concurrency=settings.batch_concurrency,
+        dispatcher=request.app.state.pipeline_dispatcher,
     )
+    return BatchIngestResponse(items=items)
@@ -75,4 +75,8 @@ def _bundle_to_dict(bundle: Any) -> dict[str, Any]:
         "current_user_message": bundle.current_user_message,
         "tool_catalog": bundle.tool_catalog,
         "recent_audit_events": bundle.recent_audit_events,
+        "prefix_hash": bundle.prefix_hash,
+        "thread_summary": bundle.thread_summary,
+        "history_tokens": bundle.history_tokens,
+        "turns_omitted": bundle.turns_omitted,
     }
@@ -60,6 +60,7 @@ async def create_rule(body: RuleCreate, request: Request) -> Rule:
     async with session_scope(sessionmaker) as session:
         saved = await RuleRepo(session).create(row)
         result = _row_to_schema(saved)
+    request.app.state.rules_engine.invalidate()
 
     await audit.emit(
         uuid.uuid4(),
@@ -98,6 +99,7 @@ async def patch_rule(rule_id: uuid.UUID, body: RulePatch, request: Request) -> R
 
     if updated is None:
         raise HTTPException(status_code=404, detail="Rule not found")
+    request.app.state.rules_engine.invalidate()
 
     await audit.emit(
         uuid.uuid4(),
@@ -1,32 +1,147 @@
 import asyncio
 import json
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header, Query, Request
 from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_, select
+
+from syris_core.events.bus import EventFilter, Subscription, seq_time
+from syris_core.schemas.audit import AuditEvent, AuditOutcome, AuditStage
+from syris_core.storage.db import session_scope
+from syris_core.storage.models import AuditEventRow
 
 router = APIRouter(tags=["stream"])
 
+# Gap fallback: keyset pages over audit_events, capped per reconnect
+_DB_REPLAY_PAGE = 500
+_DB_REPLAY_MAX_ROWS = 5_000
+# An audit event is stamped before it is published (sync writes commit in
+# between), so its timestamp can trail the seq of the envelope. Widen the
+# lower bound by this much; repeats around the seam carry the same audit_id.
+_DB_REPLAY_SLACK = timedelta(seconds=1)
+
 
 @router.get("/stream/events")
-async def stream_events(request: Request) -> StreamingResponse:
-    """SSE endpoint that streams all EventBus envelopes to the client.
+async def stream_events(
+    request: Request,
+    stream_type: Optional[list[str]] = Query(default=None),
+    trace_id: Optional[UUID] = Query(default=None),
+    stage: Optional[AuditStage] = Query(default=None),
+    outcome: Optional[AuditOutcome] = Query(default=None),
+    last_event_id: Optional[str] = Header(default=None),
+) -> StreamingResponse:
+    """SSE endpoint that streams EventBus envelopes to the client.
+
+    Optional filters are applied on the server: ``stream_type`` (repeatable),
+    ``trace_id``, and ``stage`` / ``outcome`` (audit events only).
 
-    Yields ``data: {json}\\n\\n`` lines for each envelope.
+    Yields ``id: <seq>\\ndata: {json}\\n\\n`` for each matching envelope.
+    On reconnect, the ``Last-Event-ID`` header (sent automatically by
+    EventSource) replays what was published since that id from the bus's
+    in-memory buffer (``llm_delta`` tokens are live-only). If the gap is older than the buffer, the missing
+    audit events are read from ``audit_events`` first (other stream types
+    are not persisted and cannot be recovered); a ``: gap`` comment marks
+    replay that had to be cut short.
+
+    If the client falls behind and the bus drops envelopes for it, a
+    ``: dropped <total>`` comment precedes the next one.
     Sends a keepalive comment every 15 seconds when idle.
     Unsubscribes from the bus when the client disconnects.
     """
     bus = request.app.state.event_bus
-    queue: asyncio.Queue[dict] = bus.subscribe()
+    event_filter = EventFilter(
+        stream_types=frozenset(stream_type) if stream_type else None,
+        trace_id=str(trace_id) if trace_id else None,
+        stage=stage,
+        outcome=outcome,
+    )
+    after = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    sub = bus.subscribe(event_filter, after=after)
 
     async def generate():
+        reported_drops = 0
         try:
+            if sub.gap_before is not None and after is not None:
+                async for frame in _replay_from_db(request, event_filter, after, sub):
+                    yield frame
+            for message in sub.replay:
+                yield b"id: %d\ndata: " % message.seq + message.data + b"\n\n"
+            sub.replay = []
+
             while True:
                 try:
-                    envelope = await asyncio.wait_for(queue.get(), timeout=15.0)
-                    yield f"data: {json.dumps(envelope)}\n\n"
+                    message = await asyncio.wait_for(sub.get(), timeout=15.0)
                 except asyncio.TimeoutError:
-                    yield ": keepalive\n\n"
+                    yield b": keepalive\n\n"
+                    continue
+                if sub.dropped != reported_drops:
+                    reported_drops = sub.dropped
+                    yield b": dropped %d\n\n" % reported_drops
+                yield b"id: %d\ndata: " % message.seq + message.data + b"\n\n"
         finally:
-            bus.unsubscribe(queue)
+            bus.unsubscribe(sub)
 
     return StreamingResponse(generate(), media_type="text/event-stream")
+
+
+async def _replay_from_db(
+    request: Request, event_filter: EventFilter, after: int, sub: Subscription
+) -> AsyncIterator[bytes]:
+    """Audit events published after seq *after* but no longer in the bus buffer."""
+    if event_filter.stream_types is not None and "audit_event" not in event_filter.stream_types:
+        # Only stream types that are never persisted
+        yield b": gap\n\n"
+        return
+    assert sub.gap_before is not None
+    lower = seq_time(after) - _DB_REPLAY_SLACK
+    upper = seq_time(sub.gap_before)
+    cursor: Optional[tuple[datetime, UUID]] = None
+    sent = 0
+
+    while sent < _DB_REPLAY_MAX_ROWS:
+        stmt = (
+            select(AuditEventRow)
+            .where(AuditEventRow.timestamp > lower)  # type: ignore
+            .where(AuditEventRow.timestamp < upper)  # type: ignore
+            .order_by(AuditEventRow.timestamp, AuditEventRow.audit_id)  # type: ignore
+            .limit(_DB_REPLAY_PAGE)
+        )
+        if cursor is not None:
+            stmt = stmt.where(
+                or_(
+                    AuditEventRow.timestamp > cursor[0],  # type: ignore
+                    and_(
+                        AuditEventRow.timestamp == cursor[0],  # type: ignore
+                        AuditEventRow.audit_id > cursor[1],  # type: ignore
+                    ),
+                )
+            )
+        if event_filter.trace_id is not None:
+            stmt = stmt.where(AuditEventRow.trace_id == UUID(event_filter.trace_id))  # type: ignore
+        if event_filter.stage is not None:
+            stmt = stmt.where(AuditEventRow.stage == event_filter.stage)  # type: ignore
+        if event_filter.outcome is not None:
+            stmt = stmt.where(AuditEventRow.outcome == event_filter.outcome)  # type: ignore
+
+        async with session_scope(request.app.state.sessionmaker) as session:
+            rows = (await session.execute(stmt)).scalars().all()
+
+        for row in rows:
+            event = AuditEvent(**row.model_dump())
+            envelope = {
+                "stream_type": "audit_event",
+                "trace_id": str(event.trace_id),
+                "timestamp": event.timestamp.isoformat(),
+                "payload": event.model_dump(mode="json"),
+            }
+            # No id: the client's Last-Event-ID stays put until live ids resume
+            yield b"data: " + json.dumps(envelope).encode("utf-8") + b"\n\n"
+        sent += len(rows)
+        if len(rows) < _DB_REPLAY_PAGE:
+            return
+        cursor = (rows[-1].timestamp, rows[-1].audit_id)
+
+    yield b": gap\n\n"
@@ -28,6 +28,7 @@ class TaskResponse(BaseModel):
     updated_at: str
     started_at: Optional[str]
     completed_at: Optional[str]
+    not_before: Optional[str]
     steps: list[dict[str, Any]]
 
 
@@ -45,6 +46,7 @@ def _row_to_response(task_row: TaskRow, steps: list[TaskStepRow]) -> TaskRespons
         updated_at=task_row.updated_at.isoformat(),
         started_at=task_row.started_at.isoformat() if task_row.started_at else None,
         completed_at=task_row.completed_at.isoformat() if task_row.completed_at else None,
+        not_before=task_row.not_before.isoformat() if task_row.not_before else None,
         steps=[
             {
                 "step_id": str(s.step_id),
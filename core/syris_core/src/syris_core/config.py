@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -6,19 +6,120 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from .version import VERSION
 
 
+LLMProviderKind = Literal["sglang", "ollama", "groq", "cerebras"]
+
+
+class LLMBackendSettings(BaseModel):
+    """One extra backend for the provider router (see LLMSettings.fallbacks)."""
+
+    provider: LLMProviderKind
+    base_url: str = ""  # ollama / sglang only
+    model: str
+    timeout_s: int = Field(default=30, ge=1, le=300)
+
+
 class LLMSettings(BaseModel):
     """Configuration for the LLM provider used by the responder."""
 
-    provider: Literal["sglang", "ollama", "groq", "cerebras"] = "ollama"
+    provider: LLMProviderKind = "ollama"
     base_url: str = "http://localhost:11434"
     model: str = "gemma4:latest"
     timeout_s: int = Field(default=30, ge=1, le=300)
+    # Further backends; when set, requests are routed across the primary and
+    # these by latency, with failover and circuit breaking
+    # (e.g. SYRIS_LLM__FALLBACKS='[{"provider": "groq", "model": "llama-3.1-8b-instant"}]')
+    fallbacks: list[LLMBackendSettings] = Field(default_factory=list)
+    # Race a second backend when a round-trip is still running after this long
+    hedge_after_ms: Optional[int] = Field(default=None, ge=1)
+    breaker_failures: int = Field(default=3, ge=1)
+    breaker_open_s: float = Field(default=30.0, gt=0)
+    # Connection pool for the HTTP providers (ollama, sglang)
+    http_max_connections: int = Field(default=20, ge=1)
+    http_max_keepalive: int = Field(default=10, ge=0)
+    http_keepalive_expiry_s: float = Field(default=30.0, ge=0)
+    http2: bool = True
+    # Max tool calls from one LLM turn run at the same time
+    tool_concurrency: int = Field(default=4, ge=1, le=64)
+    # Tool-calling loop budget: rounds, cumulative tokens, wall-clock seconds
+    max_tool_iterations: int = Field(default=10, ge=1, le=50)
+    loop_token_budget: Optional[int] = Field(default=None, ge=1)
+    loop_time_budget_s: Optional[float] = Field(default=None, gt=0)
+    # Conversation window: newest turns within this many estimated tokens
+    history_token_budget: int = Field(default=3000, ge=0)
+    history_max_turns: int = Field(default=50, ge=1, le=500)
+    # Fold turns that leave the window into a per-thread rolling summary
+    summarize_history: bool = True
+    # Response cache for stateless complete() calls (intent, step decisions)
+    cache_enabled: bool = True
+    cache_ttl_s: float = Field(default=3600.0, gt=0)
+    cache_max_entries: int = Field(default=1024, ge=1)
+    # Also keep entries in Postgres (llm_response_cache) across restarts
+    cache_persistent: bool = False
+    # Admission control: max LLM calls at the provider at once (None = unbounded).
+    # Chat is served before task steps, task steps before background traffic;
+    # reserved_interactive slots are only ever given to chat.
+    max_in_flight: Optional[int] = Field(default=None, ge=1, le=256)
+    reserved_interactive: int = Field(default=1, ge=0)
+    # Stream chat replies to /stream/events as llm_delta envelopes
+    stream: bool = True
     system_prompt: str = (
         "You are SYRIS, an always-on automation control plane. "
         "Respond concisely and accurately."
     )
 
 
+class AuditSettings(BaseModel):
+    """Configuration for the audit sink."""
+
+    # "buffered" (default) batches events in the background; "sync" commits
+    # every event before emit() returns. Gate and operator events are always sync.
+    durability: Literal["sync", "buffered"] = "buffered"
+    batch_size: int = Field(default=200, ge=1, le=5000)
+    flush_interval_s: float = Field(default=0.25, gt=0, le=10)
+    max_buffer: int = Field(default=10_000, ge=1)
+
+
+class TaskSettings(BaseModel):
+    """Configuration for the task worker pool."""
+
+    worker_count: int = Field(default=4, ge=0, le=256)
+    # Claimed-but-unstarted tasks held locally; at least worker_count
+    prefetch: int = Field(default=16, ge=0, le=10_000)
+    claim_batch_size: int = Field(default=16, ge=1, le=1000)
+    idle_backoff_min_s: float = Field(default=0.1, gt=0)
+    idle_backoff_max_s: float = Field(default=5.0, gt=0)
+    shutdown_grace_s: float = Field(default=30.0, ge=0)
+
+
+class IngestSettings(BaseModel):
+    """Configuration for the ingest pipeline."""
+
+    # Duplicates (same idempotency_key) seen within this window get the
+    # original IngestResponse back; later ones get a SUPPRESSED result.
+    idempotency_window_s: float = Field(default=300.0, ge=0)
+    idempotency_cache_size: int = Field(default=10_000, ge=1)
+    # POST /ingest?async=true: workers draining the pipeline queue, and the
+    # queue depth beyond which requests get 429
+    async_workers: int = Field(default=8, ge=1, le=256)
+    async_queue_size: int = Field(default=1000, ge=1, le=100_000)
+    async_shutdown_grace_s: float = Field(default=30.0, ge=0)
+    # POST /ingest/batch: max inputs per request, and events processed at once
+    batch_max_items: int = Field(default=500, ge=1, le=3000)
+    batch_concurrency: int = Field(default=8, ge=1, le=256)
+    # Pipeline runs are ordered per thread_id; this many threads run at once
+    dispatch_concurrency: int = Field(default=16, ge=1, le=1024)
+    dispatch_shutdown_grace_s: float = Field(default=30.0, ge=0)
+
+
+class StreamSettings(BaseModel):
+    """Configuration for the EventBus and /stream/events."""
+
+    # Per-subscriber queue; a slower client loses its oldest envelopes
+    subscriber_queue_size: int = Field(default=100, ge=1, le=100_000)
+    # Envelopes kept in memory for Last-Event-ID replay on reconnect
+    replay_buffer_size: int = Field(default=1000, ge=0, le=1_000_000)
+
+
 class Settings(BaseSettings):
     """
         v3.0.x settings:
@@ -30,6 +131,8 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="SYRIS_",
         env_file=".env",
+        # Nested groups: SYRIS_LLM__MODEL, SYRIS_AUDIT__DURABILITY, ...
+        env_nested_delimiter="__",
         extra="ignore"
     )
 
@@ -47,4 +150,12 @@ class Settings(BaseSettings):
 
     log_level: str = "INFO"
 
-    llm: LLMSettings = Field(default_factory=LLMSettings)
\ No newline at end of file
+    llm: LLMSettings = Field(default_factory=LLMSettings)
+
+    audit: AuditSettings = Field(default_factory=AuditSettings)
+
+    tasks: TaskSettings = Field(default_factory=TaskSettings)
+
+    ingest: IngestSettings = Field(default_factory=IngestSettings)
+
+    stream: StreamSettings = Field(default_factory=StreamSettings)
\ No newline at end of file
@@ -1,47 +1,225 @@
 import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
 
+logger = logging.getLogger(__name__)
 
 MAX_QUEUE_SIZE = 100
+REPLAY_BUFFER_SIZE = 1_000
+# Delivered live but never buffered for replay: one streamed reply publishes
+# an envelope per token and would evict everything else from the ring
+TRANSIENT_STREAM_TYPES: frozenset[str] = frozenset({"llm_delta"})
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Server-side subscription filter; None fields match everything.
+
+    stage and outcome are read from the envelope payload, so they only
+    match envelopes that carry them (audit events).
+    """
+
+    stream_types: Optional[frozenset[str]] = None
+    trace_id: Optional[str] = None
+    stage: Optional[str] = None
+    outcome: Optional[str] = None
+
+    def matches(self, envelope: dict) -> bool:
+        if self.stream_types is not None and envelope.get("stream_type") not in self.stream_types:
+            return False
+        if self.trace_id is not None and envelope.get("trace_id") != self.trace_id:
+            return False
+        if self.stage is None and self.outcome is None:
+            return True
+        payload = envelope.get("payload") or {}
+        if self.stage is not None and payload.get("stage") != self.stage:
+            return False
+        if self.outcome is not None and payload.get("outcome") != self.outcome:
+            return False
+        return True
+
+
+MATCH_ALL = EventFilter()
+
+
+def seq_time(seq: int) -> datetime:
+    """Approximate publish time encoded in a sequence id."""
+    return datetime.fromtimestamp(seq / 1_000_000, tz=timezone.utc)
+
+
+class BusMessage:
+    """A published envelope with its sequence id.
+
+    ``data`` is the JSON encoding, computed on first use and then shared by
+    every subscriber (and any later replay).
+    """
+
+    __slots__ = ("seq", "envelope", "_data")
+
+    def __init__(self, seq: int, envelope: dict) -> None:
+        self.seq = seq
+        self.envelope = envelope
+        self._data: Optional[bytes] = None
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            self._data = json.dumps(self.envelope).encode("utf-8")
+        return self._data
+
+
+class Subscription:
+    """One subscriber: its filter, bounded queue and delivery counters.
+
+    When subscribed with ``after``, ``replay`` holds the buffered messages
+    published since then (oldest first) and ``gap_before`` is set if the
+    buffer no longer reaches back that far: messages published after
+    ``after`` and before seq ``gap_before`` are lost from memory.
+    """
+
+    def __init__(self, event_filter: EventFilter, max_queue_size: int) -> None:
+        self.filter = event_filter
+        self.queue: asyncio.Queue[BusMessage] = asyncio.Queue(maxsize=max_queue_size)
+        self.replay: list[BusMessage] = []
+        self.gap_before: Optional[int] = None
+        self.matched = 0
+        self.dropped = 0
+
+    async def get(self) -> BusMessage:
+        return await self.queue.get()
+
+    def _offer(self, message: BusMessage) -> None:
+        # Slow consumer: drop its oldest message to make room, and count it
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            else:
+                self.dropped += 1
+        self.queue.put_nowait(message)
+        self.matched += 1
+
+
+@dataclass(frozen=True)
+class EventBusSnapshot:
+    subscribers: int
+    published: int
+    serialized: int
+    dropped: int
+    last_seq: int
+    buffered: int
+    replays: int
 
 
 class EventBus:
     """In-process pub/sub bus for real-time event streaming.
 
     Publishers call publish() without knowing about SSE or HTTP.
-    SSE clients call subscribe() to get a queue, and unsubscribe() on disconnect.
-    If no clients are connected, publish() is a no-op.
+    SSE clients call subscribe() with an optional EventFilter to get a
+    Subscription, and unsubscribe() on disconnect. Filtering happens here,
+    before anything is queued, and an envelope is JSON-encoded at most once
+    however many subscribers receive it.
+
+    Every envelope gets a sequence id and is kept in a ring buffer of the
+    last replay_size messages, so a reconnecting client can ask for what it
+    missed (subscribe(after=...)). Ids are microseconds since the epoch,
+    bumped by one when two publishes share a microsecond: they increase
+    monotonically, survive a restart (ids from an earlier run are simply
+    older than the buffer) and map back to a publish time via seq_time().
+    Envelopes of a transient stream type (llm_delta) get a seq but are not
+    buffered, so they are never replayed.
     """
 
-    def __init__(self, max_queue_size: int = MAX_QUEUE_SIZE) -> None:
-        self._subscribers: list[asyncio.Queue[dict]] = []
+    def __init__(
+        self,
+        max_queue_size: int = MAX_QUEUE_SIZE,
+        replay_size: int = REPLAY_BUFFER_SIZE,
+        transient_types: frozenset[str] = TRANSIENT_STREAM_TYPES,
+    ) -> None:
+        self._subscribers: list[Subscription] = []
         self._max_queue_size = max_queue_size
+        self._buffer: deque[BusMessage] = deque(maxlen=replay_size)
+        self._transient_types = transient_types
+        self._seq = 0
+
+        self._published = 0
+        self._serialized = 0
+        self._replays = 0
+        # Drops of subscribers that have since gone away
+        self._dropped_closed = 0
 
-    def subscribe(self) -> asyncio.Queue[dict]:
-        """Register a new subscriber and return its queue."""
-        q: asyncio.Queue[dict] = asyncio.Queue(maxsize=self._max_queue_size)
-        self._subscribers.append(q)
-        return q
+    @property
+    def last_seq(self) -> int:
+        return self._seq
 
-    def unsubscribe(self, queue: asyncio.Queue[dict]) -> None:
-        """Remove a subscriber queue (idempotent)."""
+    def subscribe(
+        self, event_filter: EventFilter = MATCH_ALL, *, after: Optional[int] = None
+    ) -> Subscription:
+        """Register a new subscriber and return its Subscription.
+
+        With *after* (a sequence id the client already has), the buffered
+        messages newer than it that pass the filter are attached as
+        ``replay``. Registration and the buffer read happen together, so
+        replay and live delivery neither overlap nor leave a hole.
+        """
+        sub = Subscription(event_filter, self._max_queue_size)
+        if after is not None and after < self._seq:
+            self._replays += 1
+            oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+            if after < oldest - 1:
+                sub.gap_before = oldest
+            sub.replay = [
+                m for m in self._buffer if m.seq > after and event_filter.matches(m.envelope)
+            ]
+        self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        """Remove a subscriber (idempotent)."""
         try:
-            self._subscribers.remove(queue)
+            self._subscribers.remove(sub)
         except ValueError:
-            pass
+            return
+        self._dropped_closed += sub.dropped
+        if sub.dropped:
+            logger.info(
+                "event_bus.subscriber_closed matched=%d dropped=%d", sub.matched, sub.dropped
+            )
 
     def publish(self, envelope: dict) -> None:
-        """Put envelope on every subscriber queue.
+        """Queue envelope for every subscriber whose filter matches.
 
-        If a queue is full, the oldest item is dropped to make room (drop-oldest).
-        If no subscribers are registered, this is a no-op.
+        A full subscriber queue loses its oldest message, counted in that
+        subscription's ``dropped``. The envelope is stamped with ``seq`` and,
+        unless its stream type is transient, buffered for replay even when
+        nobody is subscribed; it is only JSON-encoded once some subscriber
+        (or replay) needs it.
         """
-        for q in self._subscribers:
-            if q.full():
-                try:
-                    q.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-            try:
-                q.put_nowait(envelope)
-            except asyncio.QueueFull:
-                pass
+        self._published += 1
+        self._seq = max(self._seq + 1, time.time_ns() // 1_000)
+        message = BusMessage(self._seq, {"seq": self._seq, **envelope})
+        if envelope.get("stream_type") not in self._transient_types:
+            self._buffer.append(message)
+        for sub in self._subscribers:
+            if sub.filter.matches(envelope):
+                if message._data is None:
+                    message.data  # encode once, up front, for all subscribers
+                    self._serialized += 1
+                sub._offer(message)
+
+    def snapshot(self) -> EventBusSnapshot:
+        return EventBusSnapshot(
+            subscribers=len(self._subscribers),
+            published=self._published,
+            serialized=self._serialized,
+            dropped=self._dropped_closed + sum(s.dropped for s in self._subscribers),
+            last_seq=self._seq,
+            buffered=len(self._buffer),
+            replays=self._replays,
+        )
@@ -0,0 +1,136 @@
+"""
+Admission control for LLM calls: a bounded in-flight count with priority lanes.
+
+Interactive chat, llm_decide task steps and scheduler/watcher traffic all
+share one provider. Without a bound, a backlog of background calls sits in
+the inference server's own queue and a chat reply waits behind all of it.
+AdmissionController keeps at most max_in_flight calls at the provider and
+queues the rest here, where the order can be controlled:
+
+- lanes are served strictly by priority: interactive, then task, then
+  background; FIFO within a lane
+- reserved_interactive slots are never handed to the task/background lanes,
+  so a chat message always finds a free slot within one call's latency
+
+Work already sent to the provider is never interrupted — "pre-emption" means
+a queued chat jumps every queued lower-priority call.
+
+Each admission returns an AdmissionTicket recording the lane, the queue
+depth on arrival and the time spent waiting, for the caller's audit span.
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Literal
+
+Lane = Literal["interactive", "task", "background"]
+
+_LANE_PRIORITY: dict[Lane, int] = {"interactive": 0, "task": 1, "background": 2}
+
+
+@dataclass(frozen=True)
+class AdmissionTicket:
+    lane: Lane
+    queued_ahead: int  # calls already waiting when this one arrived
+    wait_ms: int
+
+    def audit_note(self) -> str:
+        return f"[lane={self.lane} queued={self.queued_ahead} wait={self.wait_ms}ms]"
+
+
+@dataclass(frozen=True)
+class AdmissionSnapshot:
+    max_in_flight: int
+    reserved_interactive: int
+    in_flight: int
+    queued: dict[str, int]
+    admitted: dict[str, int]
+    max_wait_ms: dict[str, int]
+
+
+class AdmissionController:
+    """Priority-ordered semaphore for LLM calls."""
+
+    def __init__(self, max_in_flight: int, *, reserved_interactive: int = 0) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        self._max_in_flight = max_in_flight
+        self._reserved = min(reserved_interactive, max_in_flight - 1)
+        self._in_flight = 0
+        # (priority, seq, lane, future) — seq keeps FIFO order within a lane
+        self._waiters: list[tuple[int, int, Lane, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+
+        self._admitted: dict[str, int] = {lane: 0 for lane in _LANE_PRIORITY}
+        self._max_wait_ms: dict[str, int] = {lane: 0 for lane in _LANE_PRIORITY}
+
+    @asynccontextmanager
+    async def slot(self, lane: Lane) -> AsyncIterator[AdmissionTicket]:
+        """Hold one in-flight slot for the duration of the block."""
+        ticket = await self._acquire(lane)
+        try:
+            yield ticket
+        finally:
+            self._release()
+
+    def snapshot(self) -> AdmissionSnapshot:
+        queued = {lane: 0 for lane in _LANE_PRIORITY}
+        for _, _, lane, future in self._waiters:
+            if not future.done():
+                queued[lane] += 1
+        return AdmissionSnapshot(
+            max_in_flight=self._max_in_flight,
+            reserved_interactive=self._reserved,
+            in_flight=self._in_flight,
+            queued=queued,
+            admitted=dict(self._admitted),
+            max_wait_ms=dict(self._max_wait_ms),
+        )
+
+    def _limit(self, lane: Lane) -> int:
+        return self._max_in_flight if lane == "interactive" else self._max_in_flight - self._reserved
+
+    async def _acquire(self, lane: Lane) -> AdmissionTicket:
+        t0 = time.monotonic()
+        queued_ahead = sum(1 for *_, f in self._waiters if not f.done())
+        if queued_ahead == 0 and self._in_flight < self._limit(lane):
+            self._in_flight += 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (_LANE_PRIORITY[lane], next(self._seq), lane, future))
+            # A slot may be free for this lane even though others are queued
+            # (e.g. background waiting behind the interactive reservation)
+            self._wake()
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Granted a slot just as we were cancelled — pass it on
+                    self._release()
+                raise
+
+        wait_ms = int((time.monotonic() - t0) * 1_000)
+        self._admitted[lane] += 1
+        self._max_wait_ms[lane] = max(self._max_wait_ms[lane], wait_ms)
+        return AdmissionTicket(lane=lane, queued_ahead=queued_ahead, wait_ms=wait_ms)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            _, _, lane, future = self._waiters[0]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if self._in_flight >= self._limit(lane):
+                # Head of the queue can't run yet; nothing behind it may jump it
+                return
+            heapq.heappop(self._waiters)
+            self._in_flight += 1
+            future.set_result(None)
@@ -0,0 +1,214 @@
+"""
+Response cache for stateless LLM completions.
+
+Intent classification, step decisions and ambiguity routing send one
+complete() with no history, and their inputs repeat heavily: a schedule
+fires the same event_content every interval, watchers raise near-identical
+alarms. ResponseCache.complete() answers a repeat from cache instead of
+paying for another model round-trip.
+
+Keys are (provider, model, sha256(system prompt), user message, tool result
+context), hashed. Entries live in an in-process LRU with a TTL; with a
+PostgresResponseStore attached, misses fall through to the
+llm_response_cache table, so the cache survives restarts and is shared
+between processes. A broken store only costs a miss — cache errors never
+fail an LLM call.
+
+Only complete() is cached. Conversational chat() depends on thread history
+and tool side effects and always goes to the provider.
+"""
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..schemas.llm import LLMRequest, LLMResponse
+from ..storage.db import session_scope
+from ..storage.repos.llm_cache import LLMCacheRepo
+from .providers.base import BaseProvider
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TTL_S = 3_600.0
+_DEFAULT_MAX_ENTRIES = 1_024
+# Expired rows are purged from the store once every this many writes
+_PURGE_EVERY_PUTS = 256
+
+
+def cache_key(provider: str, model: str, request: LLMRequest) -> str:
+    """Stable key for *request* sent to *provider*/*model*."""
+    system_hash = hashlib.sha256(request.system_prompt.encode("utf-8")).hexdigest()
+    material = json.dumps(
+        [provider, model, system_hash, request.user_message, request.tool_result_context],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseStore(Protocol):
+    """Second cache tier behind the in-process LRU."""
+
+    async def get(self, key: str) -> Optional[tuple[LLMResponse, datetime]]: ...
+
+    async def put(self, key: str, response: LLMResponse, expires_at: datetime) -> None: ...
+
+
+class PostgresResponseStore:
+    """ResponseStore backed by the llm_response_cache table."""
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        self._session_maker = session_maker
+        self._puts = 0
+
+    async def get(self, key: str) -> Optional[tuple[LLMResponse, datetime]]:
+        async with session_scope(self._session_maker) as session:
+            row = await LLMCacheRepo(session).get(key)
+        if row is None:
+            return None
+        return LLMResponse.model_validate(row.response), row.expires_at
+
+    async def put(self, key: str, response: LLMResponse, expires_at: datetime) -> None:
+        self._puts += 1
+        async with session_scope(self._session_maker) as session:
+            repo = LLMCacheRepo(session)
+            await repo.put(
+                key,
+                provider=response.provider,
+                model=response.model,
+                response=response.model_dump(mode="json"),
+                expires_at=expires_at,
+            )
+            if self._puts % _PURGE_EVERY_PUTS == 0:
+                purged = await repo.delete_expired()
+                logger.debug("llm_cache.purged rows=%d", purged)
+
+
+@dataclass(frozen=True)
+class ResponseCacheSnapshot:
+    entries: int
+    hits: int
+    store_hits: int
+    misses: int
+    evictions: int
+    store_errors: int
+    ttl_s: float
+    max_entries: int
+    persistent: bool
+
+
+@dataclass
+class _Entry:
+    response: LLMResponse
+    expires_at: float  # time.monotonic() deadline
+
+
+class ResponseCache:
+    """TTL + LRU cache of LLMResponses, with an optional persistent tier."""
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float = _DEFAULT_TTL_S,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        store: Optional[ResponseStore] = None,
+    ) -> None:
+        self._ttl_s = ttl_s
+        self._max_entries = max_entries
+        self._store = store
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+        self._hits = 0
+        self._store_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._store_errors = 0
+
+    async def complete(self, provider: BaseProvider, request: LLMRequest) -> LLMResponse:
+        """provider.complete(request), answered from cache when possible.
+
+        Cache hits come back with cached=True and latency_ms=0.
+        """
+        key = cache_key(provider.name, provider.model, request)
+        cached = await self._get(key)
+        if cached is not None:
+            return cached.model_copy(update={"cached": True, "latency_ms": 0})
+
+        self._misses += 1
+        response = await provider.complete(request)
+        if response.content:
+            await self._put(key, response)
+        return response
+
+    def audit_note(self, response: LLMResponse) -> str:
+        """Short hit/miss marker with running counters, for audit summaries."""
+        outcome = "hit" if response.cached else "miss"
+        return f"[cache {outcome}, hits={self._hits + self._store_hits} misses={self._misses}]"
+
+    def snapshot(self) -> ResponseCacheSnapshot:
+        return ResponseCacheSnapshot(
+            entries=len(self._entries),
+            hits=self._hits,
+            store_hits=self._store_hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            store_errors=self._store_errors,
+            ttl_s=self._ttl_s,
+            max_entries=self._max_entries,
+            persistent=self._store is not None,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _get(self, key: str) -> Optional[LLMResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.response
+            del self._entries[key]
+
+        if self._store is None:
+            return None
+        try:
+            stored = await self._store.get(key)
+        except Exception:
+            self._store_errors += 1
+            logger.warning("llm_cache.store_get_failed", exc_info=True)
+            return None
+        if stored is None:
+            return None
+        response, expires_at = stored
+        remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        if remaining <= 0:
+            return None
+        self._remember(key, response, time.monotonic() + remaining)
+        self._store_hits += 1
+        return response
+
+    async def _put(self, key: str, response: LLMResponse) -> None:
+        self._remember(key, response, time.monotonic() + self._ttl_s)
+        if self._store is None:
+            return
+        try:
+            await self._store.put(
+                key, response, datetime.now(timezone.utc) + timedelta(seconds=self._ttl_s)
+            )
+        except Exception:
+            self._store_errors += 1
+            logger.warning("llm_cache.store_put_failed", exc_info=True)
+
+    def _remember(self, key: str, response: LLMResponse, expires_at: float) -> None:
+        self._entries[key] = _Entry(response=response, expires_at=expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
@@ -1,11 +1,15 @@
+import asyncio
 import json
 import logging
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 from uuid import UUID
 
 if TYPE_CHECKING:
     from ..tools.executor import ToolExecutor
+    from .cache import ResponseCache
     from ..tools.registry import ToolRegistry
     from .context import ContextBuilder
 
@@ -16,6 +20,7 @@ from ..schemas.llm import (
     LLMChatRequest,
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
     ToolDefinition,
     ToolCallFunction,
 )
@@ -25,13 +30,22 @@ from ..tools.executor import (
     ToolNotFoundError,
     ToolValidationError,
 )
-from .providers.base import BaseProvider, ToolRunner
+from .admission import AdmissionController, AdmissionTicket, Lane
+from .cache import cache_key
+from .providers.base import BaseProvider, LoopBudget, RoundSlot, ToolCallPolicy, ToolRunner
 
 logger = logging.getLogger(__name__)
 
 _MAX_CONTEXT_CACHE = 100
 
 
+@dataclass(frozen=True)
+class CoalescingSnapshot:
+    in_flight: int
+    leaders: int  # calls that went to the provider (or cache)
+    coalesced: int  # calls that shared a leader's in-flight request
+
+
 class LLMClient:
     """Single entry point for all LLM API calls inside SYRIS.
 
@@ -47,6 +61,11 @@ class LLMClient:
         context_builder: Optional["ContextBuilder"] = None,
         tool_executor: Optional["ToolExecutor"] = None,
         tool_registry: Optional["ToolRegistry"] = None,
+        tool_concurrency: int = 4,
+        loop_budget: Optional[LoopBudget] = None,
+        response_cache: Optional["ResponseCache"] = None,
+        admission: Optional[AdmissionController] = None,
+        interactive_sources: frozenset[str] = frozenset(),
     ) -> None:
         self._provider = provider
         self._audit = audit
@@ -54,6 +73,20 @@ class LLMClient:
         self._context_builder = context_builder
         self._tool_executor = tool_executor
         self._tool_registry = tool_registry
+        self._tool_concurrency = tool_concurrency
+        self._loop_budget = loop_budget or LoopBudget()
+        self._response_cache = response_cache
+        # Bounded in-flight calls; events from interactive_sources get the
+        # interactive lane, other events background, llm_decide steps task
+        self._admission = admission
+        self._interactive_sources = interactive_sources
+        # Single-flight: identical stateless requests share one provider call
+        # (lane, cache key) -> the leader's call; see _complete_stateless
+        self._in_flight: dict[
+            tuple[Lane, str], asyncio.Task[tuple[LLMResponse, Optional[AdmissionTicket]]]
+        ] = {}
+        self._leaders = 0
+        self._coalesced = 0
         # Bounded cache of recent context bundles for the debug endpoint
         self._last_context: OrderedDict[UUID, Any] = OrderedDict()
 
@@ -75,17 +108,7 @@ class LLMClient:
         result_context = _build_result_context(result)
 
         if self._context_builder is not None:
-            bundle = await self._context_builder.build(event)
-            messages = self._context_builder.to_messages(bundle)
-
-            if result_context:
-                last = messages[-1]
-                messages[-1] = ChatMessage(
-                    role=last.role,
-                    content=f"{last.content}\n\n[Execution: {result_context}]",
-                )
-
-            chat_request = LLMChatRequest(messages=messages)
+            chat_request, bundle = await self._conversation_request(event, result_context)
             tools_list, tool_runner_fn = self._build_tool_calling(trace_id)
 
             async with self._audit.span(
@@ -96,17 +119,22 @@ class LLMClient:
                 outcome="info",
             ) as span:
                 logger.info(
-                    "llm.conversation trace_id=%s thread_id=%s turns=%d",
+                    "llm.conversation trace_id=%s thread_id=%s turns=%d prefix=%s",
                     trace_id, event.thread_id, len(bundle.conversation_history),
+                    bundle.prefix_hash,
                 )
+                tickets: list[AdmissionTicket] = []
                 llm_response = await self._provider.chat(
                     chat_request, tools=tools_list, tool_runner=tool_runner_fn,
+                    tool_policy=self._tool_policy(), budget=self._loop_budget,
+                    round_slot=self._round_slot(self._lane_for(event), tickets),
                 )
                 span.outcome = "success"
                 span.summary = (
                     f"LLM conversation reply "
-                    f"({llm_response.tool_iterations or 0} tool rounds): "
-                    f"{llm_response.content[:80]!r}"
+                    f"({llm_response.tool_iterations or 0} tool rounds, "
+                    f"{llm_response.stop_reason}): "
+                    f"{llm_response.content[:80]!r}{_admission_note(_merge_tickets(tickets))}"
                 )
 
             self._last_context[trace_id] = bundle
@@ -130,9 +158,13 @@ class LLMClient:
                 outcome="info",
             ) as span:
                 logger.info("llm.conversation trace_id=%s", trace_id)
-                llm_response = await self._provider.complete(request)
+                async with self._admit(self._lane_for(event)) as ticket:
+                    llm_response = await self._provider.complete(request)
                 span.outcome = "success"
-                span.summary = f"LLM conversation reply: {llm_response.content[:80]!r}"
+                span.summary = (
+                    f"LLM conversation reply: {llm_response.content[:80]!r}"
+                    f"{_admission_note(ticket)}"
+                )
 
         logger.info(
             "llm.conversation trace_id=%s provider=%s model=%s latency_ms=%d",
@@ -143,10 +175,201 @@ class LLMClient:
         )
         return llm_response
 
+    async def chat_stream(
+        self,
+        event: MessageEvent,
+        result: Optional[ExecutionResult] = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Streaming variant of chat().
+
+        Yields text deltas as the provider produces them, then a final chunk
+        (done=True) whose response is the same LLMResponse chat() returns.
+        Without a context builder the single-turn prompt is sent as a
+        two-message conversation.
+        """
+        content = event.content or str(event.structured)
+        trace_id = event.trace_id
+        result_context = _build_result_context(result)
+
+        bundle = None
+        if self._context_builder is not None:
+            chat_request, bundle = await self._conversation_request(event, result_context)
+            tools_list, tool_runner_fn = self._build_tool_calling(trace_id)
+        else:
+            user_message = content
+            if result_context:
+                user_message = f"{content}\n\n[Execution: {result_context}]"
+            chat_request = LLMChatRequest(
+                messages=[
+                    ChatMessage(role="system", content=self._system_prompt),
+                    ChatMessage(role="user", content=user_message),
+                ]
+            )
+            tools_list, tool_runner_fn = None, None
+
+        llm_response: Optional[LLMResponse] = None
+        async with self._audit.span(
+            trace_id,
+            stage="llm",
+            type="llm.conversation",
+            summary=f"LLM conversation (streamed): {content[:80]!r}",
+            outcome="info",
+        ) as span:
+            logger.info(
+                "llm.conversation trace_id=%s thread_id=%s stream=true prefix=%s",
+                trace_id, event.thread_id, bundle.prefix_hash if bundle is not None else None,
+            )
+            tickets: list[AdmissionTicket] = []
+            async for chunk in self._provider.chat_stream(
+                chat_request, tools=tools_list, tool_runner=tool_runner_fn,
+                tool_policy=self._tool_policy(), budget=self._loop_budget,
+                round_slot=self._round_slot(self._lane_for(event), tickets),
+            ):
+                if chunk.response is not None:
+                    llm_response = chunk.response
+                yield chunk
+            span.outcome = "success"
+            if llm_response is not None:
+                span.summary = (
+                    f"LLM conversation reply "
+                    f"({llm_response.tool_iterations or 0} tool rounds, "
+                    f"first token {llm_response.first_token_ms}ms, "
+                    f"{llm_response.stop_reason}): "
+                    f"{llm_response.content[:80]!r}{_admission_note(_merge_tickets(tickets))}"
+                )
+
+        if bundle is not None:
+            self._last_context[trace_id] = bundle
+            if len(self._last_context) > _MAX_CONTEXT_CACHE:
+                self._last_context.popitem(last=False)
+
+        if llm_response is not None:
+            logger.info(
+                "llm.conversation trace_id=%s provider=%s model=%s "
+                "first_token_ms=%s latency_ms=%d",
+                trace_id,
+                llm_response.provider,
+                llm_response.model,
+                llm_response.first_token_ms,
+                llm_response.latency_ms,
+            )
+
+    async def _conversation_request(
+        self,
+        event: MessageEvent,
+        result_context: Optional[str],
+    ) -> tuple[LLMChatRequest, Any]:
+        """Build the multi-turn request from thread context; returns (request, bundle)."""
+        assert self._context_builder is not None
+        bundle = await self._context_builder.build(event)
+        messages = self._context_builder.to_messages(bundle)
+
+        if result_context:
+            last = messages[-1]
+            messages[-1] = ChatMessage(
+                role=last.role,
+                content=f"{last.content}\n\n[Execution: {result_context}]",
+            )
+        return LLMChatRequest(messages=messages), bundle
+
     def get_cached_context(self, trace_id: UUID) -> Any:
         """Return the cached ContextBundle for a trace_id, or None."""
         return self._last_context.get(trace_id)
 
+    def coalescing_snapshot(self) -> CoalescingSnapshot:
+        return CoalescingSnapshot(
+            in_flight=len(self._in_flight),
+            leaders=self._leaders,
+            coalesced=self._coalesced,
+        )
+
+    def _lane_for(self, event: MessageEvent) -> Lane:
+        return "interactive" if event.source in self._interactive_sources else "background"
+
+    @asynccontextmanager
+    async def _admit(self, lane: Lane) -> AsyncIterator[Optional[AdmissionTicket]]:
+        """Hold an admission slot in *lane* (no-op without a controller)."""
+        if self._admission is None:
+            yield None
+            return
+        async with self._admission.slot(lane) as ticket:
+            yield ticket
+
+    def _round_slot(self, lane: Lane, tickets: list[AdmissionTicket]) -> Optional[RoundSlot]:
+        """Admission for the tool loop, taken per provider round-trip.
+
+        Holding one slot across the whole loop would deadlock a tool that
+        calls the LLM itself once every slot is taken. Each round's ticket
+        is appended to *tickets*.
+        """
+        if self._admission is None:
+            return None
+        admission = self._admission
+
+        @asynccontextmanager
+        async def slot() -> AsyncIterator[AdmissionTicket]:
+            async with admission.slot(lane) as ticket:
+                tickets.append(ticket)
+                yield ticket
+
+        return slot
+
+    async def _complete_stateless(
+        self, request: LLMRequest, lane: Lane, *, coalesce: bool = True
+    ) -> tuple[LLMResponse, Optional[AdmissionTicket]]:
+        """complete() for history-free calls; returns (response, admission ticket).
+
+        Goes through the response cache if any. With *coalesce*, a request
+        identical to one already in flight waits for that call instead of
+        issuing its own, and gets its response back with coalesced=True (and
+        no ticket — it never took an admission slot). Only calls in the same
+        lane are coalesced, so an interactive call never waits behind a
+        background leader still queued for admission. The shared call runs
+        as its own task, so cancelling the caller that started it does not
+        fail the others.
+        """
+        if not coalesce:
+            return await self._complete_uncoalesced(request, lane)
+
+        key = (lane, cache_key(self._provider.name, self._provider.model, request))
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced += 1
+            response, _ = await asyncio.shield(task)
+            return response.model_copy(update={"coalesced": True}), None
+
+        self._leaders += 1
+        task = asyncio.create_task(
+            self._complete_uncoalesced(request, lane), name="llm_singleflight"
+        )
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _t: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _complete_uncoalesced(
+        self, request: LLMRequest, lane: Lane
+    ) -> tuple[LLMResponse, Optional[AdmissionTicket]]:
+        async with self._admit(lane) as ticket:
+            if self._response_cache is None:
+                return await self._provider.complete(request), ticket
+            return await self._response_cache.complete(self._provider, request), ticket
+
+    def _call_note(self, response: LLMResponse, ticket: Optional[AdmissionTicket]) -> str:
+        """Audit summary suffix: coalescing, cache and admission of a stateless call."""
+        note = " [coalesced]" if response.coalesced else ""
+        if self._response_cache is not None:
+            note += " " + self._response_cache.audit_note(response)
+        return note + _admission_note(ticket)
+
+    def _tool_policy(self) -> ToolCallPolicy:
+        """Concurrency for one turn's tool calls; risky tools run one at a time."""
+        serial = (
+            self._tool_registry.serial_tool_names()
+            if self._tool_registry is not None
+            else frozenset()
+        )
+        return ToolCallPolicy(max_concurrency=self._tool_concurrency, serial_tools=serial)
+
     def _build_tool_calling(
         self,
         trace_id: UUID,
@@ -199,11 +422,15 @@ class LLMClient:
         self,
         event: MessageEvent,
         known_handlers: list[str],
+        *,
+        coalesce: bool = True,
     ) -> str:
         """Classify the intent of *event* into a registered handler name.
 
         Uses a minimal routing prompt — separate from the conversational
-        response prompt. Returns 'unroutable' if no handler fits.
+        response prompt. Returns 'unroutable' if no handler fits. Identical
+        concurrent classifications share one provider call unless
+        *coalesce* is False.
         """
         handlers_list = "\n".join(f"  {h}" for h in sorted(known_handlers))
         system = (
@@ -225,12 +452,15 @@ class LLMClient:
             ref_event_id=event.event_id,
         ) as span:
             logger.info("llm.classify_intent event_id=%s", event.event_id)
-            response = await self._provider.complete(request)
+            response, ticket = await self._complete_stateless(
+                request, self._lane_for(event), coalesce=coalesce
+            )
             raw = response.content.strip().lower()
             handler = raw if raw in known_handlers else "unroutable"
             span.outcome = "success"
             span.summary = (
                 f"LLM classified intent as '{handler}' for event {event.event_id}"
+                f"{self._call_note(response, ticket)}"
             )
 
         logger.info(
@@ -247,6 +477,8 @@ class LLMClient:
         available_tools: list[str],
         context: str = "",
         tool_catalog: str = "",
+        *,
+        coalesce: bool = True,
     ) -> tuple[str, dict[str, Any]]:
         """Ask the LLM which tool to invoke next for a task step.
 
@@ -257,6 +489,9 @@ class LLMClient:
         When *tool_catalog* is provided it is used in the system prompt
         instead of a bare list of names, giving the LLM descriptions and
         arg schemas for each tool.
+
+        Identical concurrent decisions share one provider call unless
+        *coalesce* is False.
         """
         if tool_catalog:
             tools_section = tool_catalog
@@ -283,10 +518,10 @@ class LLMClient:
             outcome="info",
         ) as span:
             logger.info("llm.decide_step_tool trace_id=%s goal=%s", trace_id, goal[:80])
-            response = await self._provider.complete(request)
+            response, ticket = await self._complete_stateless(request, "task", coalesce=coalesce)
             content = response.content.strip()
             span.outcome = "success"
-            span.summary = f"LLM step decision: {content[:80]}"
+            span.summary = f"LLM step decision: {content[:80]}{self._call_note(response, ticket)}"
 
         try:
             data = json.loads(content)
@@ -305,6 +540,21 @@ class LLMClient:
         return tool_name, input_payload
 
 
+def _admission_note(ticket: Optional[AdmissionTicket]) -> str:
+    return f" {ticket.audit_note()}" if ticket is not None else ""
+
+
+def _merge_tickets(tickets: list[AdmissionTicket]) -> Optional[AdmissionTicket]:
+    """One ticket for a multi-round call: first round's queue depth, total wait."""
+    if not tickets:
+        return None
+    return AdmissionTicket(
+        lane=tickets[0].lane,
+        queued_ahead=tickets[0].queued_ahead,
+        wait_ms=sum(t.wait_ms for t in tickets),
+    )
+
+
 def _build_result_context(result: Optional[ExecutionResult]) -> str | None:
     """Return a short execution summary when the result is meaningful."""
     if result is None:
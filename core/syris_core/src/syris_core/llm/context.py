@@ -3,25 +3,56 @@
 Assembles a ContextBundle containing conversation history, system prompt,
 tool catalog, and recent audit events. The bundle is converted to a
 ChatMessage list for the provider.
+
+Every conversation request starts with the same prefix: the system prompt
+(with the tool catalog), the FALLBACK_EXAMPLES turns and the tool list. It
+only changes when a tool is registered, so it is rendered once into a
+PromptPrefix and re-sent byte-for-byte on every turn — that is what lets
+Ollama/SGLang reuse their KV cache for it. prefix_hash fingerprints exactly
+what is sent; if it changes between turns, prefix caching stopped working.
+
+After the prefix comes the conversation window: the thread's most recent
+turns, newest first, until history_token_budget (estimated tokens) is
+spent, plus the thread's rolling summary of everything older. When turns
+fall out of the window, a ThreadSummarizer folds them into that summary in
+the background, so the prompt stays bounded however long the thread runs.
 """
+import hashlib
+import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..schemas.events import MessageEvent
-from ..schemas.llm import ChatMessage
+from ..schemas.llm import ChatMessage, ToolDefinition
 from ..storage.db import session_scope
 from ..storage.models import AuditEventRow
 from ..storage.repos.events import EventRepo
+from ..storage.repos.thread_summaries import ThreadSummaryRepo
 from ..tools.registry import ToolRegistry
 from .prompts import FALLBACK_EXAMPLES, build_system_prompt
+from .providers.base import to_wire_message
+
+if TYPE_CHECKING:
+    from .summarizer import ThreadSummarizer
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_HISTORY_TOKEN_BUDGET = 3_000
+_DEFAULT_HISTORY_MAX_TURNS = 50
+# Rough per-message framing cost (role, separators) on top of the content
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars per token) — no tokenizer dependency."""
+    return len(text) // 4 + _MESSAGE_OVERHEAD_TOKENS
+
 
 class ConversationTurn(BaseModel):
     """A single turn in a conversation thread."""
@@ -42,43 +73,149 @@ class ContextBundle(BaseModel):
     current_user_message: str
     tool_catalog: str = ""
     recent_audit_events: list[dict[str, Any]] = Field(default_factory=list)
+    prefix_hash: str = ""
+    thread_summary: str = ""  # rolling summary of turns older than the window
+    history_tokens: int = 0  # estimated tokens of summary + conversation_history
+    turns_omitted: bool = False  # older turns exist beyond the window
+
+
+@dataclass(frozen=True)
+class PromptPrefix:
+    """The stable head of every conversation request, rendered once."""
+
+    registry_version: int
+    tool_catalog: str
+    system_prompt: str
+    messages: tuple[ChatMessage, ...]  # system prompt + few-shot turns
+    tools: tuple[ToolDefinition, ...]
+    prefix_hash: str
+
+
+@dataclass(frozen=True)
+class PromptPrefixSnapshot:
+    prefix_hash: str
+    registry_version: int
+    messages: int
+    tools: int
+    chars: int
+    builds: int  # stays at 1 unless tools are registered after startup
+
+
+def _hash_prefix(messages: tuple[ChatMessage, ...], tools: tuple[ToolDefinition, ...]) -> str:
+    """sha256 over the canonical wire form of the prefix (first 16 hex chars)."""
+    wire = {
+        "messages": [to_wire_message(m) for m in messages],
+        "tools": [t.model_dump() for t in tools],
+    }
+    encoded = json.dumps(wire, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
 
 
 class ContextBuilder:
     """Builds context bundles for LLM conversation calls.
 
-    Queries conversation history by thread_id, fetches the tool catalog,
-    and assembles everything into a ContextBundle that can be converted
-    to a ChatMessage list for the provider.
+    Queries conversation history by thread_id, reuses the cached
+    PromptPrefix, and assembles everything into a ContextBundle that can be
+    converted to a ChatMessage list for the provider.
     """
 
     def __init__(
         self,
         session_maker: async_sessionmaker[AsyncSession],
         tool_registry: ToolRegistry,
+        *,
+        history_token_budget: int = _DEFAULT_HISTORY_TOKEN_BUDGET,
+        history_max_turns: int = _DEFAULT_HISTORY_MAX_TURNS,
+        summarizer: Optional["ThreadSummarizer"] = None,
     ) -> None:
         self._session_maker = session_maker
         self._tool_registry = tool_registry
+        self._history_token_budget = history_token_budget
+        self._history_max_turns = history_max_turns
+        self._summarizer = summarizer
+        self._prefix: PromptPrefix | None = None
+        self._prefix_builds = 0
+
+    def prefix(self) -> PromptPrefix:
+        """The cached PromptPrefix, re-rendered only after a tool registration."""
+        prefix = self._prefix
+        if prefix is not None and prefix.registry_version == self._tool_registry.version:
+            return prefix
 
-    async def build(self, event: MessageEvent) -> ContextBundle:
-        """Assemble full context for an LLM conversation call."""
         tool_catalog = self._tool_registry.llm_tool_catalog()
         system_prompt = build_system_prompt(tool_catalog)
+        messages: list[ChatMessage] = [ChatMessage(role="system", content=system_prompt)]
+        for example in FALLBACK_EXAMPLES:
+            messages.append(ChatMessage(role="user", content=example["user"]))
+            messages.append(ChatMessage(role="assistant", content=example["assistant"]))
+        tools = tuple(self._tool_registry.llm_openai_tools())
 
-        # Fetch conversation history for this thread (excludes current event
-        # since it was just persisted by the normalizer moments ago — it will
-        # appear in the list). We filter it out to avoid duplication.
+        prefix = PromptPrefix(
+            registry_version=self._tool_registry.version,
+            tool_catalog=tool_catalog,
+            system_prompt=system_prompt,
+            messages=tuple(messages),
+            tools=tools,
+            prefix_hash=_hash_prefix(tuple(messages), tools),
+        )
+        self._prefix = prefix
+        self._prefix_builds += 1
+        logger.info(
+            "llm.prompt_prefix hash=%s tools=%d chars=%d",
+            prefix.prefix_hash, len(tools), sum(len(m.content or "") for m in messages),
+        )
+        return prefix
+
+    def prefix_snapshot(self) -> PromptPrefixSnapshot:
+        prefix = self.prefix()
+        return PromptPrefixSnapshot(
+            prefix_hash=prefix.prefix_hash,
+            registry_version=prefix.registry_version,
+            messages=len(prefix.messages),
+            tools=len(prefix.tools),
+            chars=sum(len(m.content or "") for m in prefix.messages),
+            builds=self._prefix_builds,
+        )
+
+    async def build(self, event: MessageEvent) -> ContextBundle:
+        """Assemble full context for an LLM conversation call."""
+        prefix = self.prefix()
+
+        # Fetch the newest turns of this thread before the current event (which
+        # was just persisted by the normalizer and goes into
+        # current_user_message instead). One extra row tells us whether
+        # anything older exists.
         history: list[ConversationTurn] = []
         audit_summaries: list[dict[str, Any]] = []
 
         async with session_scope(self._session_maker) as session:
             repo = EventRepo(session)
-            rows = await repo.list_by_thread(event.thread_id, limit=50)
+            rows = await repo.list_by_thread(
+                event.thread_id,
+                limit=self._history_max_turns + 1,
+                before=event.created_at,
+            )
+            summary_row = await ThreadSummaryRepo(session).get(event.thread_id)
 
-            for row in rows:
-                # Skip the current event — it goes into current_user_message
-                if row.event_id == event.event_id:
-                    continue
+            if summary_row is not None:
+                # Already folded into the summary — don't send them twice
+                covered = (summary_row.covered_through, summary_row.covered_event_id)
+                rows = [r for r in rows if (r.created_at, r.event_id) > covered]
+            turns_omitted = len(rows) > self._history_max_turns
+            rows = [
+                r for r in rows[max(len(rows) - self._history_max_turns, 0):]
+                if r.event_id != event.event_id
+            ]
+            thread_summary = summary_row.summary if summary_row is not None else ""
+
+            # Walk newest → oldest until the token budget is spent
+            used = estimate_tokens(thread_summary) if thread_summary else 0
+            for row in reversed(rows):
+                cost = estimate_tokens(row.content)
+                if used + cost > self._history_token_budget:
+                    turns_omitted = True
+                    break
+                used += cost
                 role: Literal["user", "assistant"] = (
                     "assistant" if row.source == "llm" else "user"
                 )
@@ -90,6 +227,7 @@ class ContextBuilder:
                         created_at=row.created_at,
                     )
                 )
+            history.reverse()
 
             # Fetch recent audit events for context
             from sqlalchemy import select
@@ -112,28 +250,47 @@ class ContextBuilder:
                 for r in audit_rows
             ]
 
+        if turns_omitted and self._summarizer is not None:
+            window_start = history[0].created_at if history else event.created_at
+            self._summarizer.request(event.thread_id, window_start)
+
         current_message = event.content or str(event.structured)
 
         return ContextBundle(
             trace_id=event.trace_id,
             thread_id=event.thread_id,
-            system_prompt=system_prompt,
+            system_prompt=prefix.system_prompt,
             conversation_history=history,
             current_user_message=current_message,
-            tool_catalog=tool_catalog,
+            tool_catalog=prefix.tool_catalog,
             recent_audit_events=audit_summaries,
+            prefix_hash=prefix.prefix_hash,
+            thread_summary=thread_summary,
+            history_tokens=used,
+            turns_omitted=turns_omitted,
         )
 
     def to_messages(self, bundle: ContextBundle) -> list[ChatMessage]:
         """Convert a ContextBundle into a ChatMessage list for the provider."""
-        messages: list[ChatMessage] = [
-            ChatMessage(role="system", content=bundle.system_prompt),
-        ]
+        prefix = self.prefix()
+        if bundle.prefix_hash == prefix.prefix_hash:
+            # System prompt + few-shot examples, identical on every turn
+            messages: list[ChatMessage] = list(prefix.messages)
+        else:
+            # Bundle built against an older tool set
+            messages = [ChatMessage(role="system", content=bundle.system_prompt)]
+            for example in FALLBACK_EXAMPLES:
+                messages.append(ChatMessage(role="user", content=example["user"]))
+                messages.append(ChatMessage(role="assistant", content=example["assistant"]))
 
-        # Include few-shot examples before conversation history
-        for example in FALLBACK_EXAMPLES:
-            messages.append(ChatMessage(role="user", content=example["user"]))
-            messages.append(ChatMessage(role="assistant", content=example["assistant"]))
+        # Rolling summary of turns older than the window, after the stable prefix
+        if bundle.thread_summary:
+            messages.append(
+                ChatMessage(
+                    role="system",
+                    content=f"Summary of earlier conversation in this thread:\n{bundle.thread_summary}",
+                )
+            )
 
         # Conversation history (chronological)
         for turn in bundle.conversation_history:
@@ -70,3 +70,18 @@ FALLBACK_EXAMPLES: list[dict[str, str]] = [
         ),
     },
 ]
+
+
+# System prompt for folding older conversation turns into a thread's rolling
+# summary (see llm/summarizer.py). The user message carries the previous
+# summary, if any, followed by the turns to fold in.
+THREAD_SUMMARY_PROMPT = """\
+You maintain a running summary of a conversation between a user and SYRIS,
+an automation control plane assistant.
+
+Merge the previous summary (if any) with the new turns into one updated
+summary. Keep facts the assistant may need later: user preferences, names,
+decisions, timers/schedules/rules/tasks that were created or changed, and
+open questions. Drop greetings and small talk. Write plain prose or short
+bullets, at most 200 words, with no preamble.
+"""
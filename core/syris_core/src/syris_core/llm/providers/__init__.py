@@ -2,6 +2,7 @@ from .base import BaseProvider
 from .cerebras import CerebrasProvider
 from .groq import GroqProvider
 from .ollama import OllamaProvider
+from .router import RoutingProvider
 from .sglang import SGLangProvider
 
 __all__ = [
@@ -9,5 +10,6 @@ __all__ = [
     "CerebrasProvider",
     "GroqProvider",
     "OllamaProvider",
+    "RoutingProvider",
     "SGLangProvider",
 ]
@@ -0,0 +1,114 @@
+"""Long-lived pooled httpx client shared by the HTTP-based providers.
+
+One PooledHTTPClient per provider keeps TCP/TLS connections alive between
+LLM calls instead of paying for a handshake on every request. HTTP/2 is
+negotiated via ALPN on https:// endpoints when the optional ``h2`` package
+is installed; plain http:// servers (a local Ollama) stay on keep-alive
+HTTP/1.1.
+
+Connection reuse is measured with httpcore's request trace hook: a request
+that had to open a TCP connection counts as a new connection, everything
+else rode an existing one.
+"""
+import importlib.util
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Matches the LLMSettings.http_* defaults
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+
+
+@dataclass(frozen=True)
+class HTTPPoolStats:
+    requests: int
+    connections_opened: int
+    reused: int
+    http2_requests: int
+    errors: int
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    http2: bool
+
+
+class PooledHTTPClient:
+    """httpx.AsyncClient owned by a provider for its whole lifetime."""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout_s: float,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = True,
+    ) -> None:
+        self._limits = limits or _DEFAULT_LIMITS
+        self._http2 = http2 and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("h2 not installed — %s will use HTTP/1.1 keep-alive only", base_url)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout_s,
+            limits=self._limits,
+            http2=self._http2,
+        )
+        self._requests = 0
+        self._connections_opened = 0
+        self._http2_requests = 0
+        self._errors = 0
+
+    async def post_json(self, path: str, payload: dict[str, Any]) -> httpx.Response:
+        self._requests += 1
+        try:
+            response = await self._client.post(
+                path, json=payload, extensions={"trace": self._trace}
+            )
+        except httpx.HTTPError:
+            self._errors += 1
+            raise
+        if response.http_version == "HTTP/2":
+            self._http2_requests += 1
+        return response
+
+    @asynccontextmanager
+    async def stream_json(self, path: str, payload: dict[str, Any]) -> AsyncIterator[httpx.Response]:
+        """POST *payload* and yield the response with its body still unread."""
+        self._requests += 1
+        try:
+            async with self._client.stream(
+                "POST", path, json=payload, extensions={"trace": self._trace}
+            ) as response:
+                if response.http_version == "HTTP/2":
+                    self._http2_requests += 1
+                yield response
+        except httpx.HTTPError:
+            self._errors += 1
+            raise
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def stats(self) -> HTTPPoolStats:
+        return HTTPPoolStats(
+            requests=self._requests,
+            connections_opened=self._connections_opened,
+            reused=max(self._requests - self._errors - self._connections_opened, 0),
+            http2_requests=self._http2_requests,
+            errors=self._errors,
+            max_connections=self._limits.max_connections,
+            max_keepalive_connections=self._limits.max_keepalive_connections,
+            http2=self._http2,
+        )
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._connections_opened += 1
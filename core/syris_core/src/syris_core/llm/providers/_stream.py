@@ -0,0 +1,114 @@
+"""Parsing for OpenAI-style streamed chat completions.
+
+Ollama and SGLang send ``data: {chunk}`` server-sent events over HTTP; the
+Groq and Cerebras SDKs yield chunk objects of the same shape. Both are fed
+into an OpenAIStreamAccumulator as plain dicts, which hands back each text
+delta and, at the end, the assembled ProviderTurn (tool calls arrive as
+fragments keyed by index and are stitched together here).
+"""
+import json
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+from ...schemas.llm import ToolCall, ToolCallFunction
+from ._http import PooledHTTPClient
+from .base import ProviderTurn, StreamItem
+
+
+class OpenAIStreamAccumulator:
+    """Collects streamed chunks into a single assistant turn."""
+
+    def __init__(self, default_model: str) -> None:
+        self._model = default_model
+        self._content: list[str] = []
+        self._thinking: list[str] = []
+        self._tool_calls: dict[int, dict[str, str]] = {}
+        self._usage: dict[str, Any] = {}
+
+    def feed(self, chunk: dict[str, Any]) -> Optional[str]:
+        """Absorb one chunk; return its text delta, if any."""
+        if chunk.get("model"):
+            self._model = chunk["model"]
+        # Groq reports usage under x_groq on the last chunk
+        usage = chunk.get("usage") or (chunk.get("x_groq") or {}).get("usage")
+        if usage:
+            self._usage = usage
+
+        choices = chunk.get("choices") or []
+        if not choices:
+            return None
+        delta = choices[0].get("delta") or {}
+
+        reasoning = delta.get("reasoning") or delta.get("reasoning_content")
+        if reasoning:
+            self._thinking.append(reasoning)
+
+        for fragment in delta.get("tool_calls") or []:
+            slot = self._tool_calls.setdefault(
+                fragment.get("index", 0), {"id": "", "name": "", "arguments": ""}
+            )
+            if fragment.get("id"):
+                slot["id"] = fragment["id"]
+            function = fragment.get("function") or {}
+            if function.get("name"):
+                slot["name"] = function["name"]
+            if function.get("arguments"):
+                slot["arguments"] += function["arguments"]
+
+        text = delta.get("content")
+        if text:
+            self._content.append(text)
+            return text
+        return None
+
+    def turn(self) -> ProviderTurn:
+        tool_calls = [
+            ToolCall(
+                id=slot["id"] or f"call_{index}",
+                function=ToolCallFunction(name=slot["name"], arguments=slot["arguments"]),
+            )
+            for index, slot in sorted(self._tool_calls.items())
+        ]
+        return ProviderTurn(
+            content="".join(self._content) if self._content else None,
+            tool_calls=tool_calls or None,
+            model=self._model,
+            prompt_tokens=self._usage.get("prompt_tokens"),
+            completion_tokens=self._usage.get("completion_tokens"),
+            thinking="".join(self._thinking) if self._thinking else None,
+        )
+
+
+async def iter_sse_json(response: httpx.Response) -> AsyncIterator[dict[str, Any]]:
+    """Decode the ``data:`` lines of an SSE response.
+
+    Reads past the ``[DONE]`` sentinel to the end of the body — a response
+    closed with unread bytes can't go back to the connection pool.
+    """
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data and data != "[DONE]":
+            yield json.loads(data)
+
+
+async def stream_openai_turn(
+    http: PooledHTTPClient,
+    path: str,
+    payload: dict[str, Any],
+    default_model: str,
+) -> AsyncIterator[StreamItem]:
+    """POST a ``stream: true`` chat completion and relay it as StreamItems."""
+    payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+    accumulator = OpenAIStreamAccumulator(default_model)
+    async with http.stream_json(path, payload) as response:
+        if response.is_error:
+            await response.aread()
+            response.raise_for_status()
+        async for chunk in iter_sse_json(response):
+            delta = accumulator.feed(chunk)
+            if delta:
+                yield delta
+    yield accumulator.turn()
@@ -1,28 +1,235 @@
+import asyncio
+import json
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable
+from contextlib import aclosing, nullcontext
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Literal,
+    Optional,
+    Union,
+)
 
 from ...schemas.llm import (
+    ChatMessage,
     LLMChatRequest,
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
+    ToolCall,
     ToolDefinition,
 )
+from ._http import HTTPPoolStats
+
+logger = logging.getLogger(__name__)
+
+MAX_TOOL_ITERATIONS = 10
 
 # Closure that dispatches a model-requested tool call. Built per-request
 # by LLMClient so it can capture trace_id and wrap ToolExecutor.
 ToolRunner = Callable[[str, dict[str, Any], str], Awaitable[str]]
 
+# Entered around each provider round-trip of the tool loop, but not the tool
+# calls in between (LLMClient uses it to hold an admission slot per round)
+RoundSlot = Callable[[], AsyncContextManager[Any]]
+
+
+@dataclass(frozen=True)
+class ToolCallPolicy:
+    """How the tool calls of one assistant turn are dispatched.
+
+    Calls run concurrently, at most max_concurrency at a time. A call to a
+    tool in serial_tools (non-idempotent or high risk) is a barrier: it
+    starts only after every earlier call has finished and runs alone.
+    """
+
+    max_concurrency: int = 4
+    serial_tools: frozenset[str] = frozenset()
+
+
+async def run_tool_calls(
+    tool_calls: list[ToolCall],
+    tool_runner: ToolRunner,
+    policy: Optional[ToolCallPolicy] = None,
+) -> list[str]:
+    """Run one turn's tool calls; results come back in tool_call order."""
+    policy = policy or ToolCallPolicy()
+    results: list[str] = [""] * len(tool_calls)
+    semaphore = asyncio.Semaphore(max(policy.max_concurrency, 1))
+
+    async def run(index: int, tc: ToolCall) -> None:
+        async with semaphore:
+            results[index] = await _invoke_tool(tc, tool_runner)
+
+    async def drain(batch: list[Awaitable[None]]) -> None:
+        outcomes = await asyncio.gather(*batch, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+    batch: list[Awaitable[None]] = []
+    for index, tc in enumerate(tool_calls):
+        if tc.function.name in policy.serial_tools:
+            if batch:
+                await drain(batch)
+                batch = []
+            results[index] = await _invoke_tool(tc, tool_runner)
+        else:
+            batch.append(run(index, tc))
+    if batch:
+        await drain(batch)
+    return results
+
+
+async def _invoke_tool(tc: ToolCall, tool_runner: ToolRunner) -> str:
+    raw_args = tc.function.arguments
+    try:
+        args = json.loads(raw_args) if raw_args else {}
+    except json.JSONDecodeError as exc:
+        return json.dumps({"error": "invalid_arguments_json", "message": str(exc)})
+    return await tool_runner(tc.function.name, args, tc.id)
+
+
+@dataclass(frozen=True)
+class ProviderTurn:
+    """One finished assistant turn from a single provider round-trip."""
+
+    content: Optional[str]
+    tool_calls: Optional[list[ToolCall]]
+    model: str
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    thinking: Optional[str] = None
+    # Backend that served the turn, when it differs from the provider (RoutingProvider)
+    provider: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class LoopBudget:
+    """Limits for one chat() tool-calling loop.
+
+    The loop stops before starting another round once any limit is hit:
+    max_iterations rounds, max_total_tokens cumulative prompt+completion
+    tokens, or max_wall_s seconds since the first request.
+    """
+
+    max_iterations: int = MAX_TOOL_ITERATIONS
+    max_total_tokens: Optional[int] = None
+    max_wall_s: Optional[float] = None
+
+
+StopReason = Literal["complete", "max_iterations", "token_budget", "time_budget"]
+
+_STOP_MESSAGES: dict[str, str] = {
+    "max_iterations": "[LLM exceeded max tool-calling iterations]",
+    "token_budget": "[LLM stopped: token budget exhausted]",
+    "time_budget": "[LLM stopped: time budget exhausted]",
+}
+
+
+# _stream_turn() yields text deltas, then exactly one ProviderTurn
+StreamItem = Union[str, ProviderTurn]
+
+
+def to_wire_message(msg: ChatMessage) -> dict[str, Any]:
+    """Serialize a ChatMessage into the OpenAI-compatible wire dict."""
+    if msg.role == "assistant":
+        out: dict[str, Any] = {"role": "assistant", "content": msg.content}
+        if msg.tool_calls:
+            out["tool_calls"] = [tc.model_dump() for tc in msg.tool_calls]
+        return out
+    if msg.role == "tool":
+        return {"role": "tool", "tool_call_id": msg.tool_call_id, "content": msg.content}
+    return {"role": msg.role, "content": msg.content}
+
 
 class BaseProvider(ABC):
     """Abstract base for LLM provider implementations.
 
     Each provider targets a specific runtime (SGLang, Ollama, etc.) but
     exposes the same methods so LLMClient stays provider-agnostic.
+
+    A provider implements one round-trip — _turn(), and optionally the
+    streamed _stream_turn() — over OpenAI wire-shaped messages. Everything
+    above that lives here once: complete(), the multi-turn tool-calling loop
+    behind chat() / chat_stream(), concurrent tool dispatch, per-iteration
+    timing, cumulative token usage and the LoopBudget early exit.
     """
 
+    name: str = "base"
+    # False for providers that cannot send tools (e.g. SGLang)
+    supports_tools: bool = True
+
+    @property
+    def model(self) -> str:
+        """Configured model name (responses may report a more specific one)."""
+        return getattr(self, "_model", "")
+
+    async def aclose(self) -> None:
+        """Release network resources; called once on shutdown."""
+
+    def http_stats(self) -> Optional[HTTPPoolStats]:
+        """Connection pool counters, for providers that own an HTTP pool."""
+        return None
+
     @abstractmethod
+    async def _turn(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> ProviderTurn:
+        """One round-trip: send *messages* (and *tools*) and return the reply.
+
+        *messages* and *tools* are already in OpenAI wire shape.
+        """
+
+    async def _stream_turn(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> AsyncIterator[StreamItem]:
+        """One streamed round-trip: yield text deltas, then a ProviderTurn.
+
+        The default runs _turn() and yields its content as a single delta;
+        providers with a native streaming API override this.
+        """
+        turn = await self._turn(messages, tools)
+        if turn.content:
+            yield turn.content
+        yield turn
+
     async def complete(self, request: LLMRequest) -> LLMResponse:
         """Send *request* to the provider and return a typed response."""
+        messages: list[dict[str, Any]] = [
+            {"role": "system", "content": request.system_prompt},
+            {"role": "user", "content": request.user_message},
+        ]
+        if request.tool_result_context is not None:
+            messages.append(
+                {"role": "user", "content": f"[Tool result] {request.tool_result_context}"}
+            )
+
+        t0 = time.monotonic()
+        turn = await self._turn(messages, None)
+        latency_ms = int((time.monotonic() - t0) * 1_000)
+
+        logger.debug("%s.complete model=%s latency_ms=%d", self.name, turn.model, latency_ms)
+
+        return LLMResponse(
+            content=turn.content or "",
+            model=turn.model,
+            provider=turn.provider or self.name,
+            latency_ms=latency_ms,
+            prompt_tokens=turn.prompt_tokens,
+            completion_tokens=turn.completion_tokens,
+            thinking=turn.thinking,
+        )
 
     async def chat(
         self,
@@ -30,22 +237,170 @@ class BaseProvider(ABC):
         *,
         tools: list[ToolDefinition] | None = None,
         tool_runner: ToolRunner | None = None,
+        tool_policy: ToolCallPolicy | None = None,
+        budget: LoopBudget | None = None,
+        round_slot: RoundSlot | None = None,
     ) -> LLMResponse:
-        """Multi-turn chat completion.
+        """Multi-turn chat completion with optional tool-calling loop.
 
-        Default implementation extracts the system prompt and last user
-        message and delegates to complete() for backward compatibility.
-        Providers should override this for native multi-turn support
-        and tool calling. The base implementation ignores *tools* and
-        *tool_runner*.
+        When *tools* and *tool_runner* are both provided, runs the loop:
+        send history → if the assistant emits tool_calls, execute them via
+        *tool_runner* (see run_tool_calls), append assistant + tool messages
+        to history, repeat — until a turn comes back without tool_calls or
+        *budget* runs out. The final assistant turn is returned.
+
+        *round_slot*, if given, is held around each round-trip only, so a
+        tool that itself calls the LLM never waits on its caller's slot.
         """
-        system_prompt = ""
-        user_message = ""
-        for msg in request.messages:
-            if msg.role == "system" and msg.content is not None:
-                system_prompt = msg.content
-            elif msg.role == "user" and msg.content is not None:
-                user_message = msg.content
-        return await self.complete(
-            LLMRequest(system_prompt=system_prompt, user_message=user_message)
+        response: Optional[LLMResponse] = None
+        async for chunk in self._loop(
+            request, tools, tool_runner, tool_policy, budget, round_slot, stream=False
+        ):
+            if chunk.response is not None:
+                response = chunk.response
+        assert response is not None
+        return response
+
+    async def chat_stream(
+        self,
+        request: LLMChatRequest,
+        *,
+        tools: list[ToolDefinition] | None = None,
+        tool_runner: ToolRunner | None = None,
+        tool_policy: ToolCallPolicy | None = None,
+        budget: LoopBudget | None = None,
+        round_slot: RoundSlot | None = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Streaming chat(): yields text deltas as they arrive, then one
+        final chunk (done=True) carrying the complete LLMResponse.
+
+        Deltas from every round are forwarded, including text the model
+        emits before deciding to call tools; chunk.iteration tells rounds
+        apart. The final response holds only the last round's content, as
+        chat() does.
+        """
+        # aclosing: a consumer that stops early closes the whole chain now,
+        # not whenever the abandoned generators are collected
+        async with aclosing(self._loop(
+            request, tools, tool_runner, tool_policy, budget, round_slot, stream=True
+        )) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def _loop(
+        self,
+        request: LLMChatRequest,
+        tools: list[ToolDefinition] | None,
+        tool_runner: ToolRunner | None,
+        tool_policy: ToolCallPolicy | None,
+        budget: LoopBudget | None,
+        round_slot: RoundSlot | None,
+        *,
+        stream: bool,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        budget = budget or LoopBudget()
+        history: list[ChatMessage] = list(request.messages)
+        tool_calling_enabled = (
+            self.supports_tools and tools is not None and tool_runner is not None
         )
+        wire_tools = [t.model_dump() for t in tools] if tool_calling_enabled else None  # type: ignore[union-attr]
+
+        t0 = time.monotonic()
+        first_token_ms: Optional[int] = None
+        iteration_ms: list[int] = []
+        prompt_tokens: Optional[int] = None
+        completion_tokens: Optional[int] = None
+        turn: Optional[ProviderTurn] = None
+        stop_reason: StopReason = "max_iterations"
+        iteration = 0
+
+        while iteration < max(budget.max_iterations, 1):
+            iteration += 1
+            wire_messages = [to_wire_message(m) for m in history]
+            round_t0 = time.monotonic()
+            async with round_slot() if round_slot is not None else nullcontext():
+                if stream:
+                    turn = None
+                    async with aclosing(self._stream_turn(wire_messages, wire_tools)) as items:
+                        async for item in items:
+                            if isinstance(item, ProviderTurn):
+                                turn = item
+                                continue
+                            if first_token_ms is None:
+                                first_token_ms = int((time.monotonic() - t0) * 1_000)
+                            yield LLMStreamChunk(delta=item, iteration=iteration)
+                    assert turn is not None, "_stream_turn must end with a ProviderTurn"
+                else:
+                    turn = await self._turn(wire_messages, wire_tools)
+            iteration_ms.append(int((time.monotonic() - round_t0) * 1_000))
+            prompt_tokens = _add_tokens(prompt_tokens, turn.prompt_tokens)
+            completion_tokens = _add_tokens(completion_tokens, turn.completion_tokens)
+
+            history.append(
+                ChatMessage(role="assistant", content=turn.content, tool_calls=turn.tool_calls)
+            )
+            if not turn.tool_calls or not tool_calling_enabled:
+                stop_reason = "complete"
+                break
+
+            # The model wants another round — stop here if the budget is spent
+            if iteration >= budget.max_iterations:
+                break
+            if budget.max_total_tokens is not None and (
+                (prompt_tokens or 0) + (completion_tokens or 0) >= budget.max_total_tokens
+            ):
+                stop_reason = "token_budget"
+                break
+            if budget.max_wall_s is not None and time.monotonic() - t0 >= budget.max_wall_s:
+                stop_reason = "time_budget"
+                break
+
+            assert tool_runner is not None  # narrowed by tool_calling_enabled
+            results = await run_tool_calls(turn.tool_calls, tool_runner, tool_policy)
+            for tc, result_str in zip(turn.tool_calls, results):
+                history.append(
+                    ChatMessage(role="tool", tool_call_id=tc.id, content=result_str)
+                )
+
+        assert turn is not None
+        if stop_reason == "complete":
+            content = turn.content or ""
+            logger.debug(
+                "%s.chat model=%s iterations=%d latency_ms=%d first_token_ms=%s",
+                self.name, turn.model, iteration, sum(iteration_ms), first_token_ms,
+            )
+        else:
+            content = _STOP_MESSAGES[stop_reason]
+            logger.warning(
+                "%s.chat stopped early model=%s reason=%s iterations=%d tokens=%s elapsed_ms=%d",
+                self.name,
+                turn.model,
+                stop_reason,
+                iteration,
+                (prompt_tokens or 0) + (completion_tokens or 0),
+                int((time.monotonic() - t0) * 1_000),
+            )
+
+        yield LLMStreamChunk(
+            done=True,
+            iteration=iteration,
+            response=LLMResponse(
+                content=content,
+                model=turn.model,
+                provider=turn.provider or self.name,
+                latency_ms=sum(iteration_ms),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                tool_iterations=iteration,
+                thinking=turn.thinking,
+                first_token_ms=first_token_ms,
+                iteration_latency_ms=iteration_ms,
+                stop_reason=stop_reason,
+            ),
+        )
+
+
+def _add_tokens(total: Optional[int], value: Optional[int]) -> Optional[int]:
+    if value is None:
+        return total
+    return (total or 0) + value
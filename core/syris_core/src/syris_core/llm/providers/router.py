@@ -0,0 +1,335 @@
+"""Composite provider that routes each round-trip across several backends.
+
+RoutingProvider is a BaseProvider holding several configured providers
+(e.g. a local Ollama, an SGLang box and Groq). It only implements the
+single round-trip — _turn() / _stream_turn() — so the shared tool loop,
+complete(), caching and streaming in BaseProvider work unchanged on top.
+
+Per backend it keeps a rolling window of round-trip latencies and outcomes:
+
+- Routing: healthy backends are ranked by p50 latency, inflated by the
+  recent error rate. Backends with no samples yet rank first so they get
+  measured. When tools are sent, backends that support tool calling are
+  preferred.
+- Failover: a failed round-trip moves on to the next backend in rank order.
+  Streams only fail over until their first delta; after that an error is
+  the caller's.
+- Hedging: with hedge_after_ms set, a non-streamed round-trip still running
+  after that long is raced against the next-ranked backend; the first
+  success wins and the loser is cancelled.
+- Circuit breaker: failure_threshold consecutive failures open a backend's
+  breaker for open_s seconds. It then goes half-open and admits a single
+  probe request: success closes it, failure re-opens it. If every breaker
+  is open, the backend that opened first is tried anyway rather than
+  failing outright.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Iterator, Literal, Optional, Sequence
+
+from .base import BaseProvider, ProviderTurn, StreamItem
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+_DEFAULT_WINDOW = 100
+_DEFAULT_FAILURE_THRESHOLD = 3
+_DEFAULT_OPEN_S = 30.0
+# Weight of the recent error rate in the routing score
+_ERROR_PENALTY = 4.0
+
+
+@dataclass(frozen=True)
+class BackendSnapshot:
+    name: str
+    model: str
+    state: CircuitState
+    requests: int
+    errors: int
+    error_rate: float
+    p50_ms: Optional[int]
+    p95_ms: Optional[int]
+    hedges_started: int
+    hedges_won: int
+    consecutive_failures: int
+
+
+class _Backend:
+    """Rolling stats and breaker state for one wrapped provider."""
+
+    def __init__(self, provider: BaseProvider, window: int) -> None:
+        self.provider = provider
+        self.latencies_ms: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.state: CircuitState = "closed"
+        self.opened_at = 0.0
+        self.probing = False
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.errors = 0
+        self.hedges_started = 0
+        self.hedges_won = 0
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def label(self) -> str:
+        return f"{self.provider.name}:{self.provider.model}"
+
+    def available(self, now: float, open_s: float) -> bool:
+        if self.state == "open" and now - self.opened_at >= open_s:
+            self.state = "half_open"
+            self.probing = False
+        if self.state == "half_open":
+            return not self.probing
+        return self.state == "closed"
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies_ms:
+            return None
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def score(self) -> float:
+        p50 = self.percentile(0.5) or 0.0
+        return p50 * (1.0 + _ERROR_PENALTY * self.error_rate())
+
+    def begin(self, *, force: bool = False) -> bool:
+        """Claim this backend for one round-trip.
+
+        False if it is half-open and its single probe is already out (unless
+        *force*). Check and claim happen together, so two requests can't
+        both take the probe.
+        """
+        if self.state == "half_open":
+            if self.probing and not force:
+                return False
+            self.probing = True
+        self.requests += 1
+        return True
+
+    def record_success(self, latency_ms: float) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+        if self.state != "closed":
+            logger.info("llm_router.breaker_closed backend=%s", self.label)
+        self.state = "closed"
+        self.probing = False
+
+    def record_cancelled(self, elapsed_ms: float) -> None:
+        # A lower bound on its latency; keeps a backend that always loses
+        # hedge races from looking unmeasured (and so ranking first)
+        self.latencies_ms.append(elapsed_ms)
+        self.probing = False
+
+    def record_failure(self, threshold: int) -> None:
+        self.outcomes.append(False)
+        self.errors += 1
+        self.consecutive_failures += 1
+        self.probing = False
+        if self.state == "half_open" or self.consecutive_failures >= threshold:
+            if self.state != "open":
+                logger.warning(
+                    "llm_router.breaker_opened backend=%s consecutive_failures=%d",
+                    self.label, self.consecutive_failures,
+                )
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> BackendSnapshot:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return BackendSnapshot(
+            name=self.label,
+            model=self.provider.model,
+            state=self.state,
+            requests=self.requests,
+            errors=self.errors,
+            error_rate=round(self.error_rate(), 3),
+            p50_ms=int(p50) if p50 is not None else None,
+            p95_ms=int(p95) if p95 is not None else None,
+            hedges_started=self.hedges_started,
+            hedges_won=self.hedges_won,
+            consecutive_failures=self.consecutive_failures,
+        )
+
+
+class RoutingProvider(BaseProvider):
+    """Latency-aware failover, hedging and circuit breaking over several providers."""
+
+    name = "router"
+
+    def __init__(
+        self,
+        backends: Sequence[BaseProvider],
+        *,
+        hedge_after_ms: Optional[int] = None,
+        failure_threshold: int = _DEFAULT_FAILURE_THRESHOLD,
+        open_s: float = _DEFAULT_OPEN_S,
+        window: int = _DEFAULT_WINDOW,
+    ) -> None:
+        if not backends:
+            raise ValueError("RoutingProvider needs at least one backend")
+        self._backends = [_Backend(p, window) for p in backends]
+        self._hedge_after_s = hedge_after_ms / 1_000 if hedge_after_ms else None
+        self._failure_threshold = failure_threshold
+        self._open_s = open_s
+        self.supports_tools = any(p.supports_tools for p in backends)
+
+    @property
+    def model(self) -> str:
+        return "+".join(b.label for b in self._backends)
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(b.provider.aclose() for b in self._backends))
+
+    def backend_snapshots(self) -> list[BackendSnapshot]:
+        return [b.snapshot() for b in self._backends]
+
+    def _candidates(self, tools: list[dict[str, Any]] | None) -> Iterator[_Backend]:
+        """Backends to try, best first, each claimed (begin()) as it is handed out."""
+        now = time.monotonic()
+        healthy = [b for b in self._backends if b.available(now, self._open_s)]
+        healthy.sort(key=lambda b: (bool(tools) and not b.provider.supports_tools, b.score()))
+        claimed = False
+        for backend in healthy:
+            # A half-open backend may have had its probe taken since ranking
+            if backend.begin():
+                claimed = True
+                yield backend
+        if not claimed:
+            # Everything is tripped: try the longest-open breaker instead of failing
+            fallback = min(self._backends, key=lambda b: b.opened_at)
+            fallback.begin(force=True)
+            yield fallback
+
+    async def _call(
+        self,
+        backend: _Backend,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> ProviderTurn:
+        t0 = time.monotonic()
+        try:
+            turn = await backend.provider._turn(
+                messages, tools if backend.provider.supports_tools else None
+            )
+        except asyncio.CancelledError:
+            # Lost a hedge race — not a failure, but it was at least this slow
+            backend.record_cancelled((time.monotonic() - t0) * 1_000)
+            raise
+        except Exception as exc:
+            backend.record_failure(self._failure_threshold)
+            logger.warning("llm_router.backend_failed backend=%s error=%r", backend.label, exc)
+            raise
+        backend.record_success((time.monotonic() - t0) * 1_000)
+        return replace(turn, provider=turn.provider or backend.name)
+
+    async def _turn(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> ProviderTurn:
+        candidates = self._candidates(tools)
+        running: dict[asyncio.Task[ProviderTurn], _Backend] = {}
+        hedged = False
+        hedge_task: Optional[asyncio.Task[ProviderTurn]] = None
+        last_exc: Optional[BaseException] = None
+
+        def launch(backend: _Backend) -> asyncio.Task[ProviderTurn]:
+            task = asyncio.create_task(
+                self._call(backend, messages, tools), name=f"llm_router_{backend.label}"
+            )
+            running[task] = backend
+            return task
+
+        launch(next(candidates))
+        try:
+            while running:
+                timeout = self._hedge_after_s if not hedged else None
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Primary is slow: race the next-ranked backend against it
+                    hedged = True
+                    backup = next(candidates, None)
+                    if backup is not None:
+                        backup.hedges_started += 1
+                        hedge_task = launch(backup)
+                    continue
+
+                for task in done:
+                    backend = running.pop(task)
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            backend.hedges_won += 1
+                        return task.result()
+                    last_exc = task.exception()
+
+                if not running:
+                    # Every in-flight attempt failed: fail over to the next backend
+                    backup = next(candidates, None)
+                    if backup is not None:
+                        launch(backup)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        assert last_exc is not None
+        raise last_exc
+
+    async def _stream_turn(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> AsyncIterator[StreamItem]:
+        last_exc: Optional[Exception] = None
+        for backend in self._candidates(tools):
+            t0 = time.monotonic()
+            started = False
+            settled = False
+            try:
+                async with aclosing(backend.provider._stream_turn(
+                    messages, tools if backend.provider.supports_tools else None
+                )) as items:
+                    async for item in items:
+                        if isinstance(item, ProviderTurn):
+                            item = replace(item, provider=item.provider or backend.name)
+                        started = True
+                        yield item
+                settled = True
+                backend.record_success((time.monotonic() - t0) * 1_000)
+                return
+            except Exception as exc:
+                settled = True
+                backend.record_failure(self._failure_threshold)
+                if started:
+                    raise
+                logger.warning(
+                    "llm_router.backend_failed backend=%s stream=true error=%r", backend.label, exc
+                )
+                last_exc = exc
+            finally:
+                if not settled:
+                    # Cancelled, or the consumer closed the stream early: not
+                    # a failure, but release a half-open probe claim
+                    backend.record_cancelled((time.monotonic() - t0) * 1_000)
+
+        assert last_exc is not None
+        raise last_exc
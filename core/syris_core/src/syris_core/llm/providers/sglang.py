@@ -1,11 +1,11 @@
 import logging
-import time
-from typing import Any
+from typing import Any, AsyncIterator
 
 import httpx
 
-from ...schemas.llm import LLMChatRequest, LLMRequest, LLMResponse, ToolDefinition
-from .base import BaseProvider, ToolRunner
+from ._http import HTTPPoolStats, PooledHTTPClient
+from ._stream import stream_openai_turn
+from .base import BaseProvider, ProviderTurn, StreamItem
 
 logger = logging.getLogger(__name__)
 
@@ -19,87 +19,57 @@ class SGLangProvider(BaseProvider):
     shape as the OpenAI API, so no extra translation is needed.
     """
 
-    def __init__(self, base_url: str, model: str, timeout_s: int = 30) -> None:
+    name = "sglang"
+    supports_tools = False
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        timeout_s: int = 30,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool = True,
+    ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._timeout_s = timeout_s
+        self._http = PooledHTTPClient(self._base_url, timeout_s, limits=limits, http2=http2)
 
-    async def complete(self, request: LLMRequest) -> LLMResponse:
-        messages: list[dict[str, str]] = [
-            {"role": "system", "content": request.system_prompt},
-            {"role": "user", "content": request.user_message},
-        ]
-        if request.tool_result_context is not None:
-            messages.append(
-                {"role": "user", "content": f"[Tool result] {request.tool_result_context}"}
-            )
-
-        payload: dict[str, Any] = {"model": self._model, "messages": messages}
-
-        t0 = time.monotonic()
-        async with httpx.AsyncClient(timeout=self._timeout_s) as client:
-            response = await client.post(
-                f"{self._base_url}{_CHAT_PATH}", json=payload
-            )
-        latency_ms = int((time.monotonic() - t0) * 1_000)
-
-        response.raise_for_status()
-        data = response.json()
-
-        content: str = data["choices"][0]["message"]["content"]
-        usage: dict[str, Any] = data.get("usage", {})
-
-        logger.debug(
-            "sglang.complete model=%s latency_ms=%d", self._model, latency_ms
-        )
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
-        return LLMResponse(
-            content=content,
-            model=data.get("model", self._model),
-            provider="sglang",
-            latency_ms=latency_ms,
-            prompt_tokens=usage.get("prompt_tokens"),
-            completion_tokens=usage.get("completion_tokens"),
-        )
+    def http_stats(self) -> HTTPPoolStats:
+        return self._http.stats()
 
-    async def chat(
+    async def _stream_turn(
         self,
-        request: LLMChatRequest,
-        *,
-        tools: list[ToolDefinition] | None = None,
-        tool_runner: ToolRunner | None = None,
-    ) -> LLMResponse:
-        """Multi-turn chat completion with full message history.
-
-        Tool calling is not yet implemented for SGLang — *tools* and
-        *tool_runner* are accepted for interface parity but ignored.
-        """
-        messages = [{"role": m.role, "content": m.content} for m in request.messages]
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> AsyncIterator[StreamItem]:
         payload: dict[str, Any] = {"model": self._model, "messages": messages}
+        if tools:
+            payload["tools"] = tools
+        async for item in stream_openai_turn(self._http, _CHAT_PATH, payload, self._model):
+            yield item
 
-        t0 = time.monotonic()
-        async with httpx.AsyncClient(timeout=self._timeout_s) as client:
-            response = await client.post(
-                f"{self._base_url}{_CHAT_PATH}", json=payload
-            )
-        latency_ms = int((time.monotonic() - t0) * 1_000)
+    async def _turn(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> ProviderTurn:
+        # Tool calling is not yet implemented for SGLang (supports_tools is
+        # False, so the loop never passes tools)
+        payload: dict[str, Any] = {"model": self._model, "messages": messages}
 
+        response = await self._http.post_json(_CHAT_PATH, payload)
         response.raise_for_status()
         data = response.json()
 
-        content: str = data["choices"][0]["message"]["content"]
         usage: dict[str, Any] = data.get("usage", {})
-
-        logger.debug(
-            "sglang.chat model=%s latency_ms=%d turns=%d",
-            self._model, latency_ms, len(messages),
-        )
-
-        return LLMResponse(
-            content=content,
+        return ProviderTurn(
+            content=data["choices"][0]["message"]["content"],
             model=data.get("model", self._model),
-            provider="sglang",
-            latency_ms=latency_ms,
             prompt_tokens=usage.get("prompt_tokens"),
             completion_tokens=usage.get("completion_tokens"),
         )
@@ -0,0 +1,191 @@
+"""
+Background rolling summaries of conversation threads.
+
+ContextBuilder only sends a thread's most recent turns that fit its token
+budget. Turns that fall out of that window are folded into one persisted
+summary per thread (thread_summaries) so the LLM keeps the gist of a long
+conversation while the prompt stays bounded.
+
+Folding costs an LLM call, so it never runs on the request path:
+ContextBuilder calls request() — a non-blocking enqueue, coalesced per
+thread — and a single background worker does the folding. Each pass reads
+up to fold_batch unsummarized turns older than the window, merges them into
+the previous summary with one provider.complete() call, and advances
+covered_through. A thread far behind is caught up in several passes.
+With an AdmissionController, each fold call takes a background-lane slot
+like any other non-interactive LLM call.
+"""
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..schemas.llm import LLMRequest, LLMResponse
+from ..storage.db import session_scope
+from ..storage.repos.events import EventRepo
+from ..storage.repos.thread_summaries import ThreadSummaryRepo
+from .admission import AdmissionController
+from .prompts import THREAD_SUMMARY_PROMPT
+from .providers.base import BaseProvider
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_FOLD_BATCH = 100
+_DEFAULT_MAX_PENDING = 256
+# Per-turn cap in the fold transcript; summaries don't need whole payloads
+_MAX_TURN_CHARS = 2_000
+
+
+@dataclass(frozen=True)
+class SummarizerSnapshot:
+    pending: int
+    refreshes: int
+    turns_folded: int
+    errors: int
+    dropped: int
+
+
+class ThreadSummarizer:
+    """Folds turns that left the context window into thread_summaries."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        provider: BaseProvider,
+        *,
+        fold_batch: int = _DEFAULT_FOLD_BATCH,
+        max_pending: int = _DEFAULT_MAX_PENDING,
+        admission: Optional[AdmissionController] = None,
+    ) -> None:
+        self._session_maker = session_maker
+        self._provider = provider
+        self._admission = admission
+        self._fold_batch = fold_batch
+        self._max_pending = max_pending
+
+        # thread_id -> newest window start requested; the queue holds each id once
+        self._pending: dict[uuid.UUID, datetime] = {}
+        self._queue: asyncio.Queue[uuid.UUID | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+        self._refreshes = 0
+        self._turns_folded = 0
+        self._errors = 0
+        self._dropped = 0
+
+    async def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name="thread_summarizer")
+        logger.info("ThreadSummarizer started (fold_batch=%d)", self._fold_batch)
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        # Pending folds are dropped; the next turn in the thread re-requests them
+        self._pending.clear()
+        self._queue.put_nowait(None)
+        try:
+            await asyncio.wait_for(self._task, timeout=5)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("ThreadSummarizer stopped")
+
+    def request(self, thread_id: uuid.UUID, window_start: datetime) -> None:
+        """Ask for turns of *thread_id* older than *window_start* to be folded."""
+        queued = self._pending.get(thread_id)
+        if queued is not None:
+            self._pending[thread_id] = max(queued, window_start)
+            return
+        if len(self._pending) >= self._max_pending:
+            self._dropped += 1
+            return
+        self._pending[thread_id] = window_start
+        self._queue.put_nowait(thread_id)
+
+    def snapshot(self) -> SummarizerSnapshot:
+        return SummarizerSnapshot(
+            pending=len(self._pending),
+            refreshes=self._refreshes,
+            turns_folded=self._turns_folded,
+            errors=self._errors,
+            dropped=self._dropped,
+        )
+
+    async def refresh(self, thread_id: uuid.UUID, window_start: datetime) -> int:
+        """Fold every unsummarized turn older than *window_start*; returns the count."""
+        folded = 0
+        while True:
+            async with session_scope(self._session_maker) as session:
+                existing = await ThreadSummaryRepo(session).get(thread_id)
+                rows = await EventRepo(session).list_by_thread(
+                    thread_id,
+                    limit=self._fold_batch,
+                    before=window_start,
+                    after=(
+                        (existing.covered_through, existing.covered_event_id)
+                        if existing
+                        else None
+                    ),
+                    newest=False,
+                )
+            if not rows:
+                return folded
+
+            previous = existing.summary if existing else ""
+            transcript = "\n".join(
+                f"{'Assistant' if row.source == 'llm' else 'User'}: "
+                f"{row.content[:_MAX_TURN_CHARS]}"
+                for row in rows
+            )
+            user_message = (
+                f"Previous summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}"
+            )
+            response = await self._complete(
+                LLMRequest(system_prompt=THREAD_SUMMARY_PROMPT, user_message=user_message)
+            )
+
+            last = rows[-1]
+            async with session_scope(self._session_maker) as session:
+                await ThreadSummaryRepo(session).upsert(
+                    thread_id,
+                    summary=response.content.strip(),
+                    covered_through=last.created_at,
+                    covered_event_id=last.event_id,
+                    turns_folded=(existing.turns_folded if existing else 0) + len(rows),
+                )
+            folded += len(rows)
+            self._turns_folded += len(rows)
+            logger.debug(
+                "thread_summary.folded thread_id=%s turns=%d latency_ms=%d",
+                thread_id, len(rows), response.latency_ms,
+            )
+            if len(rows) < self._fold_batch:
+                return folded
+
+    async def _complete(self, request: LLMRequest) -> LLMResponse:
+        if self._admission is None:
+            return await self._provider.complete(request)
+        async with self._admission.slot("background"):
+            return await self._provider.complete(request)
+
+    async def _run(self) -> None:
+        while True:
+            thread_id = await self._queue.get()
+            if thread_id is None:
+                return
+            window_start = self._pending.pop(thread_id, None)
+            if window_start is None:
+                continue
+            try:
+                await self.refresh(thread_id, window_start)
+                self._refreshes += 1
+            except Exception:
+                self._errors += 1
+                logger.exception("thread_summary.refresh error thread_id=%s", thread_id)
@@ -1,15 +1,32 @@
+import asyncio
+import logging
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Literal, Optional
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from ..config import AuditSettings
 from ..events.bus import EventBus
 from ..storage.db import session_scope
 from ..storage.models import AuditEventRow
 from ..schemas.audit import AuditEvent, AuditOutcome, AuditStage, AutonomyLevel, RiskLevel
 
+logger = logging.getLogger(__name__)
+
+# "sync"     — every emit() INSERTs and commits before returning; a failed
+#              write raises AuditWriteError and fails the calling operation.
+# "buffered" — emit() enqueues the event and a background flusher writes
+#              batches as multi-row INSERTs. Individual calls can still opt
+#              into the sync guarantee with emit(..., durable=True).
+AuditDurability = Literal["sync", "buffered"]
+
+_MAX_FLUSH_ATTEMPTS = 3
+_FLUSH_RETRY_BACKOFF_S = 0.5
+
 
 class AuditWriteError(Exception):
     """
@@ -20,6 +37,15 @@ class AuditWriteError(Exception):
     """
 
 
+@dataclass(frozen=True)
+class AuditSinkStats:
+    durability: AuditDurability
+    buffered: int
+    flushed: int
+    batches: int
+    dropped: int
+
+
 class AuditWriter:
     """
     Sole point of audit emission for SYRIS.
@@ -27,6 +53,22 @@ class AuditWriter:
     Constructed once per application lifetime and passed into each pipeline
     stage that needs to emit.
 
+    Durability
+    ----------
+    Settings come from AuditSettings (SYRIS_AUDIT__*); the default is
+    ``"buffered"``. In ``"sync"`` mode every event is its own INSERT + commit.
+    In ``"buffered"`` mode events go onto a bounded in-memory queue and are
+    written in batches of up to ``batch_size`` rows, flushed every
+    ``flush_interval_s``. A full queue blocks emit() (back-pressure) rather
+    than dropping events. Pass ``durable=True`` to emit()/span() for events
+    that must be persisted before the caller proceeds — those bypass the
+    buffer and keep the AuditWriteError guarantee.
+
+    Buffered mode is only active between start() and stop(); stop() drains
+    the buffer. Outside that window every emit() behaves as in sync mode.
+    If the flusher has died, stop() does not wait on the buffer; whatever
+    is still in it is counted as dropped.
+
     Usage::
         writer = AuditWriter(session_maker)
 
@@ -49,9 +91,94 @@ class AuditWriter:
         self,
         session_maker: async_sessionmaker[AsyncSession],
         bus: Optional[EventBus] = None,
+        *,
+        settings: Optional[AuditSettings] = None,
     ) -> None:
+        settings = settings or AuditSettings()
         self._session_maker = session_maker
         self._bus = bus
+        self._durability: AuditDurability = settings.durability
+        self._batch_size = settings.batch_size
+        self._flush_interval_s = settings.flush_interval_s
+
+        # None is the shutdown sentinel for the flusher
+        self._buffer: asyncio.Queue[AuditEvent | None] = asyncio.Queue(
+            maxsize=settings.max_buffer
+        )
+        self._flusher: asyncio.Task[None] | None = None
+        self._flushed = 0
+        self._batches = 0
+        self._dropped = 0
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Start the background flusher (no-op in sync mode)."""
+        if self._durability != "buffered":
+            return
+        if self._flusher and not self._flusher.done():
+            return
+        self._flusher = asyncio.create_task(self._run_flusher(), name="audit_flusher")
+        logger.info(
+            "AuditWriter started (durability=buffered, batch_size=%d, flush_interval=%ss)",
+            self._batch_size,
+            self._flush_interval_s,
+        )
+
+    async def stop(self) -> None:
+        """Flush everything still buffered and stop the flusher."""
+        if not self._flusher:
+            return
+        flusher, self._flusher = self._flusher, None
+        if not flusher.done():
+            # The sentinel put blocks on a full buffer; don't wait on it if
+            # the flusher dies meanwhile
+            sentinel = asyncio.create_task(self._buffer.put(None), name="audit_flusher_stop")
+            await asyncio.wait({sentinel, flusher}, return_when=asyncio.FIRST_COMPLETED)
+            if sentinel.done():
+                await asyncio.wait({flusher})
+            else:
+                sentinel.cancel()
+                await asyncio.gather(sentinel, return_exceptions=True)
+
+        # emit() calls that were blocked on a full buffer land after the
+        # sentinel (each get here wakes another); collect until none are left
+        leftovers: list[AuditEvent] = []
+        await asyncio.sleep(0)
+        while not self._buffer.empty():
+            while not self._buffer.empty():
+                item = self._buffer.get_nowait()
+                self._buffer.task_done()
+                if item is not None:
+                    leftovers.append(item)
+            await asyncio.sleep(0)
+
+        if flusher.cancelled() or flusher.exception() is not None:
+            self._dropped += len(leftovers)
+            logger.error(
+                "audit.flusher_died unflushed=%d",
+                len(leftovers),
+                exc_info=None if flusher.cancelled() else flusher.exception(),
+            )
+        elif leftovers:
+            await self._write_batch(leftovers)
+        logger.info(
+            "AuditWriter stopped (flushed=%d, dropped=%d)", self._flushed, self._dropped
+        )
+
+    async def flush(self) -> None:
+        """Wait until every event buffered so far has been written (or dropped)."""
+        if self._flusher is not None:
+            await self._buffer.join()
+
+    def snapshot(self) -> AuditSinkStats:
+        return AuditSinkStats(
+            durability=self._durability,
+            buffered=self._buffer.qsize(),
+            flushed=self._flushed,
+            batches=self._batches,
+            dropped=self._dropped,
+        )
 
     # Primary API
 
@@ -74,11 +201,16 @@ class AuditWriter:
         risk_level: Optional[RiskLevel] = None,
         autonomy_level: Optional[AutonomyLevel] = None,
         payload_ref: Optional[str] = None,
+        durable: bool = False,
     ) -> AuditEvent:
         """Build and persist an AuditEvent.
 
         Returns the persisted event (useful for tests or chaining).
         Raises AuditWriteError if the INSERT fails — do not catch this.
+
+        In buffered mode the event is queued instead and this only raises
+        for ``durable=True`` calls; batch write failures are retried and
+        logged by the flusher.
         """
         event = AuditEvent(
             trace_id=trace_id,
@@ -99,7 +231,10 @@ class AuditWriter:
             payload_ref=payload_ref,
         )
 
-        await self._insert(event)
+        if durable or self._flusher is None:
+            await self._insert(event)
+        else:
+            await self._buffer.put(event)
         if self._bus is not None:
             self._bus.publish({
                 "stream_type": "audit_event",
@@ -128,6 +263,7 @@ class AuditWriter:
         risk_level: Optional[RiskLevel] = None,
         autonomy_level: Optional[AutonomyLevel] = None,
         payload_ref: Optional[str] = None,
+        durable: bool = False,
     ) -> AsyncGenerator["_SpanContext", None]:
         """Async context manager that times the wrapped block and emits a
         single AuditEvent on exit with the measured latency_ms.
@@ -171,31 +307,13 @@ class AuditWriter:
                 risk_level=risk_level,
                 autonomy_level=autonomy_level,
                 payload_ref=ctx.payload_ref,
+                durable=durable,
             )
 
     # Internal — INSERT only
 
     async def _insert(self, event: AuditEvent) -> None:
-        row = AuditEventRow(
-            audit_id=event.audit_id,
-            timestamp=event.timestamp,
-            trace_id=event.trace_id,
-            stage=event.stage,
-            type=event.type,
-            summary=event.summary,
-            outcome=event.outcome,
-            ref_event_id=event.ref_event_id,
-            ref_task_id=event.ref_task_id,
-            ref_step_id=event.ref_step_id,
-            ref_tool_call_id=event.ref_tool_call_id,
-            ref_approval_id=event.ref_approval_id,
-            latency_ms=event.latency_ms,
-            tool_name=event.tool_name,
-            connector_id=event.connector_id,
-            risk_level=event.risk_level,
-            autonomy_level=event.autonomy_level,
-            payload_ref=event.payload_ref,
-        )
+        row = AuditEventRow(**_row_values(event))
 
         try:
             async with session_scope(self._session_maker) as session:
@@ -206,6 +324,88 @@ class AuditWriter:
                 f"(trace={event.trace_id}, type={event.type}): {exc}"
             ) from exc
 
+    async def _run_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._buffer.get()
+            if first is None:
+                self._buffer.task_done()
+                break
+
+            batch: list[AuditEvent] = [first]
+            deadline = loop.time() + self._flush_interval_s
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._buffer.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    self._buffer.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._write_batch(batch)
+            for _ in batch:
+                self._buffer.task_done()
+
+    async def _write_batch(self, batch: list[AuditEvent]) -> None:
+        """Persist *batch* as one multi-row INSERT, retrying transient failures."""
+        rows = [_row_values(event) for event in batch]
+        for attempt in range(1, _MAX_FLUSH_ATTEMPTS + 1):
+            try:
+                async with session_scope(self._session_maker) as session:
+                    await session.execute(insert(AuditEventRow), rows)
+            except Exception:
+                logger.exception(
+                    "audit.flush_failed batch=%d attempt=%d/%d",
+                    len(batch),
+                    attempt,
+                    _MAX_FLUSH_ATTEMPTS,
+                )
+                if attempt < _MAX_FLUSH_ATTEMPTS:
+                    await asyncio.sleep(_FLUSH_RETRY_BACKOFF_S * attempt)
+                continue
+            self._flushed += len(batch)
+            self._batches += 1
+            return
+
+        self._dropped += len(batch)
+        logger.error(
+            "audit.batch_dropped batch=%d first_audit_id=%s last_audit_id=%s",
+            len(batch),
+            batch[0].audit_id,
+            batch[-1].audit_id,
+        )
+
+
+def _row_values(event: AuditEvent) -> dict[str, Any]:
+    """Column values for an audit_events row built from *event*."""
+    return dict(
+        audit_id=event.audit_id,
+        timestamp=event.timestamp,
+        trace_id=event.trace_id,
+        stage=event.stage,
+        type=event.type,
+        summary=event.summary,
+        outcome=event.outcome,
+        ref_event_id=event.ref_event_id,
+        ref_task_id=event.ref_task_id,
+        ref_step_id=event.ref_step_id,
+        ref_tool_call_id=event.ref_tool_call_id,
+        ref_approval_id=event.ref_approval_id,
+        latency_ms=event.latency_ms,
+        tool_name=event.tool_name,
+        connector_id=event.connector_id,
+        risk_level=event.risk_level,
+        autonomy_level=event.autonomy_level,
+        payload_ref=event.payload_ref,
+    )
+
 
 class _SpanContext:
     """Mutable bag that callers can update inside a writer.span() block
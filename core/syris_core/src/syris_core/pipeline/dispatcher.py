@@ -0,0 +1,173 @@
+"""
+ThreadDispatcher — runs pipeline work in order per thread, in parallel across threads.
+
+ContextBuilder reads a thread's history when it builds the prompt, and the
+responder appends the reply to it. Two events on the same thread_id that
+run at the same time see the same history and interleave their replies.
+Events on different threads don't share anything, so there's no reason for
+one to wait for another.
+
+Every pipeline run is keyed by its event's thread_id, so it is dispatched
+after normalize (which assigns the thread). Runs with the same key execute
+one at a time, in the order run() was called for them. Runs with different
+keys execute concurrently, at most max_concurrency at once. A run waiting
+for its turn on a thread does not hold a concurrency slot. A None key has
+no ordering constraint. A caller with its own, tighter bound (batch
+ingest) passes it as *limiter*; it is acquired after the turn and before
+the shared slot, so runs queued on it don't idle shared slots.
+
+Only post-normalize work belongs in a run: a duplicate input waits for its
+original's response, and doing that while holding the thread's turn would
+deadlock against the original queued behind it.
+
+run() awaits the result (/ingest, batch ingest, pipeline workers). submit()
+starts a whole pipeline in the background without a slot or a turn — the
+pipeline calls run() itself once normalized — so the scheduler and watcher
+loops aren't held up by a slow LLM reply; drain() waits for those on
+shutdown.
+"""
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from contextlib import nullcontext
+from typing import AsyncContextManager, Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_GRACE_S = 30.0
+
+
+@dataclass(frozen=True)
+class _Turn:
+    previous: Optional["asyncio.Future[None]"]  # completion of the run before us
+    done: "asyncio.Future[None]"
+
+
+@dataclass(frozen=True)
+class DispatcherSnapshot:
+    max_concurrency: int
+    running: int
+    threads: int  # threads with a run in progress or waiting
+    background: int  # submit()ted pipelines not finished yet
+    dispatched: int
+    background_errors: int
+
+
+class ThreadDispatcher:
+    """Per-thread FIFO, cross-thread bounded concurrency."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self._max_concurrency = max_concurrency
+        self._slots = asyncio.Semaphore(max_concurrency)
+        # thread -> completion future of the last run queued on it
+        self._tails: dict[uuid.UUID, asyncio.Future[None]] = {}
+        self._background: set[asyncio.Task[None]] = set()
+
+        self._running = 0
+        self._dispatched = 0
+        self._background_errors = 0
+
+    async def run(
+        self,
+        key: Optional[uuid.UUID],
+        fn: Callable[[], Awaitable[T]],
+        *,
+        limiter: Optional[AsyncContextManager[object]] = None,
+    ) -> T:
+        """Run ``fn()`` once every earlier run on *key* is done and a slot is free."""
+        return await self._run_turn(key, self._take_turn(key), fn, limiter)
+
+    def submit(self, fn: Callable[[], Awaitable[None]]) -> None:
+        """Start ``fn()`` in the background, tracked for drain().
+
+        No slot or turn is taken here; *fn* orders its post-normalize work
+        through run().
+        """
+        task = asyncio.create_task(self._run_background(fn()), name="pipeline_dispatch")
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def drain(self, grace_s: float = _DEFAULT_GRACE_S) -> None:
+        """Wait up to *grace_s* for submitted runs, then cancel the rest."""
+        if not self._background:
+            return
+        _, pending = await asyncio.wait(set(self._background), timeout=grace_s)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(
+                "ThreadDispatcher cancelled %d pipeline run(s) still running after %ss grace",
+                len(pending), grace_s,
+            )
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def snapshot(self) -> DispatcherSnapshot:
+        return DispatcherSnapshot(
+            max_concurrency=self._max_concurrency,
+            running=self._running,
+            threads=len(self._tails),
+            background=len(self._background),
+            dispatched=self._dispatched,
+            background_errors=self._background_errors,
+        )
+
+    def _take_turn(self, key: Optional[uuid.UUID]) -> Optional[_Turn]:
+        self._dispatched += 1
+        if key is None:
+            return None
+        turn = _Turn(previous=self._tails.get(key), done=asyncio.get_running_loop().create_future())
+        self._tails[key] = turn.done
+        return turn
+
+    async def _run_turn(
+        self,
+        key: Optional[uuid.UUID],
+        turn: Optional[_Turn],
+        fn: Callable[[], Awaitable[T]],
+        limiter: Optional[AsyncContextManager[object]],
+    ) -> T:
+        if turn is None:
+            return await self._run_slot(fn, limiter)
+
+        def finish(_f: object = None) -> None:
+            _resolve(turn.done)
+            if self._tails.get(key) is turn.done:  # type: ignore[arg-type]
+                del self._tails[key]  # type: ignore[arg-type]
+
+        if turn.previous is not None:
+            try:
+                await asyncio.shield(turn.previous)
+            except asyncio.CancelledError:
+                # Cancelled while waiting: our successor must still wait for
+                # the run before us
+                turn.previous.add_done_callback(finish)
+                raise
+        try:
+            return await self._run_slot(fn, limiter)
+        finally:
+            finish()
+
+    async def _run_slot(
+        self, fn: Callable[[], Awaitable[T]], limiter: Optional[AsyncContextManager[object]]
+    ) -> T:
+        async with limiter if limiter is not None else nullcontext(), self._slots:
+            self._running += 1
+            try:
+                return await fn()
+            finally:
+                self._running -= 1
+
+    async def _run_background(self, run: Awaitable[None]) -> None:
+        try:
+            await run
+        except Exception:
+            self._background_errors += 1
+            logger.exception("pipeline_dispatch background run failed")
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -2,6 +2,8 @@
 import re
 from uuid import UUID
 
+from ...schemas.pipeline import RouteDecision
+
 _UUID_RE = re.compile(
     r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
     re.I,
@@ -19,6 +21,17 @@ def _extract_identifier(content: str, keyword: str) -> str | None:
     return m.group(1) if m else None
 
 
+def _captured_uuid(decision: RouteDecision, name: str, content: str) -> UUID | None:
+    """UUID captured by the router as *name*, else the first UUID in *content*."""
+    raw = decision.captures.get(name)
+    return UUID(raw) if raw else _extract_uuid(content)
+
+
+def _captured_identifier(decision: RouteDecision, keyword: str, content: str) -> str | None:
+    """Identifier captured by the router as *keyword*, else the token after it."""
+    return decision.captures.get(keyword) or _extract_identifier(content, keyword)
+
+
 def _parse_identifier(s: str) -> tuple[UUID | None, str | None]:
     """Determine whether *s* is a UUID or a name slug.
 
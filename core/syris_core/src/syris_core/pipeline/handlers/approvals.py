@@ -9,7 +9,7 @@ from ...schemas.pipeline import RouteDecision
 from ...storage.db import session_scope
 from ...storage.repos.approvals import ApprovalRepo
 from ..executor import PipelineHandler
-from ._util import _extract_uuid
+from ._util import _captured_uuid
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ def make_approval_approve_handler(
     """Handler for approval.approve: approves a pending approval by UUID."""
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
-        approval_id = _extract_uuid(event.content) or event.structured.get("approval_id")
+        approval_id = _captured_uuid(decision, "approval_id", event.content) or event.structured.get("approval_id")
         if approval_id is None:
             return "approval_id missing from request"
 
@@ -69,7 +69,7 @@ def make_approval_deny_handler(
     """Handler for approval.deny: denies a pending approval by UUID."""
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
-        approval_id = _extract_uuid(event.content) or event.structured.get("approval_id")
+        approval_id = _captured_uuid(decision, "approval_id", event.content) or event.structured.get("approval_id")
         if approval_id is None:
             return "approval_id missing from request"
 
@@ -20,8 +20,11 @@ def make_autonomy_set_handler(
     """Handler for autonomy.set: sets system-wide autonomy level (A0–A4)."""
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
-        m = _LEVEL_RE.search(event.content)
-        level = m.group().upper() if m else event.structured.get("level")
+        if "level" in decision.captures:
+            level = decision.captures["level"].upper()
+        else:
+            m = _LEVEL_RE.search(event.content)
+            level = m.group().upper() if m else event.structured.get("level")
         if not level:
             return "Autonomy level missing from request (expected A0–A4)"
 
@@ -1,17 +1,19 @@
 """Fastpath handlers for rule management."""
 import logging
+from typing import Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ...observability.audit import AuditWriter
+from ...rules.engine import RulesEngine
 from ...schemas.events import MessageEvent
 from ...schemas.pipeline import RouteDecision
 from ...storage.db import session_scope
 from ...storage.models import RuleRow
 from ...storage.repos.rules import RuleRepo
 from ..executor import PipelineHandler
-from ._util import _extract_identifier, _parse_identifier
+from ._util import _captured_identifier, _parse_identifier
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +21,15 @@ logger = logging.getLogger(__name__)
 async def _resolve_rule(
     repo: RuleRepo,
     event: MessageEvent,
+    decision: RouteDecision,
 ) -> tuple[RuleRow | None, str | None]:
     """Return (row, None) on success or (None, error_string) on failure.
 
-    Looks up identifier from event.content first, then event.structured.
+    Looks up identifier from the router's captures or event.content first,
+    then event.structured.
     Handles name ambiguity by returning a descriptive error.
     """
-    raw = _extract_identifier(event.content, "rule")
+    raw = _captured_identifier(decision, "rule", event.content)
     if not raw:
         raw = str(event.structured.get("rule_id", ""))
     if not raw:
@@ -69,16 +73,19 @@ def make_rule_list_handler(
 def make_rule_enable_handler(
     session_maker: async_sessionmaker[AsyncSession],
     audit: AuditWriter,
+    rules_engine: Optional[RulesEngine] = None,
 ) -> PipelineHandler:
     """Handler for rule.enable: enables a rule by UUID or name."""
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
         async with session_scope(session_maker) as session:
             repo = RuleRepo(session)
-            row, error = await _resolve_rule(repo, event)
+            row, error = await _resolve_rule(repo, event, decision)
             if error:
                 return error
             await repo.update_fields(row.rule_id, enabled=True)
+        if rules_engine is not None:
+            rules_engine.invalidate()
 
         await audit.emit(
             event.trace_id,
@@ -97,16 +104,19 @@ def make_rule_enable_handler(
 def make_rule_disable_handler(
     session_maker: async_sessionmaker[AsyncSession],
     audit: AuditWriter,
+    rules_engine: Optional[RulesEngine] = None,
 ) -> PipelineHandler:
     """Handler for rule.disable: disables a rule by UUID or name."""
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
         async with session_scope(session_maker) as session:
             repo = RuleRepo(session)
-            row, error = await _resolve_rule(repo, event)
+            row, error = await _resolve_rule(repo, event, decision)
             if error:
                 return error
             await repo.update_fields(row.rule_id, enabled=False)
+        if rules_engine is not None:
+            rules_engine.invalidate()
 
         await audit.emit(
             event.trace_id,
@@ -125,6 +135,7 @@ def make_rule_disable_handler(
 def make_rule_create_handler(
     session_maker: async_sessionmaker[AsyncSession],
     audit: AuditWriter,
+    rules_engine: Optional[RulesEngine] = None,
 ) -> PipelineHandler:
     """Handler for rule.create: creates a rule from event.structured payload.
 
@@ -150,6 +161,8 @@ def make_rule_create_handler(
         async with session_scope(session_maker) as session:
             saved = await RuleRepo(session).create(row)
             rule_id = saved.rule_id
+        if rules_engine is not None:
+            rules_engine.invalidate()
 
         await audit.emit(
             event.trace_id,
@@ -10,7 +10,7 @@ from ...storage.db import session_scope
 from ...storage.models import ScheduleRow
 from ...storage.repos.schedules import ScheduleRepo
 from ..executor import PipelineHandler
-from ._util import _extract_identifier, _parse_identifier
+from ._util import _captured_identifier, _parse_identifier
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +18,15 @@ logger = logging.getLogger(__name__)
 async def _resolve_schedule(
     repo: ScheduleRepo,
     event: MessageEvent,
+    decision: RouteDecision,
 ) -> tuple[ScheduleRow | None, str | None]:
     """Return (row, None) on success or (None, error_string) on failure.
 
-    Looks up identifier from event.content first, then event.structured.
+    Looks up identifier from the router's captures or event.content first,
+    then event.structured.
     Handles name ambiguity by returning a descriptive error.
     """
-    raw = _extract_identifier(event.content, "schedule")
+    raw = _captured_identifier(decision, "schedule", event.content)
     if not raw:
         raw = str(event.structured.get("schedule_id", ""))
     if not raw:
@@ -74,7 +76,7 @@ def make_schedule_cancel_handler(
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
         async with session_scope(session_maker) as session:
             repo = ScheduleRepo(session)
-            row, error = await _resolve_schedule(repo, event)
+            row, error = await _resolve_schedule(repo, event, decision)
             if error:
                 return error
             await repo.update_fields(row.schedule_id, enabled=False)
@@ -102,7 +104,7 @@ def make_schedule_pause_handler(
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
         async with session_scope(session_maker) as session:
             repo = ScheduleRepo(session)
-            row, error = await _resolve_schedule(repo, event)
+            row, error = await _resolve_schedule(repo, event, decision)
             if error:
                 return error
             await repo.update_fields(row.schedule_id, enabled=False)
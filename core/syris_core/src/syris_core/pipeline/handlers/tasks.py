@@ -11,7 +11,7 @@ from ...storage.db import session_scope
 from ...storage.repos.tasks import TaskRepo
 from ...tasks.state import assert_task_transition
 from ..executor import PipelineHandler
-from ._util import _extract_uuid
+from ._util import _captured_uuid
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ def make_task_status_handler(
     """Handler for task.status: returns current status of a task by UUID."""
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
-        task_id = _extract_uuid(event.content) or event.structured.get("task_id")
+        task_id = _captured_uuid(decision, "task_id", event.content) or event.structured.get("task_id")
         if task_id is None:
             return "task_id missing from request"
 
@@ -42,7 +42,7 @@ def make_task_cancel_handler(
     """Handler for task.cancel: cancels a pending or running task by UUID."""
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
-        task_id = _extract_uuid(event.content) or event.structured.get("task_id")
+        task_id = _captured_uuid(decision, "task_id", event.content) or event.structured.get("task_id")
         if task_id is None:
             return "task_id missing from request"
 
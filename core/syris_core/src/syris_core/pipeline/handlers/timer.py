@@ -31,17 +31,22 @@ _UNIT_TO_SECONDS: dict[str, int] = {
 }
 
 
-def _parse_duration(content: str) -> int:
+def _duration_s(amount: str, unit: str) -> int:
+    return int(amount) * _UNIT_TO_SECONDS.get(unit.lower(), 60)
+
+
+def _parse_duration(content: str, captures: dict[str, str] | None = None) -> int:
     """Extract duration in seconds from a timer/reminder phrase.
 
+    Uses the amount/unit the router already captured when present.
     Returns 60 as a safe fallback if no pattern matches.
     """
+    if captures and "amount" in captures and "unit" in captures:
+        return _duration_s(captures["amount"], captures["unit"])
     for pattern in _TIMER_PATTERNS:
         m = pattern.search(content)
         if m:
-            amount = int(m.group(1))
-            unit = m.group(2).lower()
-            return amount * _UNIT_TO_SECONDS.get(unit, 60)
+            return _duration_s(m.group(1), m.group(2))
     return 60
 
 
@@ -52,7 +57,7 @@ def make_timer_set_handler(
 
     async def handler(event: MessageEvent, decision: RouteDecision) -> str:
         s = event.structured
-        interval_s: int = s.get("interval_s") or _parse_duration(event.content)
+        interval_s: int = s.get("interval_s") or _parse_duration(event.content, decision.captures)
         name = s.get("name", f"timer-{event.event_id}")
         now = datetime.now(timezone.utc)
         run_at = now + timedelta(seconds=interval_s)
@@ -0,0 +1,90 @@
+"""
+In-process cache of IngestResponses keyed by RawInput.idempotency_key.
+
+The unique index on message_events.idempotency_key is the source of truth
+for "have we seen this input before"; this cache only decides what a
+duplicate gets back:
+
+- original still running in this process → await and share its response
+- original finished within the window      → its cached response
+- otherwise (expired, evicted, other process, or the original failed)
+  → the caller falls back to a SUPPRESSED "duplicate" response
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from ..schemas.pipeline import IngestResponse
+
+
+@dataclass
+class _Entry:
+    future: "asyncio.Future[Optional[IngestResponse]]"
+    expires_at: float | None = None  # None while the original is in flight
+
+
+class IdempotencyCache:
+    """Bounded LRU of in-flight and recently completed ingest responses."""
+
+    def __init__(self, window_s: float, max_entries: int = 10_000) -> None:
+        self._window_s = window_s
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def begin(self, key: str) -> None:
+        """Register *key* as in flight; call once the event row was inserted."""
+        self._purge()
+        self._entries[key] = _Entry(future=asyncio.get_running_loop().create_future())
+        self._entries.move_to_end(key)
+
+    def complete(self, key: str, response: IngestResponse) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        if not entry.future.done():
+            entry.future.set_result(response)
+        entry.expires_at = time.monotonic() + self._window_s
+
+    def abandon(self, key: str) -> None:
+        """The original failed or never ran — release waiters without a response.
+
+        A no-op once the key has completed, so callers may abandon
+        defensively on any exit path.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.future.done():
+            return
+        del self._entries[key]
+        entry.future.set_result(None)
+
+    async def lookup(self, key: str) -> Optional[IngestResponse]:
+        """Response for a duplicate of *key*, waiting on an in-flight original."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return await asyncio.shield(entry.future)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if entry.expires_at is not None and entry.expires_at <= now
+        ]
+        for key in expired:
+            del self._entries[key]
+        while len(self._entries) >= self._max_entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at is None:
+                # Oldest entry is still in flight; never evict a pending future
+                break
+            del self._entries[key]
@@ -6,11 +6,25 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from ..observability.audit import AuditWriter
 from ..schemas.events import MessageEvent, RawInput
 from ..storage.db import session_scope
+from ..storage.models import MessageEventRow
 from ..storage.repos.events import EventRepo
 
 logger = logging.getLogger(__name__)
 
 
+class DuplicateEvent(Exception):
+    """Raised when a RawInput's idempotency_key already belongs to an event.
+
+    ``original`` is the previously persisted MessageEvent owning the key.
+    """
+
+    def __init__(self, original: MessageEvent) -> None:
+        super().__init__(
+            f"idempotency_key {original.idempotency_key!r} already used by event {original.event_id}"
+        )
+        self.original = original
+
+
 class Normalizer:
     """Converts a RawInput into a canonical MessageEvent, persists it, and
     emits an audit event."""
@@ -24,6 +38,53 @@ class Normalizer:
         self._session_maker = session_maker
 
     async def normalize(self, raw: RawInput) -> MessageEvent:
+        """Build, persist and audit the MessageEvent for *raw*.
+
+        Raises DuplicateEvent if raw.idempotency_key was already ingested.
+        """
+        event = self._build(raw)
+
+        if self._session_maker is not None:
+            async with session_scope(self._session_maker) as session:
+                repo = EventRepo(session)
+                row, created = await repo.create_or_get(event)
+
+            if not created:
+                original = _event_from_row(row)
+                await self._audit_duplicate(event, original)
+                raise DuplicateEvent(original)
+
+        await self._audit_ingested(event)
+        return event
+
+    async def normalize_batch(self, raws: list[RawInput]) -> list[MessageEvent | DuplicateEvent]:
+        """normalize() for several inputs, persisted in one multi-row insert.
+
+        Returns, in input order, the new MessageEvent or — instead of
+        raising — the DuplicateEvent for inputs whose idempotency_key was
+        already ingested (including by an earlier input in the same batch).
+        """
+        events = [self._build(raw) for raw in raws]
+        if self._session_maker is None:
+            for event in events:
+                await self._audit_ingested(event)
+            return list(events)
+
+        async with session_scope(self._session_maker) as session:
+            persisted = await EventRepo(session).create_or_get_many(events)
+
+        results: list[MessageEvent | DuplicateEvent] = []
+        for event, (row, created) in zip(events, persisted):
+            if created:
+                await self._audit_ingested(event)
+                results.append(event)
+            else:
+                original = _event_from_row(row)
+                await self._audit_duplicate(event, original)
+                results.append(DuplicateEvent(original))
+        return results
+
+    def _build(self, raw: RawInput) -> MessageEvent:
         from uuid import uuid4
 
         trace_id = raw.trace_id or uuid4()
@@ -39,7 +100,7 @@ class Normalizer:
 
         thread_id = raw.thread_id or trace_id
 
-        event = MessageEvent(
+        return MessageEvent(
             trace_id=trace_id,
             thread_id=thread_id,
             source=raw.source,
@@ -49,13 +110,9 @@ class Normalizer:
             idempotency_key=raw.idempotency_key,
         )
 
-        if self._session_maker is not None:
-            async with session_scope(self._session_maker) as session:
-                repo = EventRepo(session)
-                await repo.create(event)
-
+    async def _audit_ingested(self, event: MessageEvent) -> None:
         await self._audit.emit(
-            trace_id,
+            event.trace_id,
             stage="normalize",
             type="event.ingested",
             summary=f"MessageEvent {event.event_id} ingested from {event.source}",
@@ -66,7 +123,39 @@ class Normalizer:
         logger.info(
             "event.ingested event_id=%s trace_id=%s source=%s",
             event.event_id,
-            trace_id,
+            event.trace_id,
             event.source,
         )
-        return event
+
+    async def _audit_duplicate(self, event: MessageEvent, original: MessageEvent) -> None:
+        await self._audit.emit(
+            event.trace_id,
+            stage="normalize",
+            type="event.duplicate",
+            summary=(
+                f"Duplicate input from {event.source} — idempotency_key "
+                f"{event.idempotency_key!r} already ingested as {original.event_id}"
+            ),
+            outcome="suppressed",
+            ref_event_id=original.event_id,
+        )
+        logger.info(
+            "event.duplicate idempotency_key=%s original_event_id=%s",
+            event.idempotency_key,
+            original.event_id,
+        )
+
+
+def _event_from_row(row: MessageEventRow) -> MessageEvent:
+    return MessageEvent(
+        event_id=row.event_id,
+        trace_id=row.trace_id,
+        thread_id=row.thread_id,
+        created_at=row.created_at,
+        source=row.source,
+        content=row.content,
+        structured=row.structured,
+        content_type=row.content_type,
+        idempotency_key=row.idempotency_key,
+        parent_event_id=row.parent_event_id,
+    )
@@ -0,0 +1,205 @@
+"""
+PipelineQueue — asynchronous ingest: normalize now, process later.
+
+POST /ingest?async=true only does the cheap, durable part on the request:
+normalize() persists the MessageEvent and its audit record. The rest of the
+pipeline (rules, route, execute, LLM reply, notify) is handed to a bounded
+in-process queue drained by a fixed pool of workers, and the caller gets
+202 with the event_id / trace_id to follow over /stream/events.
+
+Back-pressure
+-------------
+max_depth bounds queued-plus-admitting events. submit() reserves a place
+*before* normalizing, so a full queue is refused (PipelineQueueFull → 429)
+without persisting anything, and concurrent submits can't overshoot.
+
+Duplicates (same idempotency_key) are not queued again; submit() returns the
+original event's ids with status="duplicate".
+
+Shutdown
+--------
+stop() refuses new submits, then gives queued and running events up to
+grace_s to finish before cancelling the workers. Events still queued at that
+point are persisted but never processed; they are logged by event_id and
+their idempotency keys are abandoned.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from ..schemas.events import MessageEvent, RawInput
+from ..schemas.pipeline import IngestAccepted
+from .idempotency import IdempotencyCache
+from .normalizer import DuplicateEvent, Normalizer
+
+logger = logging.getLogger(__name__)
+
+EventProcessor = Callable[[MessageEvent], Awaitable[object]]
+
+_DEFAULT_GRACE_S = 30.0
+
+
+class PipelineQueueFull(Exception):
+    """submit() refused: the queue is at max_depth (or stopped)."""
+
+
+@dataclass(frozen=True)
+class PipelineQueueSnapshot:
+    workers: int
+    busy: int
+    depth: int
+    max_depth: int
+    accepted: int
+    rejected: int
+    duplicates: int
+    processed: int
+    errors: int
+
+
+class PipelineQueue:
+    """Bounded queue of persisted events plus the workers that process them."""
+
+    def __init__(
+        self,
+        normalizer: Normalizer,
+        process: EventProcessor,
+        *,
+        workers: int,
+        max_depth: int,
+        idempotency: Optional[IdempotencyCache] = None,
+        grace_s: float = _DEFAULT_GRACE_S,
+    ) -> None:
+        self._normalizer = normalizer
+        self._process = process
+        self._size = workers
+        self._max_depth = max_depth
+        self._idempotency = idempotency
+        self._grace_s = grace_s
+
+        # None is the worker stop sentinel
+        self._queue: asyncio.Queue[MessageEvent | None] = asyncio.Queue()
+        self._reserved = 0
+        self._tasks: list[asyncio.Task[None]] = []
+        self._accepting = False
+
+        self._busy = 0
+        self._accepted = 0
+        self._rejected = 0
+        self._duplicates = 0
+        self._processed = 0
+        self._errors = 0
+
+    @property
+    def depth(self) -> int:
+        """Events queued or being admitted (not yet picked up by a worker)."""
+        return self._queue.qsize() + self._reserved
+
+    async def start(self) -> None:
+        if any(not t.done() for t in self._tasks):
+            return
+        self._accepting = True
+        self._tasks = [
+            asyncio.create_task(self._run_worker(), name=f"pipeline_worker_{i}")
+            for i in range(self._size)
+        ]
+        logger.info(
+            "PipelineQueue started (workers=%d, max_depth=%d)", self._size, self._max_depth
+        )
+
+    async def stop(self) -> None:
+        if not self._tasks:
+            return
+        self._accepting = False
+        for _ in self._tasks:
+            self._queue.put_nowait(None)
+        _, pending = await asyncio.wait(self._tasks, timeout=self._grace_s)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            unprocessed: list[str] = []
+            while not self._queue.empty():
+                event = self._queue.get_nowait()
+                if event is not None:
+                    unprocessed.append(str(event.event_id))
+                    self._abandon(event)
+            logger.warning(
+                "PipelineQueue cancelled %d worker(s) after %ss grace; "
+                "%d queued event(s) not processed: %s",
+                len(pending), self._grace_s, len(unprocessed), ", ".join(unprocessed),
+            )
+        self._tasks = []
+        logger.info("PipelineQueue stopped")
+
+    async def submit(self, raw: RawInput) -> IngestAccepted:
+        """Normalize and persist *raw*, then queue it for processing.
+
+        Raises PipelineQueueFull without touching the database when there is
+        no room.
+        """
+        if not self._accepting or self.depth >= self._max_depth:
+            self._rejected += 1
+            raise PipelineQueueFull(f"ingest queue full ({self.depth}/{self._max_depth})")
+
+        self._reserved += 1
+        try:
+            event = await self._normalizer.normalize(raw)
+        except DuplicateEvent as dup:
+            self._duplicates += 1
+            event, status = dup.original, "duplicate"
+        else:
+            if self._idempotency is not None and event.idempotency_key is not None:
+                self._idempotency.begin(event.idempotency_key)
+            self._queue.put_nowait(event)
+            self._accepted += 1
+            status = "queued"
+        finally:
+            self._reserved -= 1
+
+        return IngestAccepted(
+            event_id=event.event_id,
+            trace_id=event.trace_id,
+            status=status,
+            queue_depth=self.depth,
+        )
+
+    def snapshot(self) -> PipelineQueueSnapshot:
+        return PipelineQueueSnapshot(
+            workers=len(self._tasks),
+            busy=self._busy,
+            depth=self.depth,
+            max_depth=self._max_depth,
+            accepted=self._accepted,
+            rejected=self._rejected,
+            duplicates=self._duplicates,
+            processed=self._processed,
+            errors=self._errors,
+        )
+
+    async def _run_worker(self) -> None:
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                return
+            self._busy += 1
+            try:
+                await self._process(event)
+                self._processed += 1
+            except asyncio.CancelledError:
+                # Cancelled at shutdown, possibly before processing began
+                self._abandon(event)
+                raise
+            except Exception:
+                self._errors += 1
+                logger.exception(
+                    "pipeline_worker error event_id=%s trace_id=%s",
+                    event.event_id, event.trace_id,
+                )
+            finally:
+                self._busy -= 1
+
+    def _abandon(self, event: MessageEvent) -> None:
+        """Release duplicates waiting on an event that won't be processed."""
+        if self._idempotency is not None and event.idempotency_key is not None:
+            self._idempotency.abandon(event.idempotency_key)
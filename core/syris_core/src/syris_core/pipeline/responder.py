@@ -1,11 +1,14 @@
 import logging
+from datetime import datetime, timezone
 from typing import Any, Callable, Coroutine, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from ..events.bus import EventBus
 from ..llm.client import LLMClient
 from ..observability.audit import AuditWriter
 from ..schemas.events import MessageEvent
+from ..schemas.llm import LLMResponse
 from ..schemas.pipeline import ExecutionResult
 from ..storage.db import session_scope
 from ..storage.repos.events import EventRepo
@@ -22,6 +25,11 @@ class Responder:
     client.chat() with full thread history; passes the execution result
     when one exists so the LLM can reference what the system just did.
     Persists the reply as a MessageEvent for conversation continuity.
+
+    With a bus and stream=True the reply is streamed: every text delta is
+    published as an ``llm_delta`` envelope (for /stream/events) as soon as
+    the provider emits it, followed by a ``done`` envelope once the final
+    message has been persisted.
     """
 
     def __init__(
@@ -30,11 +38,15 @@ class Responder:
         audit: AuditWriter,
         session_maker: async_sessionmaker[AsyncSession],
         dispatch: Optional[DispatchHook] = None,
+        bus: Optional[EventBus] = None,
+        stream: bool = False,
     ) -> None:
         self._client = client
         self._audit = audit
         self._session_maker = session_maker
         self._dispatch = dispatch
+        self._bus = bus
+        self._stream = stream and bus is not None
 
     async def respond(
         self,
@@ -46,7 +58,10 @@ class Responder:
         Returns (thinking, reply) — thinking is None when the provider does
         not emit extended thinking output.
         """
-        llm_response = await self._client.chat(event, result=result)
+        if self._stream:
+            llm_response = await self._stream_reply(event, result)
+        else:
+            llm_response = await self._client.chat(event, result=result)
 
         thinking = llm_response.thinking
         reply = llm_response.content
@@ -61,6 +76,14 @@ class Responder:
         async with session_scope(self._session_maker) as session:
             await EventRepo(session).create(reply_event)
 
+        if self._stream:
+            self._publish_delta(
+                event,
+                done=True,
+                reply_event_id=str(reply_event.event_id),
+                first_token_ms=llm_response.first_token_ms,
+            )
+
         if self._dispatch is not None:
             await self._dispatch(event, reply)
 
@@ -83,3 +106,32 @@ class Responder:
             len(reply),
         )
         return thinking, reply
+
+    async def _stream_reply(
+        self,
+        event: MessageEvent,
+        result: ExecutionResult,
+    ) -> LLMResponse:
+        llm_response: Optional[LLMResponse] = None
+        async for chunk in self._client.chat_stream(event, result=result):
+            if chunk.delta:
+                self._publish_delta(event, delta=chunk.delta, iteration=chunk.iteration)
+            if chunk.response is not None:
+                llm_response = chunk.response
+        if llm_response is None:
+            raise RuntimeError("LLM stream ended without a final response")
+        return llm_response
+
+    def _publish_delta(self, event: MessageEvent, *, done: bool = False, **payload: Any) -> None:
+        assert self._bus is not None
+        self._bus.publish({
+            "stream_type": "llm_delta",
+            "trace_id": str(event.trace_id),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "payload": {
+                "event_id": str(event.event_id),
+                "thread_id": str(event.thread_id),
+                "done": done,
+                **payload,
+            },
+        })
@@ -14,76 +14,115 @@ _UUID_PAT = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
 # Used for resources that carry a human-readable name (schedules, rules).
 _IDENT_PAT = rf"(?:{_UUID_PAT}|\w[\w.\-]*)"
 
-# Fastpath patterns: regex → handler key.
+
+def _uuid(name: str) -> str:
+    return rf"(?P<{name}>{_UUID_PAT})"
+
+
+def _ident(name: str) -> str:
+    return rf"(?P<{name}>{_IDENT_PAT})"
+
+
+# Fastpath patterns: (regex, handler key, keywords), in priority order.
 # Only genuinely unambiguous, latency-sensitive patterns belong here.
 # Everything else routes to "llm_conversation".
-_FASTPATH: list[tuple[re.Pattern, str]] = [
+# A pattern is only tried when one of its keywords occurs in the message,
+# so every match of the regex must contain one of them (lowercase).
+# Named groups end up in RouteDecision.captures for the handler.
+_FASTPATH_SOURCES: list[tuple[str, str, tuple[str, ...]]] = [
     # timer.set
     (
-        re.compile(
-            r"(?:set (?:a )?)?timer (?:for )?(\d+)\s*(s|sec|seconds?|m|min|minutes?|h|hr|hours?)",
-            re.I,
-        ),
+        r"(?:set (?:a )?)?timer (?:for )?(?P<amount>\d+)\s*(?P<unit>s|sec|seconds?|m|min|minutes?|h|hr|hours?)",
         "timer.set",
+        ("timer",),
     ),
     (
-        re.compile(
-            r"remind me in (\d+)\s*(s|m|h|min|sec|hour|minute)s?\s*(?:to\s+.+)?",
-            re.I,
-        ),
+        r"remind me in (?P<amount>\d+)\s*(?P<unit>s|m|h|min|sec|hour|minute)s?\s*(?:to\s+.+)?",
         "timer.set",
+        ("remind",),
     ),
 
     # task.status
-    (re.compile(rf"task\s+status\s+{_UUID_PAT}", re.I), "task.status"),
-    (re.compile(rf"(?:check|show|get)\s+(?:the\s+)?status\s+of\s+task\s+{_UUID_PAT}", re.I), "task.status"),
+    (rf"task\s+status\s+{_uuid('task_id')}", "task.status", ("task",)),
+    (rf"(?:check|show|get)\s+(?:the\s+)?status\s+of\s+task\s+{_uuid('task_id')}", "task.status", ("task",)),
 
     # task.cancel
-    (re.compile(rf"cancel\s+task\s+{_UUID_PAT}", re.I), "task.cancel"),
-    (re.compile(rf"stop\s+task\s+{_UUID_PAT}", re.I), "task.cancel"),
+    (rf"cancel\s+task\s+{_uuid('task_id')}", "task.cancel", ("task",)),
+    (rf"stop\s+task\s+{_uuid('task_id')}", "task.cancel", ("task",)),
 
     # autonomy.set
-    (re.compile(r"set\s+autonomy\s+(?:level\s+)?(?:to\s+)?A[0-4]\b", re.I), "autonomy.set"),
-    (re.compile(r"autonomy\s+level\s+(?:to\s+)?A[0-4]\b", re.I), "autonomy.set"),
+    (r"set\s+autonomy\s+(?:level\s+)?(?:to\s+)?(?P<level>A[0-4])\b", "autonomy.set", ("autonomy",)),
+    (r"autonomy\s+level\s+(?:to\s+)?(?P<level>A[0-4])\b", "autonomy.set", ("autonomy",)),
 
     # approval.list
-    (re.compile(r"list\s+(?:all\s+|pending\s+)?approvals?", re.I), "approval.list"),
-    (re.compile(r"show\s+(?:all\s+|pending\s+)?approvals?", re.I), "approval.list"),
+    (r"list\s+(?:all\s+|pending\s+)?approvals?", "approval.list", ("approval",)),
+    (r"show\s+(?:all\s+|pending\s+)?approvals?", "approval.list", ("approval",)),
 
     # approval.approve
-    (re.compile(rf"approve\s+(?:approval\s+|request\s+)?{_UUID_PAT}", re.I), "approval.approve"),
+    (rf"approve\s+(?:approval\s+|request\s+)?{_uuid('approval_id')}", "approval.approve", ("approve",)),
 
     # approval.deny
-    (re.compile(rf"(?:deny|reject)\s+(?:approval\s+|request\s+)?{_UUID_PAT}", re.I), "approval.deny"),
+    (rf"(?:deny|reject)\s+(?:approval\s+|request\s+)?{_uuid('approval_id')}", "approval.deny", ("deny", "reject")),
 
     # schedule.list
-    (re.compile(r"list\s+(?:all\s+)?schedules?", re.I), "schedule.list"),
-    (re.compile(r"show\s+(?:all\s+)?schedules?", re.I), "schedule.list"),
+    (r"list\s+(?:all\s+)?schedules?", "schedule.list", ("schedule",)),
+    (r"show\s+(?:all\s+)?schedules?", "schedule.list", ("schedule",)),
 
     # schedule.cancel — accepts UUID or named slug
-    (re.compile(rf"cancel\s+schedule\s+{_IDENT_PAT}", re.I), "schedule.cancel"),
-    (re.compile(rf"(?:delete|remove)\s+schedule\s+{_IDENT_PAT}", re.I), "schedule.cancel"),
+    (rf"cancel\s+schedule\s+{_ident('schedule')}", "schedule.cancel", ("schedule",)),
+    (rf"(?:delete|remove)\s+schedule\s+{_ident('schedule')}", "schedule.cancel", ("schedule",)),
 
     # schedule.pause
-    (re.compile(rf"pause\s+schedule\s+{_IDENT_PAT}", re.I), "schedule.pause"),
+    (rf"pause\s+schedule\s+{_ident('schedule')}", "schedule.pause", ("schedule",)),
 
     # rule.list
-    (re.compile(r"list\s+(?:all\s+)?rules?", re.I), "rule.list"),
-    (re.compile(r"show\s+(?:all\s+)?rules?", re.I), "rule.list"),
+    (r"list\s+(?:all\s+)?rules?", "rule.list", ("rule",)),
+    (r"show\s+(?:all\s+)?rules?", "rule.list", ("rule",)),
 
     # rule.enable — accepts UUID or named slug
-    (re.compile(rf"enable\s+rule\s+{_IDENT_PAT}", re.I), "rule.enable"),
+    (rf"enable\s+rule\s+{_ident('rule')}", "rule.enable", ("rule",)),
 
     # rule.disable
-    (re.compile(rf"disable\s+rule\s+{_IDENT_PAT}", re.I), "rule.disable"),
+    (rf"disable\s+rule\s+{_ident('rule')}", "rule.disable", ("rule",)),
+]
+
+_FASTPATH: list[tuple[re.Pattern, str, tuple[str, ...]]] = [
+    (re.compile(source, re.I), handler_key, keywords)
+    for source, handler_key, keywords in _FASTPATH_SOURCES
 ]
 
+# Every distinct keyword, checked once per message
+_KEYWORDS: tuple[str, ...] = tuple(sorted({kw for _, _, kws in _FASTPATH for kw in kws}))
+
+
+def match_fastpath(content: str) -> tuple[str, dict[str, str]] | None:
+    """Return (handler_key, captures) for the first fastpath pattern matching
+    *content*, or None.
+
+    Ordinary chat usually contains none of the keywords, so it costs a few
+    substring checks and no regex search at all. casefold() keeps the
+    prefilter at least as permissive as re.I (e.g. "ſ" → "s").
+    """
+    folded = content.casefold()
+    present = {kw for kw in _KEYWORDS if kw in folded}
+    if not present:
+        return None
+    for pattern, handler_key, keywords in _FASTPATH:
+        if present.isdisjoint(keywords):
+            continue
+        m = pattern.search(content)
+        if m is not None:
+            captures = {name: value for name, value in m.groupdict().items() if value is not None}
+            return handler_key, captures
+    return None
+
 
 class Router:
     """Routes a MessageEvent to a handler.
 
     Routing cascade:
-    1. Regex match on event.content → fastpath handler (no LLM, low latency)
+    1. Regex match on event.content → fastpath handler (no LLM, low latency);
+       named groups from the pattern are passed on as decision.captures
     2. Everything else → "llm_conversation" (LLM picks a tool from the registry)
     """
 
@@ -91,13 +130,14 @@ class Router:
         self._audit = audit
 
     async def route(self, event: MessageEvent) -> RouteDecision:
-        handler, reason = self._resolve_handler(event)
+        handler, reason, captures = self._resolve_handler(event)
 
         decision = RouteDecision(
             event_id=event.event_id,
             trace_id=event.trace_id,
             handler=handler,
             reason=reason,
+            captures=captures,
         )
 
         await self._audit.emit(
@@ -112,8 +152,9 @@ class Router:
         logger.info("event.routed event_id=%s handler=%s", event.event_id, handler)
         return decision
 
-    def _resolve_handler(self, event: MessageEvent) -> tuple[str, str]:
-        for pattern, handler_key in _FASTPATH:
-            if pattern.search(event.content):
-                return handler_key, "fastpath: pattern match"
-        return "llm_conversation", "no fastpath match — LLM conversation"
+    def _resolve_handler(self, event: MessageEvent) -> tuple[str, str, dict[str, str]]:
+        matched = match_fastpath(event.content)
+        if matched is not None:
+            handler_key, captures = matched
+            return handler_key, "fastpath: pattern match", captures
+        return "llm_conversation", "no fastpath match — LLM conversation", {}
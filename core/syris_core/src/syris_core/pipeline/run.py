@@ -1,12 +1,21 @@
+import asyncio
+import functools
 import logging
 from typing import Optional
 
 from ..rules.engine import RulesEngine
 from ..notifications.notifier import Notifier
-from ..schemas.events import RawInput
-from ..schemas.pipeline import IngestResponse
+from ..schemas.events import MessageEvent, RawInput
+from ..schemas.pipeline import (
+    BatchIngestItem,
+    ExecutionOutcome,
+    ExecutionResult,
+    IngestResponse,
+)
+from .dispatcher import ThreadDispatcher
 from .executor import Executor
-from .normalizer import Normalizer
+from .idempotency import IdempotencyCache
+from .normalizer import DuplicateEvent, Normalizer
 from .responder import Responder
 from .router import Router
 
@@ -23,6 +32,8 @@ async def run_pipeline(
     responder: Responder,
     notifier: Optional[Notifier] = None,
     rules_engine: Optional[RulesEngine] = None,
+    idempotency: Optional[IdempotencyCache] = None,
+    dispatcher: Optional[ThreadDispatcher] = None,
 ) -> IngestResponse:
     """Normalize → (Rules) → Route → Execute → Respond.
 
@@ -30,9 +41,181 @@ async def run_pipeline(
     business logic — it sequences stage calls and lets exceptions propagate.
     rules_engine is optional; when None the rules stage is skipped entirely,
     keeping all existing tests passing without modification.
+
+    Inputs whose idempotency_key was already ingested stop after normalize:
+    they get the original's response from *idempotency* when it is still
+    cached (or in flight), otherwise a SUPPRESSED "duplicate" result.
+
+    With a *dispatcher*, everything after normalize runs in its event's
+    thread order. Duplicates return before that, so they never wait on their
+    original while holding a turn.
+    """
+    try:
+        event = await normalizer.normalize(raw)
+    except DuplicateEvent as dup:
+        return await _duplicate_response(dup.original, idempotency)
+
+    if idempotency is not None and event.idempotency_key is not None:
+        idempotency.begin(event.idempotency_key)
+
+    async def process() -> IngestResponse:
+        return await process_event(
+            event, router, executor, responder,
+            notifier=notifier, rules_engine=rules_engine, idempotency=idempotency,
+        )
+
+    try:
+        return await (dispatcher.run(event.thread_id, process) if dispatcher else process())
+    except BaseException:
+        # Cancelled while waiting for the thread turn: process_event never
+        # ran, so the key would stay in flight for every later duplicate
+        if idempotency is not None and event.idempotency_key is not None:
+            idempotency.abandon(event.idempotency_key)
+        raise
+
+
+async def run_pipeline_batch(
+    raws: list[RawInput],
+    normalizer: Normalizer,
+    router: Router,
+    executor: Executor,
+    responder: Responder,
+    notifier: Optional[Notifier] = None,
+    rules_engine: Optional[RulesEngine] = None,
+    idempotency: Optional[IdempotencyCache] = None,
+    concurrency: int = 8,
+    dispatcher: Optional[ThreadDispatcher] = None,
+) -> list[BatchIngestItem]:
+    """run_pipeline() for many inputs at once; one result per input, in order.
+
+    Normalize persists the whole batch in one insert and the rules stage
+    runs once over all new events; after that each event goes through
+    route → execute → respond → notify on its own, at most *concurrency*
+    at a time (and in thread order through *dispatcher*, if given). An item
+    takes its batch slot only once its thread turn comes up, and before a
+    dispatcher slot, so waiting items hold neither. Duplicates wait for
+    their original outside any turn. A failing event is reported in its
+    item and does not stop the others.
     """
-    event = await normalizer.normalize(raw)
+    normalized = await normalizer.normalize_batch(raws)
+    events = [item for item in normalized if isinstance(item, MessageEvent)]
+
+    if idempotency is not None:
+        for event in events:
+            if event.idempotency_key is not None:
+                idempotency.begin(event.idempotency_key)
+    try:
+        return await _process_batch(
+            normalized, events, router, executor, responder,
+            notifier, rules_engine, idempotency, concurrency, dispatcher,
+        )
+    except BaseException:
+        # Cancelled: release every key whose process_event never settled it
+        if idempotency is not None:
+            for event in events:
+                if event.idempotency_key is not None:
+                    idempotency.abandon(event.idempotency_key)
+        raise
+
+
+async def _process_batch(
+    normalized: list[MessageEvent | DuplicateEvent],
+    events: list[MessageEvent],
+    router: Router,
+    executor: Executor,
+    responder: Responder,
+    notifier: Optional[Notifier],
+    rules_engine: Optional[RulesEngine],
+    idempotency: Optional[IdempotencyCache],
+    concurrency: int,
+    dispatcher: Optional[ThreadDispatcher],
+) -> list[BatchIngestItem]:
+    if rules_engine is not None and events:
+        try:
+            await rules_engine.evaluate_batch(events)
+        except Exception:
+            logger.exception(
+                "rules_engine.evaluate_batch failed events=%d — continuing", len(events)
+            )
+
+    semaphore = asyncio.Semaphore(concurrency)
 
+    async def _one(index: int, item: MessageEvent | DuplicateEvent) -> BatchIngestItem:
+        if isinstance(item, DuplicateEvent):
+            original = item.original
+            return BatchIngestItem(
+                index=index,
+                status="duplicate",
+                event_id=original.event_id,
+                trace_id=original.trace_id,
+                response=await _duplicate_response(original, idempotency),
+            )
+
+        process = functools.partial(
+            process_event, item, router, executor, responder,
+            notifier=notifier, idempotency=idempotency,
+        )
+        try:
+            if dispatcher is not None:
+                response = await dispatcher.run(item.thread_id, process, limiter=semaphore)
+            else:
+                async with semaphore:
+                    response = await process()
+        except Exception as exc:
+            logger.exception("batch item failed event_id=%s", item.event_id)
+            return BatchIngestItem(
+                index=index,
+                status="failed",
+                event_id=item.event_id,
+                trace_id=item.trace_id,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+        return BatchIngestItem(
+            index=index,
+            status="processed",
+            event_id=item.event_id,
+            trace_id=item.trace_id,
+            response=response,
+        )
+
+    return list(await asyncio.gather(*(_one(i, item) for i, item in enumerate(normalized))))
+
+
+async def process_event(
+    event: MessageEvent,
+    router: Router,
+    executor: Executor,
+    responder: Responder,
+    notifier: Optional[Notifier] = None,
+    rules_engine: Optional[RulesEngine] = None,
+    idempotency: Optional[IdempotencyCache] = None,
+) -> IngestResponse:
+    """Every stage after normalize, for an event that is already persisted.
+
+    The caller has already called idempotency.begin() for the event's key,
+    if any; this settles it with the response (or abandons it on error).
+    """
+    key = event.idempotency_key if idempotency is not None else None
+    try:
+        response = await _process(event, router, executor, responder, notifier, rules_engine)
+    except BaseException:
+        if key is not None:
+            idempotency.abandon(key)  # type: ignore[union-attr]
+        raise
+    if key is not None:
+        idempotency.complete(key, response)  # type: ignore[union-attr]
+    return response
+
+
+async def _process(
+    event: MessageEvent,
+    router: Router,
+    executor: Executor,
+    responder: Responder,
+    notifier: Optional[Notifier],
+    rules_engine: Optional[RulesEngine],
+) -> IngestResponse:
+    """(Rules) → Route → Execute → Respond → Notify for a persisted event."""
     if rules_engine is not None:
         try:
             await rules_engine.evaluate(event)
@@ -58,3 +241,26 @@ async def run_pipeline(
             )
 
     return IngestResponse(execution=result, reply=reply, thinking=thinking)
+
+
+async def _duplicate_response(
+    original: MessageEvent,
+    idempotency: Optional[IdempotencyCache],
+) -> IngestResponse:
+    if idempotency is not None and original.idempotency_key is not None:
+        cached = await idempotency.lookup(original.idempotency_key)
+        if cached is not None:
+            return cached
+
+    return IngestResponse(
+        execution=ExecutionResult(
+            event_id=original.event_id,
+            trace_id=original.trace_id,
+            handler="dedupe",
+            outcome=ExecutionOutcome.SUPPRESSED,
+            detail=(
+                f"Duplicate of event {original.event_id} "
+                f"(idempotency_key={original.idempotency_key!r})"
+            ),
+        )
+    )
@@ -1,8 +1,10 @@
 import json
 import logging
+from typing import Optional
 
 from pydantic import ValidationError
 
+from ..llm.cache import ResponseCache
 from ..llm.providers.base import BaseProvider
 from ..observability.audit import AuditWriter
 from ..schemas.events import MessageEvent
@@ -28,7 +30,9 @@ class LLMambiguityRouter:
     2. Builds a system prompt via routing.prompts.build_ambiguity_prompt() with
        the namespace list injected — the LLM receives namespaces only, not full
        tool definitions, to avoid context-stuffing.
-    3. Issues a single provider.complete() call (no chat history, no tool calling).
+    3. Issues a single provider.complete() call (no chat history, no tool calling),
+       through the ResponseCache when one is given — repeated scheduler/watcher
+       content is then answered without a model round-trip.
     4. Parses the JSON response into an LLMRoutingDecision. On any parse failure
        the fallback is ESCALATE with confidence=0.0 so the caller handles ambiguity
        safely.
@@ -55,10 +59,12 @@ class LLMambiguityRouter:
         provider: BaseProvider,
         audit: AuditWriter,
         registry: ToolRegistry,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         self._provider = provider
         self._audit = audit
         self._registry = registry
+        self._cache = cache
 
     async def route(self, event: MessageEvent) -> LLMRoutingDecision:
         """Classify *event* into a coarse LLMRoutingDecision.
@@ -84,7 +90,10 @@ class LLMambiguityRouter:
                 event.event_id,
                 namespaces,
             )
-            response = await self._provider.complete(request)
+            if self._cache is not None:
+                response = await self._cache.complete(self._provider, request)
+            else:
+                response = await self._provider.complete(request)
             decision = _parse_decision(response.content)
             span.outcome = "success"
             span.summary = (
@@ -93,6 +102,8 @@ class LLMambiguityRouter:
                 f"confidence={decision.confidence:.2f} "
                 f"for event {event.event_id}"
             )
+            if self._cache is not None:
+                span.summary += f" {self._cache.audit_note(response)}"
 
         logger.info(
             "llm_ambiguity.decided event_id=%s decision=%s namespace=%s confidence=%.2f",
@@ -0,0 +1,206 @@
+"""Compiled, indexed form of the enabled rule set.
+
+Rule conditions are stored as JSON dicts. Interpreting them per event means
+re-reading every enabled rule and recompiling every ``matches`` regex on
+every call. A RuleIndex is built once from the enabled rows instead:
+
+- each condition becomes a closure (regexes compiled up front), and
+- each rule is filed under one bucket so an event only visits candidates:
+    by_source  — the rule has a ``source eq X`` condition
+    by_key     — the rule requires a top-level structured key (``has_key``
+                 on it, or any eq/contains/matches on ``structured.KEY...``)
+    unindexed  — everything else, checked against every event
+
+A rule can only match when its bucket's requirement holds, so skipping the
+other buckets never changes which rules match. compile_condition() is the
+one definition of what a condition means.
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+from uuid import UUID
+
+from ..schemas.events import MessageEvent
+from ..storage.models import RuleRow
+
+CompiledCondition = Callable[[MessageEvent], bool]
+
+
+def _never(_event: MessageEvent) -> bool:
+    return False
+
+
+def _resolver(field: str) -> Callable[[MessageEvent], Any]:
+    """Accessor for a dotted field path against a MessageEvent.
+
+    Supported paths:
+      "source"          → event.source
+      "content"         → event.content
+      "structured.KEY"  → event.structured.get("KEY")
+      "structured.a.b"  → nested traversal with .get()
+
+    Unknown top-level fields and missing nested keys resolve to None.
+    """
+    if field == "source":
+        return lambda event: event.source
+    if field == "content":
+        return lambda event: event.content
+    if field.startswith("structured."):
+        parts = tuple(field.split(".")[1:])
+
+        def resolve(event: MessageEvent) -> Any:
+            current: Any = event.structured
+            for part in parts:
+                if not isinstance(current, dict):
+                    return None
+                current = current.get(part)
+            return current
+
+        return resolve
+    return lambda _event: None
+
+
+def compile_condition(cond: dict) -> CompiledCondition:
+    """Turn one raw condition dict into a predicate over MessageEvents.
+
+    Operators:
+      eq       — str(resolved) == str(value)
+      contains — str(value) in str(resolved)
+      matches  — re.search(value, str(resolved), re.I); invalid regex → False
+      has_key  — field must start with "structured.", key present in structured
+
+    The predicate is False for unknown ops, resolution errors, or None
+    resolved values (fail-safe: a malformed condition never silently fires
+    a rule).
+    """
+    op = cond.get("op")
+    field = cond.get("field", "")
+    value = cond.get("value")
+
+    if not isinstance(field, str):
+        return _never
+
+    if op == "has_key":
+        if not field.startswith("structured."):
+            return _never
+        key = field.split(".", 1)[1]
+        return lambda event: key in event.structured
+
+    resolve = _resolver(field)
+
+    if op == "eq":
+        expected = str(value)
+
+        def test(resolved: Any) -> bool:
+            return str(resolved) == expected
+
+    elif op == "contains":
+        needle = str(value)
+
+        def test(resolved: Any) -> bool:
+            return needle in str(resolved)
+
+    elif op == "matches":
+        try:
+            pattern = re.compile(str(value), re.I)
+        except re.error:
+            return _never
+
+        def test(resolved: Any) -> bool:
+            return pattern.search(str(resolved)) is not None
+
+    else:
+        return _never
+
+    def predicate(event: MessageEvent) -> bool:
+        try:
+            resolved = resolve(event)
+            if resolved is None:
+                return False
+            return test(resolved)
+        except Exception:
+            return False
+
+    return predicate
+
+
+def _index_key(conditions: list[dict]) -> tuple[str, Optional[str]]:
+    """Pick the bucket a rule is filed under: ("source"|"key"|"none", value)."""
+    for cond in conditions:
+        if cond.get("op") == "eq" and cond.get("field") == "source":
+            return "source", str(cond.get("value"))
+    for cond in conditions:
+        field = cond.get("field")
+        if not isinstance(field, str) or not field.startswith("structured."):
+            continue
+        op = cond.get("op")
+        if op == "has_key":
+            return "key", field.split(".", 1)[1]
+        if op in ("eq", "contains", "matches"):
+            # A resolved None never matches, so the first path part must exist
+            return "key", field.split(".")[1]
+    return "none", None
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """Plain-value snapshot of an enabled RuleRow plus its compiled conditions."""
+
+    rule_id: UUID
+    name: str
+    quiet_hours_policy_id: Optional[UUID]
+    action: dict[str, Any]
+    conditions: tuple[CompiledCondition, ...]
+
+    def matches(self, event: MessageEvent) -> bool:
+        for condition in self.conditions:
+            if not condition(event):
+                return False
+        return True
+
+
+class RuleIndex:
+    """Enabled rules bucketed by source / required structured key."""
+
+    def __init__(self, rows: Iterable[RuleRow]) -> None:
+        self.by_source: dict[str, list[CompiledRule]] = {}
+        self.by_key: dict[str, list[CompiledRule]] = {}
+        self.unindexed: list[CompiledRule] = []
+        self.size = 0
+
+        for row in rows:
+            raw: list[dict] = [c for c in (row.conditions or []) if isinstance(c, dict)]
+            if len(raw) != len(row.conditions or []):
+                # Non-dict entries are malformed conditions: the rule can never fire
+                continue
+            rule = CompiledRule(
+                rule_id=row.rule_id,
+                name=row.name,
+                quiet_hours_policy_id=row.quiet_hours_policy_id,
+                action=dict(row.action or {}),
+                conditions=tuple(compile_condition(c) for c in raw),
+            )
+            kind, key = _index_key(raw)
+            if kind == "source":
+                self.by_source.setdefault(key, []).append(rule)
+            elif kind == "key":
+                self.by_key.setdefault(key, []).append(rule)
+            else:
+                self.unindexed.append(rule)
+            self.size += 1
+
+    def candidates(self, event: MessageEvent) -> Iterator[CompiledRule]:
+        """Rules whose bucket requirement *event* satisfies."""
+        yield from self.by_source.get(event.source, ())
+        structured = event.structured
+        if len(self.by_key) < len(structured):
+            for key, rules in self.by_key.items():
+                if key in structured:
+                    yield from rules
+        else:
+            for key in structured:
+                yield from self.by_key.get(key, ())
+        yield from self.unindexed
+
+    def match(self, event: MessageEvent) -> list[CompiledRule]:
+        return [rule for rule in self.candidates(event) if rule.matches(event)]
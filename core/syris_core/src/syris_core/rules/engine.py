@@ -1,7 +1,12 @@
 """Rules Engine — evaluates IFTTT-style rules against incoming MessageEvents.
 
-Each enabled rule is checked against the event's fields. When all conditions
-match, the engine fires the rule by:
+Enabled rules are held in memory as a compiled RuleIndex (see compiled.py),
+so an event is only checked against candidate rules and the database is
+only touched when one matches. The index is rebuilt after invalidate() —
+called on rule CRUD — and at most every refresh_s as a safety net for edits
+made by other processes.
+
+When all of a rule's conditions match, the engine fires the rule by:
   1. Checking quiet hours (if a policy is attached).
   2. Atomically claiming the fire slot via SELECT FOR UPDATE (debounce check).
   3. Creating a child MessageEvent that shares the parent's trace_id and carries
@@ -10,11 +15,12 @@ match, the engine fires the rule by:
 Suppressed firings (debounce or quiet hours) emit rule.suppressed audit events.
 All exceptions bubble up to the caller (run_pipeline wraps in try/except).
 """
+import asyncio
+import copy
 import logging
-import re
+import time
 import zoneinfo
 from datetime import datetime, timezone
-from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -23,76 +29,11 @@ from ..schemas.events import MessageEvent
 from ..storage.db import session_scope
 from ..storage.repos.events import EventRepo
 from ..storage.repos.rules import QuietHoursPolicyRepo, RuleRepo
+from .compiled import CompiledRule, RuleIndex
 
 logger = logging.getLogger(__name__)
 
-
-def _resolve_field(event: MessageEvent, field: str) -> Any:
-    """Resolve a dotted field path against a MessageEvent.
-
-    Supported paths:
-      "source"          → event.source
-      "content"         → event.content
-      "structured.KEY"  → event.structured.get("KEY")
-      "structured.a.b"  → nested traversal with .get()
-
-    Returns None for unknown top-level fields or missing nested keys.
-    """
-    if field == "source":
-        return event.source
-    if field == "content":
-        return event.content
-    if field.startswith("structured."):
-        parts = field.split(".")[1:]
-        current: Any = event.structured
-        for part in parts:
-            if not isinstance(current, dict):
-                return None
-            current = current.get(part)
-        return current
-    return None
-
-
-def _evaluate_condition(event: MessageEvent, cond: dict) -> bool:
-    """Evaluate a single raw condition dict against an event.
-
-    Operators:
-      eq       — str(resolved) == str(value)
-      contains — str(value) in str(resolved)
-      matches  — re.search(value, str(resolved), re.I); invalid regex → False
-      has_key  — field must start with "structured.", key present in structured
-
-    Returns False for unknown ops, resolution errors, or None resolved values
-    (fail-safe: a malformed condition never silently fires a rule).
-    """
-    op = cond.get("op")
-    field = cond.get("field", "")
-    value = cond.get("value")
-
-    try:
-        if op == "has_key":
-            if not field.startswith("structured."):
-                return False
-            key = field.split(".", 1)[1]
-            return key in event.structured
-
-        resolved = _resolve_field(event, field)
-        if resolved is None:
-            return False
-
-        if op == "eq":
-            return str(resolved) == str(value)
-        if op == "contains":
-            return str(value) in str(resolved)
-        if op == "matches":
-            try:
-                return bool(re.search(str(value), str(resolved), re.I))
-            except re.error:
-                return False
-    except Exception:
-        return False
-
-    return False
+_DEFAULT_REFRESH_S = 60.0
 
 
 def _is_quiet_hour(start_hour: int, end_hour: int, current_hour: int) -> bool:
@@ -117,9 +58,41 @@ class RulesEngine:
         self,
         session_maker: async_sessionmaker[AsyncSession],
         audit: AuditWriter,
+        *,
+        refresh_s: float = _DEFAULT_REFRESH_S,
     ) -> None:
         self._session_maker = session_maker
         self._audit = audit
+        self._refresh_s = refresh_s
+        self._index: RuleIndex | None = None
+        self._loaded_at = 0.0
+        self._generation = 0
+        self._load_lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Drop the compiled rule set; the next evaluate() reloads it."""
+        self._generation += 1
+        self._index = None
+
+    async def _rule_index(self) -> RuleIndex:
+        index = self._index
+        if index is not None and time.monotonic() - self._loaded_at < self._refresh_s:
+            return index
+        async with self._load_lock:
+            index = self._index
+            if index is not None and time.monotonic() - self._loaded_at < self._refresh_s:
+                return index
+            generation = self._generation
+            async with session_scope(self._session_maker) as session:
+                rows = await RuleRepo(session).list_enabled()
+            index = RuleIndex(rows)
+            # An invalidate() during the load may mean the rows are already stale;
+            # use them for this call but don't cache them
+            if generation == self._generation:
+                self._index = index
+                self._loaded_at = time.monotonic()
+            logger.debug("rules_engine.index_loaded rules=%d", index.size)
+            return index
 
     async def evaluate(self, event: MessageEvent) -> list[MessageEvent]:
         """Evaluate all enabled rules against event.
@@ -127,100 +100,119 @@ class RulesEngine:
         Returns a list of child MessageEvents that were created (may be empty).
         Child events share the parent's trace_id and carry parent_event_id.
         """
-        child_events: list[MessageEvent] = []
+        index = await self._rule_index()
+        matched = index.match(event)
+        if not matched:
+            return []
 
         async with session_scope(self._session_maker) as session:
-            rule_repo = RuleRepo(session)
-            event_repo = EventRepo(session)
-            rules = await rule_repo.list_enabled()
-
-            now = datetime.now(timezone.utc)
-
-            for rule in rules:
-                conditions: list[dict] = rule.conditions or []
-                if not all(_evaluate_condition(event, c) for c in conditions):
-                    continue
-
-                suppressed = False
-
-                # --- Quiet hours check ---
-                if rule.quiet_hours_policy_id is not None:
-                    policy = await QuietHoursPolicyRepo(session).get(
-                        rule.quiet_hours_policy_id
-                    )
-                    if policy is not None:
-                        try:
-                            tz_name = policy.timezone
-                            if tz_name.upper() in ("UTC", "UTC+0", "UTC-0"):
-                                local_now = now
-                            else:
-                                tz = zoneinfo.ZoneInfo(tz_name)
-                                local_now = now.astimezone(tz)
-                            if _is_quiet_hour(
-                                policy.start_hour, policy.end_hour, local_now.hour
-                            ):
-                                suppressed = True
-                        except (zoneinfo.ZoneInfoNotFoundError, KeyError):
-                            logger.warning(
-                                "rules_engine.unknown_timezone rule_id=%s tz=%s",
-                                rule.rule_id,
-                                policy.timezone,
-                            )
-
-                # --- Debounce check (atomic SELECT FOR UPDATE) ---
-                if not suppressed:
-                    claimed = await rule_repo.claim_for_fire(rule.rule_id, now)
-                    if claimed is None:
-                        suppressed = True
-
-                if suppressed:
-                    await rule_repo.update_fields(
-                        rule.rule_id,
-                        suppression_count=rule.suppression_count + 1,
-                    )
-                    await self._audit.emit(
-                        event.trace_id,
-                        stage="rule",
-                        type="rule.suppressed",
-                        summary=(
-                            f"Rule '{rule.name}' suppressed for event {event.event_id}"
-                        ),
-                        outcome="suppressed",
-                        ref_event_id=event.event_id,
-                        connector_id=str(rule.rule_id),
-                    )
-                    continue
-
-                # --- Fire: create child event ---
-                action: dict = rule.action or {}
-                child = MessageEvent(
-                    trace_id=event.trace_id,
-                    source=action.get("source", "rules_engine"),
-                    content=action.get("content", ""),
-                    structured=action.get("structured", {}),
-                    parent_event_id=event.event_id,
-                )
-                await event_repo.create(child)
+            return await self._fire(session, event, matched)
 
+    async def evaluate_batch(self, events: list[MessageEvent]) -> list[list[MessageEvent]]:
+        """evaluate() over several events: one rule-set lookup, one transaction.
+
+        Returns the child events created for each input, in input order.
+        """
+        index = await self._rule_index()
+        matches = [index.match(event) for event in events]
+        if not any(matches):
+            return [[] for _ in events]
+
+        async with session_scope(self._session_maker) as session:
+            return [
+                await self._fire(session, event, matched) if matched else []
+                for event, matched in zip(events, matches)
+            ]
+
+    async def _fire(
+        self, session: AsyncSession, event: MessageEvent, matched: list[CompiledRule]
+    ) -> list[MessageEvent]:
+        """Quiet-hours / debounce / fire each matched rule for *event* in *session*."""
+        child_events: list[MessageEvent] = []
+        rule_repo = RuleRepo(session)
+        event_repo = EventRepo(session)
+
+        now = datetime.now(timezone.utc)
+
+        for rule in matched:
+            suppressed = False
+
+            # --- Quiet hours check ---
+            if rule.quiet_hours_policy_id is not None:
+                policy = await QuietHoursPolicyRepo(session).get(
+                    rule.quiet_hours_policy_id
+                )
+                if policy is not None:
+                    try:
+                        tz_name = policy.timezone
+                        if tz_name.upper() in ("UTC", "UTC+0", "UTC-0"):
+                            local_now = now
+                        else:
+                            tz = zoneinfo.ZoneInfo(tz_name)
+                            local_now = now.astimezone(tz)
+                        if _is_quiet_hour(
+                            policy.start_hour, policy.end_hour, local_now.hour
+                        ):
+                            suppressed = True
+                    except (zoneinfo.ZoneInfoNotFoundError, KeyError):
+                        logger.warning(
+                            "rules_engine.unknown_timezone rule_id=%s tz=%s",
+                            rule.rule_id,
+                            policy.timezone,
+                        )
+
+            # --- Debounce check (atomic SELECT FOR UPDATE) ---
+            if not suppressed:
+                claimed = await rule_repo.claim_for_fire(rule.rule_id, now)
+                if claimed is None:
+                    suppressed = True
+
+            if suppressed:
+                await rule_repo.increment_suppression(rule.rule_id)
                 await self._audit.emit(
                     event.trace_id,
                     stage="rule",
-                    type="rule.triggered",
+                    type="rule.suppressed",
                     summary=(
-                        f"Rule '{rule.name}' triggered by event {event.event_id}, "
-                        f"child={child.event_id}"
+                        f"Rule '{rule.name}' suppressed for event {event.event_id}"
                     ),
-                    outcome="success",
+                    outcome="suppressed",
                     ref_event_id=event.event_id,
                     connector_id=str(rule.rule_id),
                 )
-
-                logger.info(
-                    "rule.fired rule_id=%s event_id=%s child_event_id=%s",
-                    rule.rule_id,
-                    event.event_id,
-                    child.event_id,
-                )
-                child_events.append(child)
+                continue
+
+            # --- Fire: create child event ---
+            action = rule.action
+            child = MessageEvent(
+                trace_id=event.trace_id,
+                source=action.get("source", "rules_engine"),
+                content=action.get("content", ""),
+                # The action dict is shared by the cached rule set
+                structured=copy.deepcopy(action.get("structured", {})),
+                parent_event_id=event.event_id,
+            )
+            await event_repo.create(child)
+
+            await self._audit.emit(
+                event.trace_id,
+                stage="rule",
+                type="rule.triggered",
+                summary=(
+                    f"Rule '{rule.name}' triggered by event {event.event_id}, "
+                    f"child={child.event_id}"
+                ),
+                outcome="success",
+                ref_event_id=event.event_id,
+                connector_id=str(rule.rule_id),
+            )
+
+            logger.info(
+                "rule.fired rule_id=%s event_id=%s child_event_id=%s",
+                rule.rule_id,
+                event.event_id,
+                child.event_id,
+            )
+            child_events.append(child)
 
         return child_events
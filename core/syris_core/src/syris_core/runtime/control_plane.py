@@ -4,6 +4,7 @@ import logging
 import uuid
 from typing import Any
 
+import httpx
 import uvicorn
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
@@ -11,16 +12,21 @@ from ..api.app import create_app
 from ..config import Settings
 from ..events.bus import EventBus
 from ..logging import configure_logging
+from ..llm.admission import AdmissionController
 from ..llm.client import LLMClient
+from ..llm.cache import PostgresResponseStore, ResponseCache
 from ..llm.context import ContextBuilder
-from ..llm.providers.base import BaseProvider
+from ..llm.summarizer import ThreadSummarizer
+from ..llm.providers.base import BaseProvider, LoopBudget
 from ..llm.providers.cerebras import CerebrasProvider
 from ..llm.providers.groq import GroqProvider
 from ..llm.providers.ollama import OllamaProvider
+from ..llm.providers.router import RoutingProvider
 from ..llm.providers.sglang import SGLangProvider
 from ..observability.audit import AuditWriter
 from ..observability.heartbeat import HeartbeatService
 from ..pipeline.executor import Executor
+from ..pipeline.idempotency import IdempotencyCache
 from ..pipeline.handlers import (
     make_approval_approve_handler,
     make_approval_deny_handler,
@@ -40,14 +46,17 @@ from ..rules.engine import RulesEngine
 from ..pipeline.normalizer import Normalizer
 from ..pipeline.responder import Responder
 from ..pipeline.router import Router
-from ..pipeline.run import run_pipeline
+from ..pipeline.dispatcher import ThreadDispatcher
+from ..pipeline.queue import PipelineQueue
+from ..pipeline.run import CHAT_SOURCES, process_event, run_pipeline
 from ..safety.autonomy import AutonomyService
 from ..safety.gates import GateChecker
 from ..scheduler.loop import SchedulerLoop
-from ..schemas.events import RawInput
+from ..schemas.events import MessageEvent, RawInput
 from ..schemas.safety import Approval
 from ..storage.db import create_engine, create_sessionmaker, init_db, session_scope
 from ..storage.models import ApprovalRow
+from ..storage.notify import WakeupHub
 from ..storage.repos.approvals import ApprovalRepo
 from ..tasks.engine import TaskEngine
 from ..tasks.llm_step import LLMDecideHandler
@@ -56,6 +65,7 @@ from ..tools.built_in import register_built_ins
 from ..tools.executor import ToolExecutor
 from ..tools.registry import ToolRegistry
 from ..tasks.recovery import TaskRecovery
+from ..tasks.worker import TaskWorkerPool
 from ..watchers.base import WatcherLoop
 from ..watchers.heartbeat import HeartbeatWatcher
 from ..notifications.notifier import Notifier
@@ -87,19 +97,56 @@ class _SessionedApprovalRepo:
 
 
 def _build_llm_provider(settings: Settings) -> BaseProvider:
-    """Instantiate the configured LLM provider from settings."""
+    """Instantiate the configured LLM provider from settings.
+
+    With llm.fallbacks set, the primary and the fallbacks are wrapped in a
+    RoutingProvider.
+    """
     llm = settings.llm
-    match llm.provider:
+    limits = httpx.Limits(
+        max_connections=llm.http_max_connections,
+        max_keepalive_connections=llm.http_max_keepalive,
+        keepalive_expiry=llm.http_keepalive_expiry_s,
+    )
+    primary = _build_backend(
+        llm.provider, llm.base_url, llm.model, llm.timeout_s, limits=limits, http2=llm.http2
+    )
+    if not llm.fallbacks:
+        return primary
+    backends = [primary] + [
+        _build_backend(
+            b.provider, b.base_url, b.model, b.timeout_s, limits=limits, http2=llm.http2
+        )
+        for b in llm.fallbacks
+    ]
+    return RoutingProvider(
+        backends,
+        hedge_after_ms=llm.hedge_after_ms,
+        failure_threshold=llm.breaker_failures,
+        open_s=llm.breaker_open_s,
+    )
+
+
+def _build_backend(
+    provider: str,
+    base_url: str,
+    model: str,
+    timeout_s: int,
+    *,
+    limits: httpx.Limits,
+    http2: bool,
+) -> BaseProvider:
+    match provider:
         case "ollama":
-            return OllamaProvider(llm.base_url, llm.model, llm.timeout_s)
+            return OllamaProvider(base_url, model, timeout_s, limits=limits, http2=http2)
         case "sglang":
-            return SGLangProvider(llm.base_url, llm.model, llm.timeout_s)
+            return SGLangProvider(base_url, model, timeout_s, limits=limits, http2=http2)
         case "groq":
-            return GroqProvider(llm.model, llm.timeout_s)
+            return GroqProvider(model, timeout_s)
         case "cerebras":
-            return CerebrasProvider(llm.model, llm.timeout_s)
+            return CerebrasProvider(model, timeout_s)
         case _:
-            raise ValueError(f"Unknown LLM provider: {llm.provider!r}")
+            raise ValueError(f"Unknown LLM provider: {provider!r}")
 
 
 async def _noop_get_secret(connector_id: str, key: str) -> str:
@@ -116,10 +163,16 @@ class RuntimeState:
     engine: AsyncEngine
     sessionmaker: async_sessionmaker[AsyncSession]
     event_bus: EventBus
+    wakeup_hub: WakeupHub
     heartbeat: HeartbeatService
     audit_writer: AuditWriter
     scheduler_loop: SchedulerLoop
     watcher_loop: WatcherLoop
+    task_workers: TaskWorkerPool
+    pipeline_queue: PipelineQueue
+    pipeline_dispatcher: ThreadDispatcher
+    llm_provider: BaseProvider
+    thread_summarizer: ThreadSummarizer | None
 
 
 class ControlPlane:
@@ -147,7 +200,14 @@ class ControlPlane:
         started_at = datetime.now(timezone.utc)
 
         app = create_app(self._settings)
-        event_bus = EventBus()
+        event_bus = EventBus(
+            max_queue_size=self._settings.stream.subscriber_queue_size,
+            replay_size=self._settings.stream.replay_buffer_size,
+        )
+
+        # LISTEN/NOTIFY wakeups for the scheduler, watcher and task loops
+        wakeup_hub = WakeupHub(self._settings.database_url)
+        await wakeup_hub.start()
 
         heartbeat = HeartbeatService(
             sessionmaker,
@@ -160,7 +220,9 @@ class ControlPlane:
         )
         await heartbeat.start()
 
-        audit_writer = AuditWriter(sessionmaker, bus=event_bus)
+        audit_settings = self._settings.audit
+        audit_writer = AuditWriter(sessionmaker, bus=event_bus, settings=audit_settings)
+        await audit_writer.start()
 
         # Safety
         autonomy_service = AutonomyService(sessionmaker)
@@ -187,12 +249,56 @@ class ControlPlane:
 
         # LLM client with context builder (needs tool_registry to be populated)
         llm_provider = _build_llm_provider(self._settings)
-        context_builder = ContextBuilder(sessionmaker, tool_registry)
+        llm_settings = self._settings.llm
+        llm_admission = (
+            AdmissionController(
+                llm_settings.max_in_flight,
+                reserved_interactive=llm_settings.reserved_interactive,
+            )
+            if llm_settings.max_in_flight is not None
+            else None
+        )
+        thread_summarizer = (
+            ThreadSummarizer(sessionmaker, llm_provider, admission=llm_admission)
+            if self._settings.llm.summarize_history
+            else None
+        )
+        context_builder = ContextBuilder(
+            sessionmaker,
+            tool_registry,
+            history_token_budget=self._settings.llm.history_token_budget,
+            history_max_turns=self._settings.llm.history_max_turns,
+            summarizer=thread_summarizer,
+        )
+        if thread_summarizer is not None:
+            await thread_summarizer.start()
+        response_cache = (
+            ResponseCache(
+                ttl_s=llm_settings.cache_ttl_s,
+                max_entries=llm_settings.cache_max_entries,
+                store=(
+                    PostgresResponseStore(sessionmaker)
+                    if llm_settings.cache_persistent
+                    else None
+                ),
+            )
+            if llm_settings.cache_enabled
+            else None
+        )
         llm_client = LLMClient(
             llm_provider, audit_writer, self._settings.llm.system_prompt,
             context_builder=context_builder,
             tool_executor=tool_executor,
             tool_registry=tool_registry,
+            tool_concurrency=self._settings.llm.tool_concurrency,
+            loop_budget=LoopBudget(
+                max_iterations=self._settings.llm.max_tool_iterations,
+                max_total_tokens=self._settings.llm.loop_token_budget,
+                max_wall_s=self._settings.llm.loop_time_budget_s,
+            ),
+            response_cache=response_cache,
+            admission=llm_admission,
+            interactive_sources=CHAT_SOURCES,
         )
 
         # Task engine — step handlers from registry (gate owned by StepRunner)
@@ -212,6 +318,22 @@ class ControlPlane:
         async with session_scope(sessionmaker) as session:
             await recovery.reconcile(session)
 
+        task_settings = self._settings.tasks
+        task_workers = TaskWorkerPool(
+            task_engine,
+            size=task_settings.worker_count,
+            prefetch=task_settings.prefetch,
+            claim_batch_size=task_settings.claim_batch_size,
+            idle_backoff_min_s=task_settings.idle_backoff_min_s,
+            idle_backoff_max_s=task_settings.idle_backoff_max_s,
+            grace_s=task_settings.shutdown_grace_s,
+            wakeup_hub=wakeup_hub,
+        )
+        await task_workers.start()
+
+        # Rules engine — evaluates IFTTT rules before routing
+        rules_engine = RulesEngine(sessionmaker, audit_writer)
+
         # Pipeline executor: fastpath regex handlers only.
         # "llm_conversation" is handled by the Responder — no registration needed.
         pipeline_handlers = {
@@ -226,28 +348,63 @@ class ControlPlane:
             "schedule.cancel":  make_schedule_cancel_handler(sessionmaker, audit_writer),
             "schedule.pause":   make_schedule_pause_handler(sessionmaker, audit_writer),
             "rule.list":        make_rule_list_handler(sessionmaker),
-            "rule.enable":      make_rule_enable_handler(sessionmaker, audit_writer),
-            "rule.disable":     make_rule_disable_handler(sessionmaker, audit_writer),
+            "rule.enable":      make_rule_enable_handler(sessionmaker, audit_writer, rules_engine),
+            "rule.disable":     make_rule_disable_handler(sessionmaker, audit_writer, rules_engine),
             # rule.create: no fastpath route, not registered
         }
 
-        # Rules engine — evaluates IFTTT rules before routing
-        rules_engine = RulesEngine(sessionmaker, audit_writer)
-
         # Pipeline stages
         normalizer = Normalizer(audit_writer, session_maker=sessionmaker)
         router = Router(audit_writer)
         executor = Executor(audit_writer, handlers=pipeline_handlers)
-        responder = Responder(llm_client, audit_writer, sessionmaker)
+        responder = Responder(
+            llm_client, audit_writer, sessionmaker,
+            bus=event_bus, stream=self._settings.llm.stream,
+        )
         notifier = Notifier(audit_writer)
+        idempotency_cache = IdempotencyCache(
+            self._settings.ingest.idempotency_window_s,
+            max_entries=self._settings.ingest.idempotency_cache_size,
+        )
 
         # Notification channels
         notifier.register(NtfyChannel(topic="syris-f7k2mxqp94jw"))
 
+        # Orders pipeline runs per thread; runs different threads concurrently
+        pipeline_dispatcher = ThreadDispatcher(self._settings.ingest.dispatch_concurrency)
+
         async def _pipeline(raw: RawInput) -> None:
-            await run_pipeline(raw, normalizer, router, executor, responder, notifier=notifier, rules_engine=rules_engine)
+            await run_pipeline(
+                raw, normalizer, router, executor, responder,
+                notifier=notifier, rules_engine=rules_engine, idempotency=idempotency_cache,
+                dispatcher=pipeline_dispatcher,
+            )
+
+        async def _process_event(event: MessageEvent) -> None:
+            await pipeline_dispatcher.run(
+                event.thread_id,
+                lambda: process_event(
+                    event, router, executor, responder,
+                    notifier=notifier, rules_engine=rules_engine,
+                    idempotency=idempotency_cache,
+                ),
+            )
+
+        # Async ingest (POST /ingest?async=true)
+        pipeline_queue = PipelineQueue(
+            normalizer,
+            _process_event,
+            workers=self._settings.ingest.async_workers,
+            max_depth=self._settings.ingest.async_queue_size,
+            idempotency=idempotency_cache,
+            grace_s=self._settings.ingest.async_shutdown_grace_s,
+        )
+        await pipeline_queue.start()
 
-        scheduler_loop = SchedulerLoop(sessionmaker, audit_writer, _pipeline)
+        scheduler_loop = SchedulerLoop(
+            sessionmaker, audit_writer, _pipeline,
+            wakeup_hub=wakeup_hub, dispatcher=pipeline_dispatcher,
+        )
         await scheduler_loop.start()
 
         heartbeat_watcher = HeartbeatWatcher(
@@ -255,7 +412,10 @@ class ControlPlane:
             run_id=run_id,
             tick_interval_s=self._settings.heartbeat_interval_s,
         )
-        watcher_loop = WatcherLoop(sessionmaker, audit_writer, _pipeline)
+        watcher_loop = WatcherLoop(
+            sessionmaker, audit_writer, _pipeline,
+            wakeup_hub=wakeup_hub, dispatcher=pipeline_dispatcher,
+        )
         watcher_loop.register(heartbeat_watcher)
         await watcher_loop.start()
 
@@ -266,6 +426,7 @@ class ControlPlane:
         app.state.run_id = run_id
         app.state.started_at = started_at
         app.state.event_bus = event_bus
+        app.state.wakeup_hub = wakeup_hub
         app.state.heartbeat = heartbeat
         app.state.audit_writer = audit_writer
         app.state.normalizer = normalizer
@@ -273,13 +434,21 @@ class ControlPlane:
         app.state.executor = executor
         app.state.responder = responder
         app.state.notifier = notifier
+        app.state.idempotency_cache = idempotency_cache
+        app.state.pipeline_queue = pipeline_queue
+        app.state.pipeline_dispatcher = pipeline_dispatcher
         app.state.autonomy_service = autonomy_service
         app.state.task_engine = task_engine
+        app.state.task_workers = task_workers
         app.state.scheduler_loop = scheduler_loop
         app.state.watcher_loop = watcher_loop
         app.state.rules_engine = rules_engine
         app.state.context_builder = context_builder
         app.state.llm_client = llm_client
+        app.state.llm_provider = llm_provider
+        app.state.thread_summarizer = thread_summarizer
+        app.state.llm_cache = response_cache
+        app.state.llm_admission = llm_admission
 
         self._app = app
         self._runtime = RuntimeState(
@@ -288,10 +457,16 @@ class ControlPlane:
             engine=engine,
             sessionmaker=sessionmaker,
             event_bus=event_bus,
+            wakeup_hub=wakeup_hub,
             heartbeat=heartbeat,
             audit_writer=audit_writer,
             scheduler_loop=scheduler_loop,
             watcher_loop=watcher_loop,
+            task_workers=task_workers,
+            pipeline_queue=pipeline_queue,
+            pipeline_dispatcher=pipeline_dispatcher,
+            llm_provider=llm_provider,
+            thread_summarizer=thread_summarizer,
         )
 
         logger.info(
@@ -305,7 +480,18 @@ class ControlPlane:
         logger.info("ControlPlane stopping run_id=%s", self._runtime.run_id)
         await self._runtime.scheduler_loop.stop()
         await self._runtime.watcher_loop.stop()
+        await self._runtime.pipeline_queue.stop()
+        await self._runtime.pipeline_dispatcher.drain(
+            self._settings.ingest.dispatch_shutdown_grace_s
+        )
+        await self._runtime.task_workers.stop()
+        await self._runtime.wakeup_hub.stop()
         await self._runtime.heartbeat.stop()
+        if self._runtime.thread_summarizer is not None:
+            await self._runtime.thread_summarizer.stop()
+        await self._runtime.llm_provider.aclose()
+        # Drain buffered audit events while the engine can still write them
+        await self._runtime.audit_writer.stop()
         await self._runtime.engine.dispose()
 
         self._runtime = None
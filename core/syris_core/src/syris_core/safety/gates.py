@@ -157,6 +157,7 @@ class GateChecker:
                     ref_task_id=ref_task_id,
                     ref_step_id=ref_step_id,
                     ref_approval_id=existing.approval_id,
+                    durable=True,
                 )
                 return GateDecision(action="ALLOW", reason="Prior approval granted")
 
@@ -186,6 +187,7 @@ class GateChecker:
                 autonomy_level=autonomy_level,  # type: ignore[arg-type]
                 ref_task_id=ref_task_id,
                 ref_step_id=ref_step_id,
+                durable=True,
             )
             return GateDecision(action="ALLOW", reason="Gate matrix: ALLOW")
 
@@ -201,6 +203,7 @@ class GateChecker:
                 autonomy_level=autonomy_level,  # type: ignore[arg-type]
                 ref_task_id=ref_task_id,
                 ref_step_id=ref_step_id,
+                durable=True,
             )
             return GateDecision(action="HARD_BLOCK", reason="Gate matrix: HARD_BLOCK")
 
@@ -216,6 +219,7 @@ class GateChecker:
                 autonomy_level=autonomy_level,  # type: ignore[arg-type]
                 ref_task_id=ref_task_id,
                 ref_step_id=ref_step_id,
+                durable=True,
             )
             return GateDecision(action="PREVIEW", reason="Gate matrix: PREVIEW (A0 suggest-only)")
 
@@ -254,6 +258,7 @@ class GateChecker:
             ref_task_id=ref_task_id,
             ref_step_id=ref_step_id,
             ref_approval_id=approval.approval_id,
+            durable=True,
         )
         logger.info(
             "gate.required tool=%s risk=%s autonomy=%s approval_id=%s",
@@ -21,9 +21,11 @@ from croniter import croniter
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..observability.audit import AuditWriter
+from ..pipeline.dispatcher import ThreadDispatcher
 from ..schemas.events import MessageEvent, RawInput
 from ..storage.db import session_scope
 from ..storage.models import ScheduleRow
+from ..storage.notify import OverdueBackoff, WakeupHub, wakeup_timeout
 from ..storage.repos.schedules import ScheduleRepo
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,8 @@ logger = logging.getLogger(__name__)
 PipelineRunner = Callable[[RawInput], Coroutine[Any, Any, Any]]
 
 _POLL_INTERVAL_S = 5
+# Safety-net poll while LISTEN/NOTIFY wakeups are being delivered
+_SAFETY_POLL_S = 60
 
 
 def compute_initial_next_run(
@@ -75,10 +79,17 @@ class SchedulerLoop:
         sessionmaker: async_sessionmaker[AsyncSession],
         audit_writer: AuditWriter,
         pipeline_runner: PipelineRunner,
+        wakeup_hub: Optional[WakeupHub] = None,
+        dispatcher: Optional[ThreadDispatcher] = None,
     ) -> None:
         self._sessionmaker = sessionmaker
         self._audit = audit_writer
         self._pipeline_runner = pipeline_runner
+        self._wakeup = wakeup_hub.subscribe("schedules") if wakeup_hub else None
+        self._overdue = OverdueBackoff()
+        # With a dispatcher, pipeline runs go to the background instead of
+        # holding up the loop (the runner orders them per thread once normalized)
+        self._dispatcher = dispatcher
         self._stop_event = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
 
@@ -105,25 +116,41 @@ class SchedulerLoop:
     async def _run_loop(self) -> None:
         try:
             while not self._stop_event.is_set():
+                if self._wakeup is not None:
+                    self._wakeup.clear()
+
+                next_due: Optional[datetime] = None
                 try:
-                    await self._tick()
+                    next_due = await self._tick()
                 except Exception:
                     logger.exception("SchedulerLoop tick error")
 
+                timeout = wakeup_timeout(
+                    self._wakeup,
+                    (next_due - datetime.now(timezone.utc)).total_seconds() if next_due else None,
+                    poll_s=_POLL_INTERVAL_S,
+                    safety_poll_s=_SAFETY_POLL_S,
+                    overdue=self._overdue,
+                )
+                if self._wakeup is not None:
+                    await self._wakeup.wait(timeout)
+                    continue
                 try:
-                    await asyncio.wait_for(self._stop_event.wait(), timeout=_POLL_INTERVAL_S)
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
                 except asyncio.TimeoutError:
                     continue
         except asyncio.CancelledError:
             raise
 
-    async def _tick(self) -> None:
+    async def _tick(self) -> Optional[datetime]:
+        """Fire every due schedule. Returns the earliest upcoming next_run_at."""
         now = datetime.now(timezone.utc)
         async with session_scope(self._sessionmaker) as session:
             repo = ScheduleRepo(session)
             due = await repo.get_due(now)
             for row in due:
                 await self._process_schedule(repo, row, now)
+            return await repo.next_due_at()
 
     async def _process_schedule(
         self, repo: ScheduleRepo, row: ScheduleRow, now: datetime
@@ -138,6 +165,7 @@ class SchedulerLoop:
             next_run = self._compute_next_run(row, now)
             await repo.update_fields(
                 row.schedule_id,
+                notify=False,
                 next_run_at=next_run,
                 enabled=False if row.schedule_type == "one_shot" else row.enabled,
             )
@@ -187,7 +215,7 @@ class SchedulerLoop:
             update_kwargs["enabled"] = False
             update_kwargs["next_run_at"] = None
 
-        await repo.update_fields(row.schedule_id, **update_kwargs)
+        await repo.update_fields(row.schedule_id, notify=False, **update_kwargs)
 
     async def _fire(self, row: ScheduleRow, fire_at: datetime, trace_id: uuid.UUID) -> None:
         """Emit one MessageEvent and an audit record for this schedule firing."""
@@ -206,6 +234,12 @@ class SchedulerLoop:
             trace_id=trace_id,
         )
 
+        if self._dispatcher is not None:
+            self._dispatcher.submit(lambda: self._run_pipeline(row, raw, trace_id))
+        else:
+            await self._run_pipeline(row, raw, trace_id)
+
+    async def _run_pipeline(self, row: ScheduleRow, raw: RawInput, trace_id: uuid.UUID) -> None:
         try:
             await self._pipeline_runner(raw)
         except Exception:
@@ -77,9 +77,25 @@ class LLMResponse(BaseModel):
     model: str
     provider: str  # e.g. "sglang", "ollama"
     latency_ms: int
-    prompt_tokens: Optional[int] = None
+    prompt_tokens: Optional[int] = None  # summed over every tool-calling round
     completion_tokens: Optional[int] = None
     tool_iterations: Optional[int] = None  # number of round-trips when tool-calling
     thinking: Optional[str] = None  # extended thinking output, when supported by provider
+    first_token_ms: Optional[int] = None  # streamed calls only: time to first text delta
+    iteration_latency_ms: Optional[list[int]] = None  # per round-trip, chat() only
+    stop_reason: Optional[str] = None  # "complete" or the budget that ended the loop
+    cached: bool = False  # served from the LLM response cache, no round-trip
+    coalesced: bool = False  # shared another caller's identical in-flight request
+
+    model_config = {"frozen": True}
+
+
+class LLMStreamChunk(BaseModel):
+    """One item from a streaming chat: a text delta, or the final response."""
+
+    delta: str = ""
+    iteration: int = 1  # tool-calling round the delta belongs to
+    done: bool = False
+    response: Optional[LLMResponse] = None  # set on the final (done) chunk
 
     model_config = {"frozen": True}
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
@@ -13,6 +13,8 @@ class RouteDecision(BaseModel):
     trace_id: UUID
     handler: str  # e.g. "unroutable", "llm_conversation", "timer.set"
     matched_rule_id: Optional[str] = None
+    # Named groups from the fastpath pattern, e.g. {"task_id": "..."}
+    captures: dict[str, str] = Field(default_factory=dict)
     confidence: Optional[float] = None  # populated only by LLM fallback (future)
     reason: str
     routed_at: datetime = Field(
@@ -53,6 +55,36 @@ class IngestResponse(BaseModel):
     thinking: Optional[str] = None
 
 
+class IngestAccepted(BaseModel):
+    """HTTP 202 response for POST /ingest?async=true.
+
+    status="duplicate" means the idempotency_key was already ingested; the
+    ids are the original event's and nothing new was queued.
+    """
+
+    event_id: UUID
+    trace_id: UUID
+    status: Literal["queued", "duplicate"]
+    queue_depth: int
+
+
+class BatchIngestItem(BaseModel):
+    """Outcome of one RawInput in POST /ingest/batch, at its position ``index``."""
+
+    index: int
+    status: Literal["processed", "duplicate", "failed"]
+    event_id: Optional[UUID] = None
+    trace_id: Optional[UUID] = None
+    response: Optional[IngestResponse] = None
+    error: Optional[str] = None
+
+
+class BatchIngestResponse(BaseModel):
+    """HTTP response for POST /ingest/batch — one item per input, in order."""
+
+    items: list[BatchIngestItem]
+
+
 class AmbiguityDecision(str, enum.Enum):
     TOOL_CALL = "tool_call"
     AGENT = "agent"
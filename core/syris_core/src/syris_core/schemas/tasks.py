@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timezone
 from typing import Any, Literal, Optional
 from uuid import UUID, uuid4
@@ -11,10 +12,30 @@ StepStatus = Literal["pending", "running", "completed", "failed", "skipped", "ga
 
 
 class RetryPolicy(BaseModel):
-    """Retry configuration for a task step."""
+    """Retry configuration for a task step.
+
+    backoff_s is the base delay. The default "fixed" strategy waits
+    backoff_s before every retry. With "exponential" attempt n waits
+    backoff_s * 2**(n-1), capped at backoff_max_s. jitter (off by default)
+    spreads each delay uniformly by ±jitter (a fraction) so retries of many
+    tasks failing together do not land in lock-step.
+    """
 
     max_attempts: int = Field(default=3, ge=1)
     backoff_s: float = Field(default=1.0, ge=0.0)
+    backoff_strategy: Literal["fixed", "exponential"] = "fixed"
+    backoff_max_s: float = Field(default=300.0, ge=0.0)
+    jitter: float = Field(default=0.0, ge=0.0, le=1.0)
+
+    def delay_for(self, attempt: int) -> float:
+        """Seconds to wait before retrying after the *attempt*-th failed attempt."""
+        delay = self.backoff_s
+        if self.backoff_strategy == "exponential":
+            delay = self.backoff_s * 2 ** max(attempt - 1, 0)
+        delay = min(delay, self.backoff_max_s)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(delay, 0.0)
 
 
 class TaskStep(BaseModel):
@@ -64,6 +85,7 @@ class Task(BaseModel):
     checkpoint: dict[str, Any] = Field(default_factory=dict)
     retry_policy: RetryPolicy = Field(default_factory=RetryPolicy)
     error: Optional[str] = None
+    not_before: Optional[datetime] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     started_at: Optional[datetime] = None
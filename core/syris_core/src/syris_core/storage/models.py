@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, ClassVar, Optional
 
-from sqlalchemy import Boolean, Column, Index, Integer, Text, UniqueConstraint
+from sqlalchemy import Boolean, Column, Index, Integer, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID as PGUUID
 from sqlmodel import SQLModel, Field
 
@@ -95,8 +95,16 @@ class MessageEventRow(SQLModel, table=True):
     __table_args__: tuple = (
         Index("ix_message_events_trace_id", "trace_id"),
         Index("ix_message_events_thread_id", "thread_id"),
+        # Context window: newest turns of one thread
+        Index("ix_message_events_thread_id_created_at", "thread_id", "created_at"),
         Index("ix_message_events_created_at", "created_at"),
-        Index("ix_message_events_idempotency_key", "idempotency_key"),
+        # Unique among keyed events — the ingest dedupe guard
+        Index(
+            "ux_message_events_idempotency_key",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+        ),
         Index("ix_message_events_parent_event_id", "parent_event_id"),
     )
 
@@ -126,11 +134,60 @@ class MessageEventRow(SQLModel, table=True):
     )
 
 
+class ThreadSummaryRow(SQLModel, table=True):
+    """Rolling LLM summary of a thread's turns older than the context window."""
+
+    __tablename__: ClassVar[str] = "thread_summaries"
+
+    thread_id: uuid.UUID = Field(
+        sa_column=Column(PGUUID(as_uuid=True), primary_key=True),
+    )
+    summary: str = Field(sa_column=Column(Text, nullable=False, server_default=""))
+    # created_at / event_id of the newest message_events row folded in so far
+    covered_through: datetime = Field(
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False),
+    )
+    covered_event_id: uuid.UUID = Field(
+        sa_column=Column(PGUUID(as_uuid=True), nullable=False),
+    )
+    turns_folded: int = Field(default=0, sa_column=Column(Integer, nullable=False, server_default="0"))
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False),
+    )
+
+
+class LLMResponseCacheRow(SQLModel, table=True):
+    """Persistent tier of the LLM response cache (see llm/cache.py)."""
+
+    __tablename__: ClassVar[str] = "llm_response_cache"
+    __table_args__: tuple = (
+        Index("ix_llm_response_cache_expires_at", "expires_at"),
+    )
+
+    cache_key: str = Field(sa_column=Column(Text, primary_key=True))
+    provider: str = Field(sa_column=Column(Text, nullable=False))
+    model: str = Field(sa_column=Column(Text, nullable=False))
+    response: dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False),
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=False),
+    )
+
+
 class TaskRow(SQLModel, table=True):
     __tablename__: ClassVar[str] = "tasks"
     __table_args__: tuple = (
         Index("ix_tasks_status", "status"),
         Index("ix_tasks_trace_id", "trace_id"),
+        Index(
+            "ix_tasks_pending_not_before",
+            "not_before",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     task_id: uuid.UUID = Field(
@@ -165,6 +222,10 @@ class TaskRow(SQLModel, table=True):
     completed_at: Optional[datetime] = Field(
         default=None, sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
     )
+    # Earliest time a pending task may be claimed (deferred retries)
+    not_before: Optional[datetime] = Field(
+        default=None, sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
 
 
 class TaskStepRow(SQLModel, table=True):
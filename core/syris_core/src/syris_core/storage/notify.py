@@ -0,0 +1,223 @@
+"""
+Postgres LISTEN/NOTIFY wakeups for the background loops.
+
+Writers call notify(session, topic) inside their transaction; Postgres
+delivers the notification on commit (and collapses duplicates within one
+transaction). A single WakeupHub per process holds a dedicated asyncpg
+connection LISTENing on WAKEUP_CHANNEL and fans notifications out to
+WakeupSignals, one per consuming loop.
+
+Loops use a signal like this:
+
+    signal.clear()            # before querying, so nothing is missed
+    ... query / do work ...
+    await signal.wait(timeout=seconds_until_next_deadline)
+
+Notifications are a latency optimisation only. Loops keep a polling
+timeout as a safety net, and if the LISTEN connection is unavailable the
+hub reports listening=False and loops fall back to their old poll interval.
+"""
+import asyncio
+import logging
+from typing import Literal, Optional
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+WAKEUP_CHANNEL = "syris_wakeup"
+
+WakeupTopic = Literal["tasks", "schedules", "approvals", "watchers"]
+
+_RECONNECT_MIN_S = 1.0
+_RECONNECT_MAX_S = 30.0
+# Floor for loop sleeps, and the cap it backs off to while a deadline stays overdue
+_MIN_SLEEP_S = 0.1
+_MAX_OVERDUE_SLEEP_S = 5.0
+
+
+class OverdueBackoff:
+    """Sleep floor for a loop whose earliest deadline is already past.
+
+    A deadline still overdue after a pass means that pass claimed nothing
+    for it — typically the row is locked by another process (SKIP LOCKED).
+    Re-checking at a fixed floor would poll until that process commits, so
+    the floor doubles on every consecutive overdue pass, up to *max_s*, and
+    drops back to *min_s* once the deadline is in the future. Notifications
+    still wake the loop immediately.
+    """
+
+    def __init__(self, min_s: float = _MIN_SLEEP_S, max_s: float = _MAX_OVERDUE_SLEEP_S) -> None:
+        self._min_s = min_s
+        self._max_s = max_s
+        self._floor_s = min_s
+
+    def floor(self, next_due: Optional[float]) -> float:
+        """Floor for this sleep, given seconds until the next deadline."""
+        if next_due is None or next_due > 0:
+            self._floor_s = self._min_s
+            return self._min_s
+        floor_s = self._floor_s
+        self._floor_s = min(floor_s * 2, self._max_s)
+        return floor_s
+
+    def reset(self) -> None:
+        """The loop made progress; next overdue pass starts from *min_s* again."""
+        self._floor_s = self._min_s
+
+
+def wakeup_timeout(
+    signal: Optional["WakeupSignal"],
+    next_due: Optional[float],
+    *,
+    poll_s: float,
+    safety_poll_s: float,
+    overdue: Optional[OverdueBackoff] = None,
+) -> float:
+    """How long a loop should sleep before re-checking.
+
+    *next_due* is the number of seconds until the loop's earliest known
+    deadline (None if it has none). While notifications are flowing the loop
+    only needs to wake for that deadline or the safety-net poll; otherwise it
+    keeps its regular poll interval. With *overdue*, an overdue deadline
+    raises the sleep floor exponentially instead of re-polling at a fixed rate.
+    """
+    timeout = safety_poll_s if signal is not None and signal.listening else poll_s
+    if next_due is not None:
+        timeout = min(timeout, next_due)
+    floor_s = overdue.floor(next_due) if overdue is not None else _MIN_SLEEP_S
+    return max(timeout, floor_s)
+
+
+async def notify(session: AsyncSession, topic: WakeupTopic) -> None:
+    """Queue a wakeup for *topic*; delivered when the session commits."""
+    await session.execute(
+        text("SELECT pg_notify(:channel, :topic)"),
+        {"channel": WAKEUP_CHANNEL, "topic": topic},
+    )
+
+
+class WakeupSignal:
+    """Per-consumer wakeup flag, set by the hub when a subscribed topic fires."""
+
+    def __init__(self, hub: "WakeupHub", topics: frozenset[str]) -> None:
+        self._hub = hub
+        self.topics = topics
+        self._event = asyncio.Event()
+
+    @property
+    def listening(self) -> bool:
+        """True while notifications are actually being delivered."""
+        return self._hub.listening
+
+    def set(self) -> None:
+        self._event.set()
+
+    def clear(self) -> None:
+        self._event.clear()
+
+    async def wait(self, timeout: float) -> bool:
+        """Sleep until woken or *timeout* elapses. Returns True if woken."""
+        if timeout <= 0:
+            return self._event.is_set()
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+class WakeupHub:
+    """Owns the LISTEN connection and dispatches topics to WakeupSignals."""
+
+    def __init__(self, database_url: str) -> None:
+        # SQLAlchemy URL (postgresql+asyncpg://) -> plain libpq DSN for asyncpg
+        self._dsn = (
+            make_url(database_url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._signals: list[WakeupSignal] = []
+        self._conn: Optional[asyncpg.Connection] = None
+        self._lost = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    def subscribe(self, *topics: WakeupTopic) -> WakeupSignal:
+        signal = WakeupSignal(self, frozenset(topics))
+        self._signals.append(signal)
+        return signal
+
+    async def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(), name="wakeup_hub")
+        logger.info("WakeupHub started (channel=%s)", WAKEUP_CHANNEL)
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        self._stop_event.set()
+        self._lost.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+        logger.info("WakeupHub stopped")
+
+    async def _run(self) -> None:
+        backoff = _RECONNECT_MIN_S
+        while not self._stop_event.is_set():
+            try:
+                await self._listen()
+                backoff = _RECONNECT_MIN_S
+            except Exception as exc:
+                logger.warning(
+                    "WakeupHub LISTEN unavailable (%s) — loops fall back to polling; retry in %ss",
+                    exc,
+                    backoff,
+                )
+            finally:
+                await self._close()
+
+            # Anything may have changed while we were deaf — let every loop re-check
+            self._wake_all()
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            backoff = min(backoff * 2, _RECONNECT_MAX_S)
+
+    async def _listen(self) -> None:
+        self._lost.clear()
+        self._conn = await asyncpg.connect(self._dsn)
+        self._conn.add_termination_listener(lambda _conn: self._lost.set())
+        await self._conn.add_listener(WAKEUP_CHANNEL, self._on_notify)
+        logger.info("WakeupHub listening on %s", WAKEUP_CHANNEL)
+        await self._lost.wait()
+
+    async def _close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None or conn.is_closed():
+            return
+        try:
+            await conn.close(timeout=5)
+        except Exception:
+            conn.terminate()
+
+    def _on_notify(self, _conn: object, _pid: int, _channel: str, payload: str) -> None:
+        for signal in self._signals:
+            if payload in signal.topics:
+                signal.set()
+
+    def _wake_all(self) -> None:
+        for signal in self._signals:
+            signal.set()
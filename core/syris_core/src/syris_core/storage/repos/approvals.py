@@ -7,6 +7,7 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import ApprovalRow
+from ..notify import notify
 from ...schemas.safety import Approval
 
 
@@ -38,6 +39,7 @@ class ApprovalRepo:
         )
         self._session.add(row)
         await self._session.flush()
+        await notify(self._session, "approvals")
         return row
 
     async def get(self, approval_id: uuid.UUID) -> Optional[ApprovalRow]:
@@ -97,3 +99,4 @@ class ApprovalRepo:
             )
         )
         await self._session.execute(stmt)
+        await notify(self._session, "approvals")
@@ -1,8 +1,10 @@
 """MessageEvent repository — data access only, no business logic."""
 import uuid
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import MessageEventRow
@@ -17,22 +19,92 @@ class EventRepo:
 
     async def create(self, event: MessageEvent) -> MessageEventRow:
         """Persist a MessageEvent. Returns the inserted ORM row."""
-        row = MessageEventRow(
-            event_id=event.event_id,
-            trace_id=event.trace_id,
-            thread_id=event.thread_id,
-            created_at=event.created_at,
-            source=event.source,
-            content=event.content,
-            structured=event.structured,
-            content_type=event.content_type,
-            idempotency_key=event.idempotency_key,
-            parent_event_id=event.parent_event_id,
-        )
+        row = MessageEventRow(**_row_values(event))
         self._session.add(row)
         await self._session.flush()
         return row
 
+    async def create_or_get(self, event: MessageEvent) -> tuple[MessageEventRow, bool]:
+        """
+        Insert *event* unless another event already holds its idempotency_key.
+
+        Returns (row, created). When created is False, row is the existing
+        event that owns the key. Events without a key are always inserted.
+        """
+        if event.idempotency_key is None:
+            return await self.create(event), True
+
+        stmt = (
+            pg_insert(MessageEventRow)
+            .values(**_row_values(event))
+            .on_conflict_do_nothing(
+                index_elements=["idempotency_key"],
+                index_where=text("idempotency_key IS NOT NULL"),
+            )
+            .returning(MessageEventRow)
+        )
+        result = await self._session.execute(stmt)
+        row = result.scalar_one_or_none()
+        if row is not None:
+            return row, True
+
+        existing = await self.get_by_idempotency_key(event.idempotency_key)
+        assert existing is not None, "conflict on idempotency_key but no row found"
+        return existing, False
+
+    async def create_or_get_many(
+        self, events: list[MessageEvent]
+    ) -> list[tuple[MessageEventRow, bool]]:
+        """
+        create_or_get() for several events in one multi-row INSERT.
+
+        Returns (row, created) per event, in input order. An event whose
+        idempotency_key is taken — by an existing row or by an earlier event
+        in the same batch — gets that row back with created=False.
+        """
+        if not events:
+            return []
+        stmt = (
+            pg_insert(MessageEventRow)
+            .values([_row_values(event) for event in events])
+            .on_conflict_do_nothing(
+                index_elements=["idempotency_key"],
+                index_where=text("idempotency_key IS NOT NULL"),
+            )
+            .returning(MessageEventRow)
+        )
+        result = await self._session.execute(stmt)
+        inserted = {row.event_id: row for row in result.scalars().all()}
+
+        missing_keys = {
+            event.idempotency_key
+            for event in events
+            if event.event_id not in inserted and event.idempotency_key is not None
+        }
+        existing: dict[str, MessageEventRow] = {}
+        if missing_keys:
+            rows = await self._session.execute(
+                select(MessageEventRow).where(MessageEventRow.idempotency_key.in_(missing_keys))
+            )
+            existing = {row.idempotency_key: row for row in rows.scalars().all()}
+
+        out: list[tuple[MessageEventRow, bool]] = []
+        for event in events:
+            row = inserted.get(event.event_id)
+            if row is not None:
+                out.append((row, True))
+                continue
+            assert event.idempotency_key is not None, "keyless event was not inserted"
+            owner = existing.get(event.idempotency_key)
+            assert owner is not None, "conflict on idempotency_key but no row found"
+            out.append((owner, False))
+        return out
+
+    async def get_by_idempotency_key(self, key: str) -> Optional[MessageEventRow]:
+        stmt = select(MessageEventRow).where(MessageEventRow.idempotency_key == key)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get(self, event_id: uuid.UUID) -> Optional[MessageEventRow]:
         return await self._session.get(MessageEventRow, event_id)
 
@@ -53,13 +125,56 @@ class EventRepo:
         self,
         thread_id: uuid.UUID,
         limit: int = 50,
+        *,
+        before: Optional[datetime] = None,
+        after: Optional[tuple[datetime, uuid.UUID]] = None,
+        newest: bool = True,
     ) -> list[MessageEventRow]:
-        """Return events in a thread, oldest first (chronological order)."""
-        stmt = (
-            select(MessageEventRow)
-            .where(MessageEventRow.thread_id == thread_id)
-            .order_by(MessageEventRow.created_at.asc())
-            .limit(limit)
+        """Return up to *limit* events in a thread, oldest first (chronological order).
+
+        With newest=True (the default) these are the *limit* most recent
+        events; newest=False takes the oldest ones instead. *before* bounds
+        created_at exclusively. *after* is a (created_at, event_id) keyset
+        cursor: only events ordered after that one are returned, including
+        ones that share its created_at.
+        """
+        stmt = select(MessageEventRow).where(MessageEventRow.thread_id == thread_id)
+        if before is not None:
+            stmt = stmt.where(MessageEventRow.created_at < before)
+        if after is not None:
+            after_at, after_id = after
+            stmt = stmt.where(
+                or_(
+                    MessageEventRow.created_at > after_at,
+                    and_(
+                        MessageEventRow.created_at == after_at,
+                        MessageEventRow.event_id > after_id,
+                    ),
+                )
+            )
+        order = (
+            (MessageEventRow.created_at.desc(), MessageEventRow.event_id.desc())
+            if newest
+            else (MessageEventRow.created_at.asc(), MessageEventRow.event_id.asc())
         )
+        stmt = stmt.order_by(*order).limit(limit)
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        rows = list(result.scalars().all())
+        if newest:
+            rows.reverse()
+        return rows
+
+
+def _row_values(event: MessageEvent) -> dict:
+    return dict(
+        event_id=event.event_id,
+        trace_id=event.trace_id,
+        thread_id=event.thread_id,
+        created_at=event.created_at,
+        source=event.source,
+        content=event.content,
+        structured=event.structured,
+        content_type=event.content_type,
+        idempotency_key=event.idempotency_key,
+        parent_event_id=event.parent_event_id,
+    )
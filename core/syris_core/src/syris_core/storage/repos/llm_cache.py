@@ -0,0 +1,57 @@
+"""LLM response cache repository — data access only, no business logic."""
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import LLMResponseCacheRow
+
+
+class LLMCacheRepo:
+    """Thin data-access wrapper for the llm_response_cache table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, cache_key: str) -> Optional[LLMResponseCacheRow]:
+        """Return the entry for *cache_key* unless it has expired."""
+        stmt = select(LLMResponseCacheRow).where(
+            LLMResponseCacheRow.cache_key == cache_key,
+            LLMResponseCacheRow.expires_at > datetime.now(timezone.utc),
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def put(
+        self,
+        cache_key: str,
+        *,
+        provider: str,
+        model: str,
+        response: dict[str, Any],
+        expires_at: datetime,
+    ) -> None:
+        """Insert or overwrite the entry for *cache_key*."""
+        values = dict(
+            cache_key=cache_key,
+            provider=provider,
+            model=model,
+            response=response,
+            created_at=datetime.now(timezone.utc),
+            expires_at=expires_at,
+        )
+        stmt = pg_insert(LLMResponseCacheRow).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["cache_key"],
+            set_={k: stmt.excluded[k] for k in values if k != "cache_key"},
+        )
+        await self._session.execute(stmt)
+
+    async def delete_expired(self) -> int:
+        stmt = delete(LLMResponseCacheRow).where(
+            LLMResponseCacheRow.expires_at <= datetime.now(timezone.utc)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
@@ -45,6 +45,16 @@ class RuleRepo:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def increment_suppression(self, rule_id: UUID) -> None:
+        await self._session.execute(
+            update(RuleRow)
+            .where(RuleRow.rule_id == rule_id)
+            .values(
+                suppression_count=RuleRow.suppression_count + 1,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+
     async def claim_for_fire(self, rule_id: UUID, now: datetime) -> Optional[RuleRow]:
         """Atomically check debounce and claim this rule for firing.
 
@@ -2,10 +2,11 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import ScheduleRow
+from ..notify import notify as _notify
 
 
 class ScheduleRepo:
@@ -15,6 +16,7 @@ class ScheduleRepo:
     async def create(self, row: ScheduleRow) -> ScheduleRow:
         self._session.add(row)
         await self._session.flush()
+        await _notify(self._session, "schedules")
         return row
 
     async def get(self, schedule_id: UUID) -> Optional[ScheduleRow]:
@@ -37,12 +39,28 @@ class ScheduleRepo:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def next_due_at(self) -> Optional[datetime]:
+        """Earliest next_run_at across enabled schedules, or None if none are pending."""
+        stmt = (
+            select(func.min(ScheduleRow.next_run_at))
+            .where(ScheduleRow.enabled == True)  # noqa: E712
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def find_by_name(self, name: str) -> list[ScheduleRow]:
         stmt = select(ScheduleRow).where(ScheduleRow.name == name)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
-    async def update_fields(self, schedule_id: UUID, **fields: Any) -> Optional[ScheduleRow]:
+    async def update_fields(
+        self, schedule_id: UUID, *, notify: bool = True, **fields: Any
+    ) -> Optional[ScheduleRow]:
+        """Update *fields* on one row.
+
+        notify=False skips the wakeup; the schedules loop passes it for its own
+        bookkeeping writes so it doesn't wake itself.
+        """
         fields["updated_at"] = datetime.now(timezone.utc)
         stmt = (
             update(ScheduleRow)
@@ -51,4 +69,7 @@ class ScheduleRepo:
             .returning(ScheduleRow)
         )
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        row = result.scalar_one_or_none()
+        if row is not None and notify:
+            await _notify(self._session, "schedules")
+        return row
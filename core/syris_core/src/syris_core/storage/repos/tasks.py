@@ -3,13 +3,19 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import TaskRow, TaskStepRow
+from ..notify import notify
 from ...schemas.tasks import RetryPolicy, Task, TaskStep
 
 
+def _claimable(now: datetime):
+    """Filter for pending tasks whose deferral (if any) has elapsed."""
+    return or_(TaskRow.not_before == None, TaskRow.not_before <= now)  # noqa: E711
+
+
 class TaskRepo:
     """Thin data-access wrapper for the tasks and task_steps tables."""
 
@@ -35,9 +41,12 @@ class TaskRepo:
             updated_at=task.updated_at,
             started_at=task.started_at,
             completed_at=task.completed_at,
+            not_before=task.not_before,
         )
         self._session.add(row)
         await self._session.flush()
+        if row.status == "pending":
+            await notify(self._session, "tasks")
         return row
 
     async def create_step(self, step: TaskStep) -> TaskStepRow:
@@ -65,27 +74,103 @@ class TaskRepo:
         await self._session.flush()
         return row
 
-    async def claim_one(self) -> Optional[TaskRow]:
+    async def claim_batch(self, limit: int, now: datetime) -> list[TaskRow]:
         """
-        Atomically claim one pending task.
+        Atomically claim up to *limit* pending tasks in one round-trip.
 
-        Uses FOR UPDATE SKIP LOCKED so that concurrent workers never
-        double-claim the same task.  Returns None if no pending task exists.
+        The inner SELECT takes row locks with SKIP LOCKED, so concurrent
+        claimers partition the queue between them; the outer UPDATE marks the
+        rows running and RETURNs them. Rows come back oldest-first. Tasks
+        deferred until a future not_before are skipped. started_at keeps the
+        first claim's time when a deferred task is claimed again.
         """
-        stmt = (
-            select(TaskRow)
+        pending = (
+            select(TaskRow.task_id)
             .where(TaskRow.status == "pending")
+            .where(_claimable(now))
             .order_by(TaskRow.created_at)
-            .limit(1)
+            .limit(limit)
             .with_for_update(skip_locked=True)
         )
+        stmt = (
+            update(TaskRow)
+            .where(TaskRow.task_id.in_(pending))
+            .values(
+                status="running",
+                started_at=func.coalesce(TaskRow.started_at, now),
+                updated_at=now,
+                not_before=None,
+            )
+            .returning(TaskRow)
+        )
+        result = await self._session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda row: row.created_at)
+
+    async def defer(self, task_id: uuid.UUID, not_before: datetime) -> bool:
+        """
+        Return a running task to pending, unclaimable until *not_before*.
+
+        Returns False if the task was no longer running (e.g. cancelled).
+        """
+        stmt = (
+            update(TaskRow)
+            .where(TaskRow.task_id == task_id)
+            .where(TaskRow.status == "running")
+            .values(
+                status="pending",
+                not_before=not_before,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(TaskRow.task_id)
+        )
+        result = await self._session.execute(stmt)
+        deferred = result.scalar_one_or_none() is not None
+        if deferred:
+            # Wake idle claimers so they re-arm their timers for the new deadline
+            await notify(self._session, "tasks")
+        return deferred
+
+    async def next_not_before(self, now: datetime) -> Optional[datetime]:
+        """Earliest not_before among pending tasks still deferred past *now*."""
+        stmt = (
+            select(func.min(TaskRow.not_before))
+            .where(TaskRow.status == "pending")
+            .where(TaskRow.not_before > now)
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def release_claimed(self, task_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """
+        Return claimed-but-unstarted tasks to pending.
+
+        Only rows still in ``running`` are touched. Returns the ids released.
+        """
+        if not task_ids:
+            return []
+        stmt = (
+            update(TaskRow)
+            .where(TaskRow.task_id.in_(task_ids))
+            .where(TaskRow.status == "running")
+            .values(status="pending", updated_at=datetime.now(timezone.utc))
+            .returning(TaskRow.task_id)
+        )
+        result = await self._session.execute(stmt)
+        released = list(result.scalars().all())
+        if released:
+            await notify(self._session, "tasks")
+        return released
+
     async def get_task(self, task_id: uuid.UUID) -> Optional[TaskRow]:
         """Return a TaskRow by PK or None."""
         return await self._session.get(TaskRow, task_id)
 
+    async def get_task_status(self, task_id: uuid.UUID) -> Optional[str]:
+        """Return only the status column for a task, or None if it does not exist."""
+        stmt = select(TaskRow.status).where(TaskRow.task_id == task_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_steps(self, task_id: uuid.UUID) -> list[TaskStepRow]:
         """Return all steps for a task ordered by step_index."""
         stmt = (
@@ -122,6 +207,8 @@ class TaskRepo:
             .values(**values)
         )
         await self._session.execute(stmt)
+        if status == "pending":
+            await notify(self._session, "tasks")
 
     async def update_step_status(
         self,
@@ -0,0 +1,47 @@
+"""Thread summary repository — data access only, no business logic."""
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import ThreadSummaryRow
+
+
+class ThreadSummaryRepo:
+    """Thin data-access wrapper for the thread_summaries table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, thread_id: uuid.UUID) -> Optional[ThreadSummaryRow]:
+        return await self._session.get(ThreadSummaryRow, thread_id)
+
+    async def upsert(
+        self,
+        thread_id: uuid.UUID,
+        summary: str,
+        covered_through: datetime,
+        covered_event_id: uuid.UUID,
+        turns_folded: int,
+    ) -> ThreadSummaryRow:
+        """Create or replace the summary for *thread_id*. Returns the row."""
+        row = await self._session.get(ThreadSummaryRow, thread_id)
+        if row is None:
+            row = ThreadSummaryRow(
+                thread_id=thread_id,
+                summary=summary,
+                covered_through=covered_through,
+                covered_event_id=covered_event_id,
+                turns_folded=turns_folded,
+                updated_at=datetime.now(timezone.utc),
+            )
+            self._session.add(row)
+        else:
+            row.summary = summary
+            row.covered_through = covered_through
+            row.covered_event_id = covered_event_id
+            row.turns_folded = turns_folded
+            row.updated_at = datetime.now(timezone.utc)
+        await self._session.flush()
+        return row
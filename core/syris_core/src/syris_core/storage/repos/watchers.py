@@ -5,6 +5,7 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import WatcherStateRow
+from ..notify import notify as _notify
 
 
 class WatcherStateRepo:
@@ -26,7 +27,14 @@ class WatcherStateRepo:
         result = await self._session.execute(select(WatcherStateRow))
         return list(result.scalars().all())
 
-    async def update_fields(self, watcher_id: str, **fields: Any) -> Optional[WatcherStateRow]:
+    async def update_fields(
+        self, watcher_id: str, *, notify: bool = True, **fields: Any
+    ) -> Optional[WatcherStateRow]:
+        """Update *fields* on one row.
+
+        notify=False skips the wakeup; the watchers loop passes it for its own
+        bookkeeping writes so it doesn't wake itself.
+        """
         fields["updated_at"] = datetime.now(timezone.utc)
         stmt = (
             update(WatcherStateRow)
@@ -35,4 +43,7 @@ class WatcherStateRepo:
             .returning(WatcherStateRow)
         )
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        row = result.scalar_one_or_none()
+        if row is not None and notify:
+            await _notify(self._session, "watchers")
+        return row
@@ -3,7 +3,7 @@ Task engine — claim → execute → checkpoint loop.
 
 The engine is the public API for the task subsystem. It:
 - Accepts task submissions (persisting them to DB as pending).
-- Claims one pending task at a time via FOR UPDATE SKIP LOCKED.
+- Claims pending tasks (singly or in batches) via FOR UPDATE SKIP LOCKED.
 - Drives each step in order using StepRunner.
 - Handles operator actions: cancel, pause, resume.
 
@@ -18,18 +18,19 @@ StepHandler protocol
 A StepHandler is any async callable with signature:
     async def handler(input_payload: dict[str, Any]) -> dict[str, Any]
 """
-import asyncio
 import logging
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Coroutine, Optional
 
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..observability.audit import AuditWriter
 from ..safety.gates import GateChecker
 from ..schemas.tasks import RetryPolicy, StepSpec, Task, TaskStep, TaskSubmit
 from ..storage.db import session_scope
+from ..storage.models import TaskRow, TaskStepRow
 from ..storage.repos.tasks import TaskRepo
 from .state import IllegalStateTransition, assert_task_transition
 from .step_runner import StepRunner
@@ -63,7 +64,7 @@ class TaskEngine:
         self._audit = audit
         self._handlers = handlers
         self._gate_checker = gate_checker
-        self._runner = StepRunner(audit, gate_checker=gate_checker)
+        self._runner = StepRunner(audit, session_maker, gate_checker=gate_checker)
 
     # -------------------------------------------------------------------------
     # Public API
@@ -118,17 +119,25 @@ class TaskEngine:
 
         Returns True if a task was found and run, False if the queue is empty.
         """
+        claimed = await self.claim_batch(1)
+        if not claimed:
+            return False
+        await self.run_claimed(claimed[0])
+        return True
+
+    async def claim_batch(self, limit: int) -> list[TaskRow]:
+        """
+        Claim up to *limit* pending tasks in a single UPDATE ... RETURNING.
+
+        Claimed tasks are ``running`` in the DB but not yet executing; pass
+        each one to run_claimed(), or hand unstarted ones back with
+        release_claimed().
+        """
+        now = datetime.now(timezone.utc)
         async with session_scope(self._session_maker) as session:
-            repo = TaskRepo(session)
-            task_row = await repo.claim_one()
-            if task_row is None:
-                return False
+            claimed = await TaskRepo(session).claim_batch(limit, now)
 
-            now = datetime.now(timezone.utc)
-            assert_task_transition(task_row.status, "running")
-            await repo.update_task_status(
-                task_row.task_id, "running", started_at=now
-            )
+        for task_row in claimed:
             await self._audit.emit(
                 task_row.trace_id,
                 stage="task",
@@ -137,11 +146,37 @@ class TaskEngine:
                 outcome="info",
                 ref_task_id=task_row.task_id,
             )
+        if claimed:
+            logger.debug("task.claim_batch claimed=%d limit=%d", len(claimed), limit)
+        return claimed
 
+    async def run_claimed(self, task_row: TaskRow) -> None:
+        """Run a task previously returned by claim_batch() to a terminal state."""
         # Run the task outside the claim transaction so that step updates
         # are individually committed (enabling crash recovery at step boundaries).
         await self._run_task(task_row.task_id, task_row.trace_id)
-        return True
+
+    async def release_claimed(self, task_rows: list[TaskRow]) -> None:
+        """Return claimed tasks that were never started to the pending queue."""
+        if not task_rows:
+            return
+        async with session_scope(self._session_maker) as session:
+            released = set(
+                await TaskRepo(session).release_claimed([row.task_id for row in task_rows])
+            )
+
+        for task_row in task_rows:
+            if task_row.task_id not in released:
+                continue
+            await self._audit.emit(
+                task_row.trace_id,
+                stage="task",
+                type="task.released",
+                summary=f"Task {task_row.task_id} released unstarted — returned to pending queue",
+                outcome="info",
+                ref_task_id=task_row.task_id,
+            )
+        logger.info("task.released count=%d", len(released))
 
     async def cancel(self, task_id: uuid.UUID, trace_id: uuid.UUID) -> None:
         """Cancel a pending or running task."""
@@ -203,57 +238,76 @@ class TaskEngine:
             ref_task_id=task_id,
         )
 
+    async def next_deferred_at(self) -> Optional[datetime]:
+        """Earliest time a deferred (retrying) task becomes claimable, if any."""
+        async with session_scope(self._session_maker) as session:
+            return await TaskRepo(session).next_not_before(datetime.now(timezone.utc))
+
     # -------------------------------------------------------------------------
     # Internal
     # -------------------------------------------------------------------------
 
     async def _run_task(self, task_id: uuid.UUID, trace_id: uuid.UUID) -> None:
-        """Drive all pending/running steps in order until the task reaches terminal state."""
-        retry_policy: RetryPolicy | None = None
+        """Drive all pending/running steps in order until the task reaches terminal state.
+
+        The task row and step list are loaded once. Progress is tracked with an
+        in-memory cursor into the ordered steps, advanced as each step reaches
+        completed/skipped; StepRunner's returned row replaces the cached one so
+        the cursor always sees the committed state. Between steps only the task
+        status column is re-read, so operator cancel/pause is still honoured
+        without re-reading every step (which made long tasks O(steps²)).
+        """
+        async with session_scope(self._session_maker) as session:
+            repo = TaskRepo(session)
+            task_row = await repo.get_task(task_id)
+            if task_row is None:
+                logger.error("task._run_task task_id=%s not found", task_id)
+                return
+            if task_row.status in ("cancelled", "paused"):
+                logger.info(
+                    "task._run_task task_id=%s halted — status=%s",
+                    task_id,
+                    task_row.status,
+                )
+                return
+            retry_policy = RetryPolicy(**task_row.retry_policy)
+            steps = await repo.get_steps(task_id)
 
-        while True:
-            async with session_scope(self._session_maker) as session:
-                repo = TaskRepo(session)
-                task_row = await repo.get_task(task_id)
-                if task_row is None:
-                    logger.error("task._run_task task_id=%s not found", task_id)
-                    return
+        cursor = 0
+        status_fresh = True  # status was just read with the task row
 
-                # Operator may have cancelled/paused between steps
-                if task_row.status in ("cancelled", "paused"):
-                    logger.info(
-                        "task._run_task task_id=%s halted — status=%s",
-                        task_id,
-                        task_row.status,
-                    )
-                    return
+        while True:
+            while cursor < len(steps) and steps[cursor].status in ("completed", "skipped"):
+                cursor += 1
 
-                if retry_policy is None:
-                    retry_policy = RetryPolicy(**task_row.retry_policy)
+            if cursor == len(steps):
+                # All steps completed
+                await self._complete_task(task_id, trace_id)
+                return
 
-                steps = await repo.get_steps(task_id)
+            next_step = steps[cursor]
+            if next_step.status == "gated":
+                # Step is awaiting approval — pause the task
+                await self._gate_task(task_id, trace_id, next_step)
+                return
+            if next_step.status == "failed":
+                # A failed step means the task fails
+                await self._fail_task(task_id, trace_id, next_step)
+                return
 
-            # Find the next step to execute
-            next_step = None
-            for step in steps:
-                if step.status == "completed" or step.status == "skipped":
-                    continue
-                if step.status in ("pending", "running"):
-                    next_step = step
-                    break
-                if step.status == "gated":
-                    # Step is awaiting approval — pause the task
-                    await self._gate_task(task_id, trace_id, step)
+            # Operator may have cancelled/paused between steps
+            if not status_fresh:
+                async with session_scope(self._session_maker) as session:
+                    status = await TaskRepo(session).get_task_status(task_id)
+                if status is None:
+                    logger.error("task._run_task task_id=%s not found", task_id)
                     return
-                if step.status == "failed":
-                    # A failed step means the task fails
-                    await self._fail_task(task_id, trace_id, step)
+                if status in ("cancelled", "paused"):
+                    logger.info(
+                        "task._run_task task_id=%s halted — status=%s", task_id, status
+                    )
                     return
-
-            if next_step is None:
-                # All steps completed
-                await self._complete_task(task_id, trace_id)
-                return
+            status_fresh = False
 
             # Execute the step
             handler = self._handlers.get(next_step.tool_name)
@@ -266,39 +320,78 @@ class TaskEngine:
                 )
                 return
 
-            async with session_scope(self._session_maker) as session:
-                step_row = await session.get(type(next_step), next_step.step_id)
-                if step_row is None:
-                    logger.error(
-                        "task._run_task step_id=%s not found", next_step.step_id
-                    )
-                    return
-
-                # Reset step to pending if it somehow got into running state
-                # (happens after recovery reset; step_runner will transition it)
-                if step_row.status == "running":
-                    from ..storage.models import TaskStepRow
-                    from sqlalchemy import update as sa_update
+            step_row = next_step
+            # Reset step to pending if it somehow got into running state
+            # (happens after recovery reset; step_runner will transition it)
+            if step_row.status == "running":
+                async with session_scope(self._session_maker) as session:
                     stmt = (
                         sa_update(TaskStepRow)
                         .where(TaskStepRow.step_id == step_row.step_id)
                         .values(status="pending", updated_at=datetime.now(timezone.utc))
                     )
                     await session.execute(stmt)
-                    await session.refresh(step_row)
+                    step_row = await session.get(
+                        TaskStepRow, step_row.step_id, populate_existing=True
+                    )
+                if step_row is None:
+                    logger.error(
+                        "task._run_task step_id=%s not found", next_step.step_id
+                    )
+                    return
 
-                updated_step = await self._runner.run(
-                    task_row=task_row,
-                    step_row=step_row,
-                    handler=handler,
-                    session=session,
-                )
+            # No session is held here — StepRunner uses short transactions so
+            # the handler call does not pin a pooled connection.
+            updated_step = await self._runner.run(
+                task_row=task_row,
+                step_row=step_row,
+                handler=handler,
+            )
+            steps[cursor] = updated_step
 
             if updated_step.status == "pending":
-                # Retry scheduled — apply backoff before looping
-                backoff = retry_policy.backoff_s
-                if backoff > 0:
-                    await asyncio.sleep(backoff)
+                # Retry scheduled — rather than sleeping on the claim slot,
+                # hand the task back to the queue until the backoff elapses.
+                delay = retry_policy.delay_for(updated_step.attempt_count)
+                if delay > 0:
+                    await self._defer_task(task_id, trace_id, updated_step, delay)
+                    return
+
+    async def _defer_task(
+        self,
+        task_id: uuid.UUID,
+        trace_id: uuid.UUID,
+        retry_step: Any,
+        delay_s: float,
+    ) -> None:
+        """Release a running task to pending with not_before = now + delay_s."""
+        not_before = datetime.now(timezone.utc) + timedelta(seconds=delay_s)
+        assert_task_transition("running", "pending")
+        async with session_scope(self._session_maker) as session:
+            deferred = await TaskRepo(session).defer(task_id, not_before)
+        if not deferred:
+            # Operator cancelled/paused while the step was running
+            return
+
+        await self._audit.emit(
+            trace_id,
+            stage="task",
+            type="task.retry_deferred",
+            summary=(
+                f"Task {task_id} step {retry_step.step_index} ({retry_step.tool_name}) "
+                f"retry deferred {delay_s:.1f}s until {not_before.isoformat()}"
+            ),
+            outcome="info",
+            ref_task_id=task_id,
+            ref_step_id=retry_step.step_id,
+            tool_name=retry_step.tool_name,
+        )
+        logger.info(
+            "task.retry_deferred task_id=%s step=%s delay_s=%.2f",
+            task_id,
+            retry_step.step_index,
+            delay_s,
+        )
 
     async def _gate_task(
         self,
@@ -15,6 +15,10 @@ _TASK_TRANSITIONS: dict[tuple[str, str], str] = {
     ("running", "failed"): "step failed unrecoverably",
     ("running", "paused"): "operator pause",
     ("running", "cancelled"): "operator cancel from running",
+    ("running", "pending"): (
+        "released back to the queue — claimed but never started, "
+        "or a step retry deferred until not_before"
+    ),
     ("paused", "running"): "operator resume",
     ("paused", "cancelled"): "operator cancel from paused",
 }
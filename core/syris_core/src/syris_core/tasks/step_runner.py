@@ -17,6 +17,15 @@ API, the step is reset to ``"pending"`` and the task is re-queued. On the
 second run, the gate check finds an existing approved approval and returns
 ALLOW, allowing execution to proceed.
 
+Transactions
+------------
+The runner never holds a DB connection while the handler runs. Each state
+change ("gated"/"failed" from the gate, "running" before the call, and the
+recorded outcome after it) is its own short session_scope, so pool occupancy
+does not scale with tool latency (an LLM-backed step can take tens of
+seconds). A crash between "running" and the outcome leaves the step running;
+TaskRecovery resets it to pending on the next boot.
+
 Idempotency: each step carries an idempotency_key of the form
 ``{task_id}:{step_index}``. The key is stable across retry attempts so that
 if a prior attempt actually completed its side-effect but died before recording
@@ -31,10 +40,11 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..observability.audit import AuditWriter
 from ..safety.gates import GateChecker
+from ..storage.db import session_scope
 from ..storage.models import TaskRow, TaskStepRow
 from ..storage.repos.tasks import TaskRepo
 from .state import assert_step_transition
@@ -61,9 +71,11 @@ class StepRunner:
     def __init__(
         self,
         audit: AuditWriter,
+        session_maker: async_sessionmaker[AsyncSession],
         gate_checker: Optional[GateChecker] = None,
     ) -> None:
         self._audit = audit
+        self._session_maker = session_maker
         self._gate_checker = gate_checker
 
     async def run(
@@ -71,17 +83,15 @@ class StepRunner:
         task_row: TaskRow,
         step_row: TaskStepRow,
         handler: "StepHandler",
-        session: AsyncSession,
     ) -> TaskStepRow:
         """
         Execute one step attempt.
 
-        Returns the updated step row (status will be completed, failed, pending
+        *task_row* and *step_row* may be detached; they are only read. Returns
+        a freshly loaded step row (status will be completed, failed, pending
         if a retry is scheduled, or gated if awaiting approval).
         Raises nothing — all outcomes are recorded in DB.
         """
-        repo = TaskRepo(session)
-
         # Gate check before execution (only for pending steps)
         if self._gate_checker is not None and step_row.status == "pending":
             gate_decision = await self._gate_checker.check(
@@ -100,13 +110,11 @@ class StepRunner:
             )
 
             if gate_decision.action == "HARD_BLOCK":
-                await repo.update_step_status(
+                return await self._record(
                     step_row.step_id,
                     "failed",
                     error="Gate hard-blocked this step",
                 )
-                await session.refresh(step_row)
-                return step_row
 
             if gate_decision.action in ("CONFIRM", "PREVIEW"):
                 assert_step_transition(step_row.status, "gated")
@@ -115,20 +123,18 @@ class StepRunner:
                     if gate_decision.approval
                     else None
                 )
-                await repo.update_step_status(
+                return await self._record(
                     step_row.step_id,
                     "gated",
                     pending_approval_id=approval_id,
                 )
-                await session.refresh(step_row)
-                return step_row
 
             # action == "ALLOW" — fall through to execution
 
         now = datetime.now(timezone.utc)
 
         assert_step_transition(step_row.status, "running")
-        await repo.update_step_status(
+        await self._record(
             step_row.step_id,
             "running",
             attempt_count=step_row.attempt_count + 1,
@@ -185,7 +191,7 @@ class StepRunner:
         if output_payload is not None:
             # Success
             assert_step_transition("running", "completed")
-            await repo.update_step_status(
+            updated = await self._record(
                 step_row.step_id,
                 "completed",
                 output_payload=output_payload,
@@ -210,7 +216,7 @@ class StepRunner:
             if attempt >= step_row.max_attempts:
                 # Exhausted retries — permanently fail this step
                 assert_step_transition("running", "failed")
-                await repo.update_step_status(
+                updated = await self._record(
                     step_row.step_id,
                     "failed",
                     error=error_msg,
@@ -232,7 +238,7 @@ class StepRunner:
             else:
                 # Schedule retry — reset to pending
                 assert_step_transition("running", "pending")
-                await repo.update_step_status(
+                updated = await self._record(
                     step_row.step_id,
                     "pending",
                     error=error_msg,
@@ -251,8 +257,16 @@ class StepRunner:
                     ref_step_id=step_row.step_id,
                     tool_name=step_row.tool_name,
                 )
-                # Wait backoff before re-running (honour retry_policy from caller)
 
-        # Refresh and return step row
-        await session.refresh(step_row)
-        return step_row
+        return updated
+
+    async def _record(self, step_id: Any, status: str, **fields: Any) -> TaskStepRow:
+        """Apply one step status change in its own short transaction.
+
+        Returns the reloaded row (detached, attributes populated).
+        """
+        async with session_scope(self._session_maker) as session:
+            await TaskRepo(session).update_step_status(step_id, status, **fields)
+            row = await session.get(TaskStepRow, step_id, populate_existing=True)
+        assert row is not None
+        return row
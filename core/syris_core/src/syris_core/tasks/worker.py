@@ -0,0 +1,305 @@
+"""
+Task worker pool — drives claimed tasks through TaskEngine concurrently.
+
+A single feeder claims pending tasks in batches via TaskEngine.claim_batch()
+(one UPDATE ... WHERE task_id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+RETURNING round-trip) and puts them on a bounded local prefetch queue. N
+workers drain that queue, each running one task at a time through
+TaskEngine.run_claimed(). Several processes can run pools against the same
+database; SKIP LOCKED partitions the queue between them.
+
+The prefetch queue holds ``max(size, prefetch)`` tasks (at least one per
+worker, so workers are never starved between claims), and the feeder only
+claims as many as there is room for. A process therefore holds at most
+``size + max(size, prefetch)`` claimed tasks: one running per worker plus a
+full queue.
+
+Idle behaviour
+--------------
+When a claim comes back empty the feeder sleeps with exponential backoff,
+starting at idle_backoff_min_s and doubling up to idle_backoff_max_s. Any
+successful claim resets the backoff, so a burst of submissions is drained at
+full speed.
+
+With a WakeupHub, the idle feeder instead sleeps until a "tasks"/"approvals"
+notification arrives, re-polling only every safety_poll_s. If the LISTEN
+connection drops it reverts to the backoff schedule above. Either way it
+also wakes when the earliest deferred retry (tasks.not_before) comes due.
+
+Shutdown
+--------
+stop() stops the feeder, hands every prefetched-but-unstarted task back to
+the pending queue, then waits up to grace_s for in-flight tasks to finish
+before cancelling them. A cancelled task stays ``running`` in the DB and is
+reconciled by TaskRecovery on the next boot.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Literal, Optional
+
+from ..storage.models import TaskRow
+from ..storage.notify import OverdueBackoff, WakeupHub, wakeup_timeout
+from .engine import TaskEngine
+
+logger = logging.getLogger(__name__)
+
+WorkerState = Literal["idle", "busy", "stopped"]
+
+_DEFAULT_IDLE_BACKOFF_MIN_S = 0.1
+_DEFAULT_IDLE_BACKOFF_MAX_S = 5.0
+_DEFAULT_GRACE_S = 30.0
+_DEFAULT_SAFETY_POLL_S = 30.0
+
+
+@dataclass(frozen=True)
+class WorkerSnapshot:
+    worker_id: int
+    state: WorkerState
+    tasks_run: int
+    errors: int
+    busy_s: float
+    idle_s: float
+
+
+@dataclass(frozen=True)
+class WorkerPoolSnapshot:
+    size: int
+    busy: int
+    tasks_run: int
+    errors: int
+    prefetched: int
+    claim_batches: int
+    tasks_claimed: int
+    workers: tuple[WorkerSnapshot, ...]
+
+
+class _WorkerStats:
+    """Mutable per-worker counters; read via TaskWorkerPool.snapshot()."""
+
+    def __init__(self, worker_id: int) -> None:
+        self.worker_id = worker_id
+        self.state: WorkerState = "idle"
+        self.tasks_run = 0
+        self.errors = 0
+        self.busy_s = 0.0
+        self.idle_s = 0.0
+        self._since = time.monotonic()
+
+    def transition(self, state: WorkerState) -> None:
+        now = time.monotonic()
+        elapsed = now - self._since
+        if self.state == "busy":
+            self.busy_s += elapsed
+        elif self.state == "idle":
+            self.idle_s += elapsed
+        self.state = state
+        self._since = now
+
+    def freeze(self) -> WorkerSnapshot:
+        # Include the time spent in the current state so far
+        elapsed = time.monotonic() - self._since
+        return WorkerSnapshot(
+            worker_id=self.worker_id,
+            state=self.state,
+            tasks_run=self.tasks_run,
+            errors=self.errors,
+            busy_s=round(self.busy_s + (elapsed if self.state == "busy" else 0.0), 3),
+            idle_s=round(self.idle_s + (elapsed if self.state == "idle" else 0.0), 3),
+        )
+
+
+class TaskWorkerPool:
+    """Supervised pool of N workers fed by a batch-claiming prefetch queue."""
+
+    def __init__(
+        self,
+        engine: TaskEngine,
+        *,
+        size: int,
+        prefetch: int = 0,
+        claim_batch_size: int = 16,
+        idle_backoff_min_s: float = _DEFAULT_IDLE_BACKOFF_MIN_S,
+        idle_backoff_max_s: float = _DEFAULT_IDLE_BACKOFF_MAX_S,
+        grace_s: float = _DEFAULT_GRACE_S,
+        wakeup_hub: Optional[WakeupHub] = None,
+        safety_poll_s: float = _DEFAULT_SAFETY_POLL_S,
+    ) -> None:
+        self._engine = engine
+        self._size = size
+        self._claim_batch_size = claim_batch_size
+        self._idle_backoff_min_s = idle_backoff_min_s
+        self._idle_backoff_max_s = idle_backoff_max_s
+        self._grace_s = grace_s
+        self._safety_poll_s = safety_poll_s
+        self._signal = wakeup_hub.subscribe("tasks", "approvals") if wakeup_hub else None
+        self._overdue = OverdueBackoff()
+
+        # Claimed tasks waiting for a free worker; None is the worker stop sentinel.
+        # Capacity is at least one task per worker so every worker can be fed.
+        self._queue: asyncio.Queue[TaskRow | None] = asyncio.Queue(maxsize=max(size, prefetch))
+        self._space = asyncio.Event()
+
+        self._stop_event = asyncio.Event()
+        self._feeder: asyncio.Task[None] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stats: list[_WorkerStats] = []
+        self._claim_batches = 0
+        self._tasks_claimed = 0
+
+    async def start(self) -> None:
+        if any(not t.done() for t in self._tasks):
+            return
+        if self._size <= 0:
+            logger.info("TaskWorkerPool disabled (size=0)")
+            return
+        self._stop_event.clear()
+        self._stats = [_WorkerStats(i) for i in range(self._size)]
+        self._tasks = [
+            asyncio.create_task(self._run_worker(stats), name=f"task_worker_{stats.worker_id}")
+            for stats in self._stats
+        ]
+        self._feeder = asyncio.create_task(self._run_feeder(), name="task_feeder")
+        logger.info(
+            "TaskWorkerPool started (size=%d, prefetch=%d, claim_batch=%d)",
+            self._size,
+            self._queue.maxsize,
+            self._claim_batch_size,
+        )
+
+    async def stop(self) -> None:
+        if not self._tasks:
+            return
+        self._stop_event.set()
+        self._space.set()
+        if self._signal is not None:
+            self._signal.set()
+        if self._feeder is not None:
+            await self._feeder
+            self._feeder = None
+
+        # Hand back anything claimed but not yet picked up by a worker
+        unstarted: list[TaskRow] = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                unstarted.append(item)
+        try:
+            await self._engine.release_claimed(unstarted)
+        except Exception:
+            logger.exception(
+                "TaskWorkerPool failed to release %d prefetched task(s); "
+                "recovery will requeue them on next boot",
+                len(unstarted),
+            )
+
+        for _ in self._tasks:
+            self._queue.put_nowait(None)
+        _, pending = await asyncio.wait(self._tasks, timeout=self._grace_s)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(
+                "TaskWorkerPool cancelled %d worker(s) still running after %ss grace",
+                len(pending),
+                self._grace_s,
+            )
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._tasks = []
+        logger.info("TaskWorkerPool stopped")
+
+    def snapshot(self) -> WorkerPoolSnapshot:
+        workers = tuple(stats.freeze() for stats in self._stats)
+        return WorkerPoolSnapshot(
+            size=self._size,
+            busy=sum(1 for w in workers if w.state == "busy"),
+            tasks_run=sum(w.tasks_run for w in workers),
+            errors=sum(w.errors for w in workers),
+            prefetched=self._queue.qsize(),
+            claim_batches=self._claim_batches,
+            tasks_claimed=self._tasks_claimed,
+            workers=workers,
+        )
+
+    async def _run_feeder(self) -> None:
+        backoff = self._idle_backoff_min_s
+        signal = self._signal
+        while not self._stop_event.is_set():
+            room = self._queue.maxsize - self._queue.qsize()
+            if room <= 0:
+                self._space.clear()
+                await self._space.wait()
+                continue
+
+            if signal is not None:
+                signal.clear()
+            try:
+                claimed = await self._engine.claim_batch(min(room, self._claim_batch_size))
+            except Exception:
+                logger.exception("task_feeder claim_batch error")
+                claimed = []
+
+            if claimed:
+                self._claim_batches += 1
+                self._tasks_claimed += len(claimed)
+                for task_row in claimed:
+                    self._queue.put_nowait(task_row)
+                backoff = self._idle_backoff_min_s
+                self._overdue.reset()
+                continue
+
+            # Nothing claimable — but a deferred retry may come due sooner
+            # than the next poll/notification
+            try:
+                next_due = await self._engine.next_deferred_at()
+            except Exception:
+                logger.exception("task_feeder next_deferred_at error")
+                next_due = None
+            until_due = (
+                max((next_due - datetime.now(timezone.utc)).total_seconds(), 0.0)
+                if next_due is not None
+                else None
+            )
+
+            listening = signal is not None and signal.listening
+            timeout = wakeup_timeout(
+                signal,
+                until_due,
+                poll_s=backoff,
+                safety_poll_s=self._safety_poll_s,
+                overdue=self._overdue,
+            )
+            if signal is not None:
+                await signal.wait(timeout)
+            else:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+            if not listening:
+                backoff = min(backoff * 2, self._idle_backoff_max_s)
+
+    async def _run_worker(self, stats: _WorkerStats) -> None:
+        try:
+            while True:
+                task_row = await self._queue.get()
+                self._space.set()
+                if task_row is None:
+                    return
+
+                stats.transition("busy")
+                try:
+                    await self._engine.run_claimed(task_row)
+                    stats.tasks_run += 1
+                except Exception:
+                    stats.errors += 1
+                    logger.exception(
+                        "task_worker_%d run_claimed error task_id=%s",
+                        stats.worker_id,
+                        task_row.task_id,
+                    )
+                stats.transition("idle")
+        finally:
+            stats.transition("stopped")
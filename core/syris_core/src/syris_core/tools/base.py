@@ -9,7 +9,7 @@ and audit — execute() should contain only domain logic.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Callable, ClassVar, Coroutine
+from typing import Any, Callable, ClassVar, Coroutine, Optional
 
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -67,6 +67,11 @@ class BaseTool(ABC):
         args_schema     A Pydantic BaseModel subclass. Validated before execute().
         risk_level      "low" | "medium" | "high" | "critical"
         idempotent      True if re-executing with the same input is safe.
+
+    Optional:
+        parallel_safe   Whether calls to this tool may run concurrently with
+                        other tool calls from the same LLM turn. None (the
+                        default) derives it: idempotent and risk low/medium.
     """
 
     name: ClassVar[str]
@@ -74,6 +79,13 @@ class BaseTool(ABC):
     args_schema: ClassVar[type[BaseModel]]
     risk_level: ClassVar[RiskLevel]
     idempotent: ClassVar[bool] = False
+    parallel_safe: ClassVar[Optional[bool]] = None
+
+    @classmethod
+    def allows_parallel(cls) -> bool:
+        if cls.parallel_safe is not None:
+            return cls.parallel_safe
+        return cls.idempotent and cls.risk_level in ("low", "medium")
 
     def __init__(self, deps: ToolDeps) -> None:
         self._deps = deps
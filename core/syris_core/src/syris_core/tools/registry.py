@@ -2,7 +2,9 @@
 ToolRegistry — in-memory registry of available tools.
 
 Tools are registered at startup via register(). After startup the registry
-is effectively immutable for the lifetime of the process.
+is effectively immutable for the lifetime of the process, so the LLM-facing
+renderings (text catalog, OpenAI tool list) are built once and cached;
+register() drops the cache and bumps ``version``.
 """
 import logging
 from typing import Any, Callable, Coroutine, Iterator
@@ -26,6 +28,10 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, type[BaseTool]] = {}
+        # Incremented on every register(); lets callers key their own caches
+        self.version = 0
+        self._catalog: str | None = None
+        self._openai_tools: tuple[ToolDefinition, ...] | None = None
 
     def register(self, tool_cls: type[BaseTool]) -> None:
         """Register a tool class. Raises ValueError on duplicate name."""
@@ -37,6 +43,9 @@ class ToolRegistry:
                 f"New: {tool_cls.__qualname__}"
             )
         self._tools[name] = tool_cls
+        self.version += 1
+        self._catalog = None
+        self._openai_tools = None
         logger.info("tool.registered name=%s risk=%s", name, tool_cls.risk_level)
 
     def get(self, name: str) -> type[BaseTool] | None:
@@ -61,6 +70,11 @@ class ToolRegistry:
         as_openai_tools() that iterates the same args_schema.model_json_schema()
         data — no changes to tool definitions needed.
         """
+        if self._catalog is None:
+            self._catalog = self._render_catalog()
+        return self._catalog
+
+    def _render_catalog(self) -> str:
         lines: list[str] = ["Available tools:"]
         for name in self.names():
             cls = self._tools[name]
@@ -96,16 +110,22 @@ class ToolRegistry:
 
     def llm_openai_tools(self) -> list[ToolDefinition]:
         """Return OpenAI-format tool definitions for native function calling."""
-        return [
-            ToolDefinition(
-                function=ToolFunctionSpec(
-                    name=cls.name,
-                    description=cls.description,
-                    parameters=cls.args_schema.model_json_schema(),
+        if self._openai_tools is None:
+            self._openai_tools = tuple(
+                ToolDefinition(
+                    function=ToolFunctionSpec(
+                        name=cls.name,
+                        description=cls.description,
+                        parameters=cls.args_schema.model_json_schema(),
+                    )
                 )
+                for cls in (self._tools[n] for n in self.names())
             )
-            for cls in (self._tools[n] for n in self.names())
-        ]
+        return list(self._openai_tools)
+
+    def serial_tool_names(self) -> frozenset[str]:
+        """Tools whose LLM-issued calls must not overlap other calls in a turn."""
+        return frozenset(name for name, cls in self._tools.items() if not cls.allows_parallel())
 
     def llm_namespace_catalog(self) -> list[str]:
         """Return sorted unique namespace prefixes from all registered tool names.
@@ -16,14 +16,16 @@ import logging
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Callable, Coroutine, Any
+from typing import Callable, Coroutine, Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..observability.audit import AuditWriter
+from ..pipeline.dispatcher import ThreadDispatcher
 from ..schemas.events import RawInput
 from ..storage.db import session_scope
 from ..storage.models import WatcherStateRow
+from ..storage.notify import OverdueBackoff, WakeupHub, wakeup_timeout
 from ..storage.repos.watchers import WatcherStateRepo
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,8 @@ logger = logging.getLogger(__name__)
 PipelineRunner = Callable[[RawInput], Coroutine[Any, Any, Any]]
 
 _WATCHER_POLL_S = 5
+# Safety-net poll while LISTEN/NOTIFY wakeups are being delivered
+_SAFETY_POLL_S = 60
 
 
 class BaseWatcher(ABC):
@@ -70,10 +74,17 @@ class WatcherLoop:
         sessionmaker: async_sessionmaker[AsyncSession],
         audit_writer: AuditWriter,
         pipeline_runner: PipelineRunner,
+        wakeup_hub: Optional[WakeupHub] = None,
+        dispatcher: Optional[ThreadDispatcher] = None,
     ) -> None:
         self._sessionmaker = sessionmaker
         self._audit = audit_writer
         self._pipeline_runner = pipeline_runner
+        self._wakeup = wakeup_hub.subscribe("watchers") if wakeup_hub else None
+        self._overdue = OverdueBackoff()
+        # With a dispatcher, pipeline runs go to the background instead of
+        # holding up the loop (the runner orders them per thread once normalized)
+        self._dispatcher = dispatcher
         self._watchers: dict[str, BaseWatcher] = {}
         self._stop_event = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
@@ -110,20 +121,36 @@ class WatcherLoop:
     async def _run_loop(self) -> None:
         try:
             while not self._stop_event.is_set():
+                if self._wakeup is not None:
+                    self._wakeup.clear()
+
+                next_due: Optional[float] = None
                 try:
-                    await self._tick_all()
+                    next_due = await self._tick_all()
                 except Exception:
                     logger.exception("WatcherLoop tick_all error")
 
+                timeout = wakeup_timeout(
+                    self._wakeup,
+                    next_due,
+                    poll_s=_WATCHER_POLL_S,
+                    safety_poll_s=_SAFETY_POLL_S,
+                    overdue=self._overdue,
+                )
+                if self._wakeup is not None:
+                    await self._wakeup.wait(timeout)
+                    continue
                 try:
-                    await asyncio.wait_for(self._stop_event.wait(), timeout=_WATCHER_POLL_S)
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
                 except asyncio.TimeoutError:
                     continue
         except asyncio.CancelledError:
             raise
 
-    async def _tick_all(self) -> None:
+    async def _tick_all(self) -> Optional[float]:
+        """Tick every due watcher. Returns seconds until the next one is due."""
         now = datetime.now(timezone.utc)
+        next_due: Optional[float] = None
         for watcher in self._watchers.values():
             async with session_scope(self._sessionmaker) as session:
                 repo = WatcherStateRepo(session)
@@ -132,10 +159,23 @@ class WatcherLoop:
                 if not state.enabled:
                     continue
 
-                if not self._is_due(state, watcher, now):
-                    continue
+                if self._is_due(state, watcher, now):
+                    await self._run_watcher(repo, watcher, state, now)
+                    remaining = float(watcher.tick_interval_seconds)
+                else:
+                    elapsed = (now - state.last_tick_at).total_seconds()
+                    remaining = watcher.tick_interval_seconds - elapsed
 
-                await self._run_watcher(repo, watcher, state, now)
+                next_due = remaining if next_due is None else min(next_due, remaining)
+        return next_due
+
+    async def _run_pipeline(self, watcher: BaseWatcher, raw: RawInput) -> None:
+        try:
+            await self._pipeline_runner(raw)
+        except Exception:
+            logger.exception(
+                "Pipeline error from watcher event watcher_id=%s", watcher.watcher_id
+            )
 
     def _is_due(self, state: WatcherStateRow, watcher: BaseWatcher, now: datetime) -> bool:
         if state.last_tick_at is None:
@@ -157,6 +197,7 @@ class WatcherLoop:
 
             await repo.update_fields(
                 watcher.watcher_id,
+                notify=False,
                 last_tick_at=now,
                 last_outcome="ok",
                 consecutive_errors=0,
@@ -172,18 +213,19 @@ class WatcherLoop:
             )
 
             for raw in raw_events:
-                try:
-                    await self._pipeline_runner(raw)
-                except Exception:
-                    logger.exception(
-                        "Pipeline error from watcher event watcher_id=%s", watcher.watcher_id
+                if self._dispatcher is not None:
+                    self._dispatcher.submit(
+                        lambda raw=raw: self._run_pipeline(watcher, raw),  # type: ignore[misc]
                     )
+                else:
+                    await self._run_pipeline(watcher, raw)
 
         except Exception:
             logger.exception("Watcher tick error watcher_id=%s", watcher.watcher_id)
             new_errors = state.consecutive_errors + 1
             await repo.update_fields(
                 watcher.watcher_id,
+                notify=False,
                 last_tick_at=now,
                 last_outcome="error",
                 consecutive_errors=new_errors,
@@ -0,0 +1,136 @@
+"""Test doubles shared across the suite."""
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from syris_core.llm.providers.base import BaseProvider, ProviderTurn
+from syris_core.llm.providers.ollama import OllamaProvider
+
+
+class StubLLMServer:
+    """OpenAI-compatible /v1/chat/completions on 127.0.0.1, one reply per server.
+
+    Behaviour can be changed between (or during) requests: *delay_s* before
+    answering, *status* for the HTTP status, *chunk_delay_s* between streamed
+    deltas. Every request is counted in *requests*.
+    """
+
+    def __init__(self, reply: str) -> None:
+        self.reply = reply
+        self.delay_s = 0.0
+        self.chunk_delay_s = 0.0
+        self.status = 200
+        self.requests = 0
+        self._server: Optional[asyncio.Server] = None
+        self._handlers: set[asyncio.Task[None]] = set()
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def provider(self) -> OllamaProvider:
+        return OllamaProvider(self.base_url, model=self.reply, timeout_s=5, http2=False)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._accept, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers.add(task)
+        try:
+            await self._handle(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if not await reader.readline():
+            return
+        headers: dict[str, str] = {}
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+        payload = json.loads(await reader.readexactly(int(headers.get("content-length", "0"))))
+        self.requests += 1
+
+        await asyncio.sleep(self.delay_s)
+        if self.status != 200:
+            body = b'{"error": "stub failure"}'
+            writer.write(
+                b"HTTP/1.1 %d Error\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\nConnection: close\r\n\r\n%s"
+                % (self.status, len(body), body)
+            )
+            await writer.drain()
+            return
+
+        if payload.get("stream"):
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nConnection: close\r\n\r\n"
+            )
+            for word in self.reply.split():
+                chunk = {"model": self.reply, "choices": [{"delta": {"content": word + " "}}]}
+                writer.write(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+                await writer.drain()
+                await asyncio.sleep(self.chunk_delay_s)
+            writer.write(b"data: [DONE]\n\n")
+            await writer.drain()
+            return
+
+        body = json.dumps({
+            "model": self.reply,
+            "choices": [{"message": {"role": "assistant", "content": self.reply}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1},
+        }).encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(body), body)
+        )
+        await writer.drain()
+
+
+@asynccontextmanager
+async def stub_servers(*replies: str) -> AsyncIterator[list[StubLLMServer]]:
+    servers = [StubLLMServer(reply) for reply in replies]
+    for server in servers:
+        await server.start()
+    try:
+        yield servers
+    finally:
+        for server in servers:
+            await server.stop()
+
+
+class CountingProvider(BaseProvider):
+    """In-process provider that echoes the user message and counts calls."""
+
+    name = "counting"
+
+    def __init__(self, delay_s: float = 0.0) -> None:
+        self._model = "echo"
+        self.delay_s = delay_s
+        self.calls = 0
+
+    async def _turn(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> ProviderTurn:
+        self.calls += 1
+        await asyncio.sleep(self.delay_s)
+        return ProviderTurn(content=messages[-1]["content"], tool_calls=None, model=self._model)
+
@@ -0,0 +1,73 @@
+"""AdmissionController lane priority and interactive reservation."""
+import asyncio
+
+from syris_core.llm.admission import AdmissionController
+
+
+async def _hold(
+    admission: AdmissionController, lane, order: list[str], name: str, hold_s: float
+) -> None:
+    async with admission.slot(lane):
+        order.append(name)
+        await asyncio.sleep(hold_s)
+
+
+async def test_queued_lanes_are_served_by_priority_then_fifo():
+    admission = AdmissionController(max_in_flight=1)
+    order: list[str] = []
+
+    blocker = asyncio.create_task(_hold(admission, "background", order, "blocker", 0.02))
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(_hold(admission, lane, order, name, 0.0))
+        for lane, name in [
+            ("background", "bg-1"),
+            ("task", "task-1"),
+            ("interactive", "chat-1"),
+            ("background", "bg-2"),
+            ("interactive", "chat-2"),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert admission.snapshot().queued == {"interactive": 2, "task": 1, "background": 2}
+
+    await asyncio.gather(blocker, *waiters)
+
+    assert order == ["blocker", "chat-1", "chat-2", "task-1", "bg-1", "bg-2"]
+    assert admission.snapshot().in_flight == 0
+
+
+async def test_reserved_slot_is_never_given_to_background():
+    admission = AdmissionController(max_in_flight=2, reserved_interactive=1)
+    order: list[str] = []
+
+    background = [
+        asyncio.create_task(_hold(admission, "background", order, f"bg-{i}", 0.05))
+        for i in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    assert admission.snapshot().in_flight == 1
+
+    # The reserved slot is free, so chat is admitted without waiting
+    async with admission.slot("interactive") as ticket:
+        order.append("chat")
+    await asyncio.gather(*background)
+
+    assert ticket.wait_ms < 20
+    assert order == ["bg-0", "chat", "bg-1"]
+
+
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    admission = AdmissionController(max_in_flight=1)
+    order: list[str] = []
+
+    blocker = asyncio.create_task(_hold(admission, "task", order, "blocker", 0.02))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(_hold(admission, "task", order, "cancelled", 0.0))
+    after = asyncio.create_task(_hold(admission, "task", order, "after", 0.0))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.gather(blocker, after, cancelled, return_exceptions=True)
+
+    assert order == ["blocker", "after"]
+    assert admission.snapshot().in_flight == 0
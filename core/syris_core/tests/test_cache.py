@@ -0,0 +1,63 @@
+"""ResponseCache TTL and LRU behaviour (in-process tier only)."""
+import asyncio
+
+from syris_core.llm.cache import ResponseCache
+from syris_core.schemas.llm import LLMRequest
+
+from .stubs import CountingProvider
+
+
+def _request(message: str) -> LLMRequest:
+    return LLMRequest(system_prompt="classify", user_message=message)
+
+
+async def test_repeat_request_is_served_from_cache():
+    provider = CountingProvider()
+    cache = ResponseCache(ttl_s=60)
+
+    first = await cache.complete(provider, _request("ping"))
+    second = await cache.complete(provider, _request("ping"))
+
+    assert provider.calls == 1
+    assert (first.cached, second.cached) == (False, True)
+    assert second.content == first.content == "ping"
+    snapshot = cache.snapshot()
+    assert (snapshot.hits, snapshot.misses) == (1, 1)
+
+
+async def test_entries_expire_after_ttl():
+    provider = CountingProvider()
+    cache = ResponseCache(ttl_s=0.02)
+
+    await cache.complete(provider, _request("ping"))
+    await asyncio.sleep(0.03)
+    response = await cache.complete(provider, _request("ping"))
+
+    assert not response.cached
+    assert provider.calls == 2
+
+
+async def test_least_recently_used_entry_is_evicted():
+    provider = CountingProvider()
+    cache = ResponseCache(ttl_s=60, max_entries=2)
+
+    await cache.complete(provider, _request("a"))
+    await cache.complete(provider, _request("b"))
+    await cache.complete(provider, _request("a"))  # a is now most recent
+    await cache.complete(provider, _request("c"))  # evicts b
+
+    assert (await cache.complete(provider, _request("a"))).cached
+    assert not (await cache.complete(provider, _request("b"))).cached
+    assert cache.snapshot().evictions >= 1
+    assert len(cache) == 2
+
+
+async def test_different_system_prompts_do_not_share_entries():
+    provider = CountingProvider()
+    cache = ResponseCache(ttl_s=60)
+
+    await cache.complete(provider, LLMRequest(system_prompt="one", user_message="x"))
+    response = await cache.complete(provider, LLMRequest(system_prompt="two", user_message="x"))
+
+    assert not response.cached
+    assert provider.calls == 2
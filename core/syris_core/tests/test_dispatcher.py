@@ -0,0 +1,166 @@
+"""ThreadDispatcher ordering, concurrency bound and cancellation."""
+import asyncio
+import functools
+import uuid
+
+from syris_core.pipeline.dispatcher import ThreadDispatcher
+
+
+class _Probe:
+    """Records start order and peak concurrency of the runs it makes."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.running = 0
+        self.peak = 0
+
+    def job(self, name: str, hold_s: float = 0.01):
+        async def run() -> str:
+            self.started.append(name)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            try:
+                await asyncio.sleep(hold_s)
+            finally:
+                self.running -= 1
+            return name
+
+        return run
+
+
+async def test_same_thread_runs_in_order_one_at_a_time():
+    dispatcher = ThreadDispatcher(max_concurrency=8)
+    probe = _Probe()
+    thread = uuid.uuid4()
+
+    results = await asyncio.gather(
+        *(dispatcher.run(thread, probe.job(f"r{i}")) for i in range(5))
+    )
+
+    assert results == [f"r{i}" for i in range(5)]
+    assert probe.started == [f"r{i}" for i in range(5)]
+    assert probe.peak == 1
+    assert dispatcher.snapshot().threads == 0
+
+
+async def test_threads_run_concurrently_up_to_the_bound():
+    dispatcher = ThreadDispatcher(max_concurrency=3)
+    probe = _Probe()
+
+    await asyncio.gather(
+        *(dispatcher.run(uuid.uuid4(), probe.job(f"t{i}", 0.05)) for i in range(6))
+    )
+
+    assert probe.peak == 3
+    assert dispatcher.snapshot().dispatched == 6
+
+
+async def test_none_key_has_no_ordering():
+    dispatcher = ThreadDispatcher(max_concurrency=4)
+    probe = _Probe()
+
+    await asyncio.gather(*(dispatcher.run(None, probe.job(f"n{i}", 0.05)) for i in range(4)))
+
+    assert probe.peak == 4
+
+
+async def test_waiting_for_a_turn_holds_no_slot():
+    dispatcher = ThreadDispatcher(max_concurrency=1)
+    probe = _Probe()
+    busy = uuid.uuid4()
+
+    first = asyncio.create_task(dispatcher.run(busy, probe.job("busy-1", 0.05)))
+    queued = asyncio.create_task(dispatcher.run(busy, probe.job("busy-2", 0.05)))
+    await asyncio.sleep(0)
+    other = asyncio.create_task(dispatcher.run(uuid.uuid4(), probe.job("other", 0.0)))
+    await asyncio.gather(first, queued, other)
+
+    # "other" got the single slot as soon as busy-1 released it
+    assert probe.started == ["busy-1", "other", "busy-2"]
+
+
+async def test_cancelled_waiter_keeps_successor_behind_the_running_run():
+    dispatcher = ThreadDispatcher(max_concurrency=4)
+    probe = _Probe()
+    thread = uuid.uuid4()
+
+    first = asyncio.create_task(dispatcher.run(thread, probe.job("first", 0.05)))
+    second = asyncio.create_task(dispatcher.run(thread, probe.job("second")))
+    third = asyncio.create_task(dispatcher.run(thread, probe.job("third")))
+    await asyncio.sleep(0.01)
+    second.cancel()
+    await asyncio.gather(first, third, second, return_exceptions=True)
+
+    assert second.cancelled()
+    assert probe.started == ["first", "third"]
+    assert probe.peak == 1
+
+
+async def test_failing_run_releases_its_turn():
+    dispatcher = ThreadDispatcher(max_concurrency=2)
+    thread = uuid.uuid4()
+
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        dispatcher.run(thread, boom), dispatcher.run(thread, _Probe().job("after")),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "after"
+
+
+async def test_limiter_bounds_runs_without_parking_shared_slots():
+    dispatcher = ThreadDispatcher(max_concurrency=2)
+    batch = _Probe()
+    limiter = asyncio.Semaphore(1)
+
+    batch_runs = [
+        asyncio.create_task(
+            dispatcher.run(uuid.uuid4(), batch.job(f"b{i}", 0.05), limiter=limiter)
+        )
+        for i in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    # Batch items queued on the limiter must leave the second slot free
+    unrelated = await asyncio.wait_for(
+        dispatcher.run(uuid.uuid4(), _Probe().job("unrelated", 0.0)), timeout=0.03
+    )
+    await asyncio.gather(*batch_runs)
+
+    assert unrelated == "unrelated"
+    assert batch.peak == 1
+
+
+async def test_submit_runs_in_background_and_drain_waits():
+    dispatcher = ThreadDispatcher(max_concurrency=2)
+    done: list[int] = []
+
+    async def work(i: int) -> None:
+        await asyncio.sleep(0.01)
+        done.append(i)
+
+    async def fail() -> None:
+        raise RuntimeError("boom")
+
+    for i in range(3):
+        dispatcher.submit(functools.partial(work, i))
+    dispatcher.submit(fail)
+    assert dispatcher.snapshot().background == 4
+
+    await dispatcher.drain(grace_s=1.0)
+
+    assert sorted(done) == [0, 1, 2]
+    snapshot = dispatcher.snapshot()
+    assert (snapshot.background, snapshot.background_errors) == (0, 1)
+
+
+async def test_drain_cancels_runs_past_the_grace_period():
+    dispatcher = ThreadDispatcher(max_concurrency=1)
+    dispatcher.submit(functools.partial(asyncio.sleep, 10))
+
+    await dispatcher.drain(grace_s=0.01)
+
+    assert dispatcher.snapshot().background == 0
@@ -0,0 +1,81 @@
+"""IdempotencyCache: sharing in-flight responses, abandon and expiry."""
+import asyncio
+import uuid
+
+from syris_core.pipeline.idempotency import IdempotencyCache
+from syris_core.schemas.pipeline import ExecutionOutcome, ExecutionResult, IngestResponse
+
+
+def _response(reply: str) -> IngestResponse:
+    return IngestResponse(
+        execution=ExecutionResult(
+            event_id=uuid.uuid4(),
+            trace_id=uuid.uuid4(),
+            handler="test",
+            outcome=ExecutionOutcome.SUCCESS,
+            detail="ok",
+        ),
+        reply=reply,
+    )
+
+
+async def test_duplicate_waits_for_in_flight_original():
+    cache = IdempotencyCache(window_s=60)
+    cache.begin("k")
+    waiter = asyncio.create_task(cache.lookup("k"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    response = _response("hello")
+    cache.complete("k", response)
+
+    assert await waiter is response
+    assert await cache.lookup("k") is response
+
+
+async def test_abandon_releases_waiters_without_a_response():
+    cache = IdempotencyCache(window_s=60)
+    cache.begin("k")
+    waiter = asyncio.create_task(cache.lookup("k"))
+    await asyncio.sleep(0)
+
+    cache.abandon("k")
+
+    assert await waiter is None
+    assert await cache.lookup("k") is None
+    assert len(cache) == 0
+
+
+async def test_abandon_after_complete_is_a_no_op():
+    cache = IdempotencyCache(window_s=60)
+    cache.begin("k")
+    response = _response("hello")
+    cache.complete("k", response)
+
+    cache.abandon("k")
+
+    assert await cache.lookup("k") is response
+
+
+async def test_completed_entries_expire_after_the_window():
+    cache = IdempotencyCache(window_s=0.02)
+    cache.begin("k")
+    cache.complete("k", _response("hello"))
+
+    await asyncio.sleep(0.03)
+
+    assert await cache.lookup("k") is None
+
+
+async def test_cancelled_lookup_does_not_cancel_the_entry():
+    cache = IdempotencyCache(window_s=60)
+    cache.begin("k")
+    waiter = asyncio.create_task(cache.lookup("k"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    response = _response("hello")
+    cache.complete("k", response)
+
+    assert await cache.lookup("k") is response
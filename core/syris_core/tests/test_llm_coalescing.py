@@ -0,0 +1,45 @@
+"""Single-flight coalescing of stateless LLM calls."""
+import asyncio
+
+from syris_core.llm.admission import AdmissionController
+from syris_core.llm.client import LLMClient
+from syris_core.schemas.llm import LLMRequest
+
+from .stubs import CountingProvider
+
+REQUEST = LLMRequest(system_prompt="classify", user_message="ping")
+
+
+def _client(provider: CountingProvider) -> LLMClient:
+    return LLMClient(
+        provider, audit=None, system_prompt="sys", admission=AdmissionController(4)
+    )
+
+
+async def test_identical_calls_in_one_lane_share_a_provider_call():
+    provider = CountingProvider(delay_s=0.02)
+    client = _client(provider)
+
+    (first, first_ticket), (second, second_ticket) = await asyncio.gather(
+        client._complete_stateless(REQUEST, "background"),
+        client._complete_stateless(REQUEST, "background"),
+    )
+
+    assert provider.calls == 1
+    assert (first.coalesced, second.coalesced) == (False, True)
+    assert first_ticket is not None and second_ticket is None
+    assert client.coalescing_snapshot().in_flight == 0
+
+
+async def test_interactive_call_does_not_join_a_background_leader():
+    provider = CountingProvider(delay_s=0.02)
+    client = _client(provider)
+
+    (background, _), (interactive, ticket) = await asyncio.gather(
+        client._complete_stateless(REQUEST, "background"),
+        client._complete_stateless(REQUEST, "interactive"),
+    )
+
+    assert provider.calls == 2
+    assert not interactive.coalesced
+    assert ticket is not None and ticket.lane == "interactive"
@@ -0,0 +1,28 @@
+"""wakeup_timeout and the overdue-deadline backoff."""
+from syris_core.storage.notify import OverdueBackoff, wakeup_timeout
+
+
+def test_timeout_is_the_earlier_of_poll_and_deadline():
+    assert wakeup_timeout(None, 2.0, poll_s=5.0, safety_poll_s=60.0) == 2.0
+    assert wakeup_timeout(None, None, poll_s=5.0, safety_poll_s=60.0) == 5.0
+
+
+def test_overdue_deadline_backs_off_exponentially_then_resets():
+    overdue = OverdueBackoff(min_s=0.1, max_s=1.0)
+
+    def sleep(next_due):
+        return wakeup_timeout(None, next_due, poll_s=5.0, safety_poll_s=60.0, overdue=overdue)
+
+    assert [sleep(-1.0) for _ in range(6)] == [0.1, 0.2, 0.4, 0.8, 1.0, 1.0]
+    assert sleep(3.0) == 3.0
+    assert sleep(0.0) == 0.1
+
+
+def test_reset_restarts_from_the_minimum():
+    overdue = OverdueBackoff(min_s=0.1, max_s=1.0)
+    overdue.floor(0.0)
+    overdue.floor(0.0)
+
+    overdue.reset()
+
+    assert overdue.floor(0.0) == 0.1
@@ -0,0 +1,23 @@
+"""RetryPolicy.delay_for."""
+from syris_core.schemas.tasks import RetryPolicy
+
+
+def test_default_is_a_fixed_delay_without_jitter():
+    policy = RetryPolicy(backoff_s=2.0)
+
+    assert [policy.delay_for(n) for n in (1, 2, 5)] == [2.0, 2.0, 2.0]
+
+
+def test_exponential_doubles_up_to_the_cap():
+    policy = RetryPolicy(backoff_s=1.0, backoff_strategy="exponential", backoff_max_s=5.0)
+
+    assert [policy.delay_for(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_jitter_stays_within_its_fraction():
+    policy = RetryPolicy(backoff_s=10.0, jitter=0.2)
+
+    delays = [policy.delay_for(1) for _ in range(200)]
+
+    assert all(8.0 <= d <= 12.0 for d in delays)
+    assert len(set(delays)) > 1
@@ -0,0 +1,208 @@
+"""RoutingProvider against local stub LLM servers."""
+import asyncio
+import time
+
+from syris_core.llm.providers.router import RoutingProvider
+from syris_core.schemas.llm import ChatMessage, LLMChatRequest, LLMRequest
+
+from .stubs import stub_servers
+
+REQUEST = LLMRequest(system_prompt="sys", user_message="hi")
+
+
+def _states(router: RoutingProvider) -> list[str]:
+    return [b.state for b in router.backend_snapshots()]
+
+
+async def test_routes_to_lowest_latency_backend():
+    async with stub_servers("slow", "fast") as (slow, fast):
+        slow.delay_s = 0.05
+        router = RoutingProvider([slow.provider(), fast.provider()])
+        try:
+            replies = [(await router.complete(REQUEST)).content for _ in range(4)]
+        finally:
+            await router.aclose()
+
+    # Unmeasured backends go first; after that the faster one wins
+    assert replies == ["slow", "fast", "fast", "fast"]
+
+
+async def test_fails_over_to_next_backend():
+    async with stub_servers("down", "up") as (down, up):
+        down.status = 500
+        router = RoutingProvider([down.provider(), up.provider()])
+        try:
+            response = await router.complete(REQUEST)
+        finally:
+            await router.aclose()
+
+    assert response.content == "up"
+    down_stats, up_stats = router.backend_snapshots()
+    assert (down_stats.errors, up_stats.errors) == (1, 0)
+    assert down.requests == up.requests == 1
+
+
+async def test_raises_last_error_when_every_backend_fails():
+    async with stub_servers("a", "b") as (a, b):
+        a.status = b.status = 503
+        router = RoutingProvider([a.provider(), b.provider()])
+        try:
+            try:
+                await router.complete(REQUEST)
+            except Exception as exc:
+                error = exc
+            else:
+                error = None
+        finally:
+            await router.aclose()
+
+    assert error is not None
+    assert a.requests == b.requests == 1
+
+
+async def test_hedges_slow_primary():
+    async with stub_servers("stuck", "backup") as (stuck, backup):
+        stuck.delay_s = 1.0
+        router = RoutingProvider([stuck.provider(), backup.provider()], hedge_after_ms=50)
+        try:
+            t0 = time.monotonic()
+            response = await router.complete(REQUEST)
+            elapsed = time.monotonic() - t0
+        finally:
+            await router.aclose()
+
+    assert response.content == "backup"
+    assert elapsed < 0.5
+    stuck_stats, backup_stats = router.backend_snapshots()
+    assert backup_stats.hedges_started == backup_stats.hedges_won == 1
+    # The cancelled loser is not an error, but its latency is recorded
+    assert stuck_stats.errors == 0
+    assert stuck_stats.p50_ms is not None and stuck_stats.p50_ms >= 50
+
+
+async def test_breaker_opens_then_half_open_probe_closes_it():
+    async with stub_servers("flaky", "steady") as (flaky, steady):
+        flaky.status = 500
+        router = RoutingProvider(
+            [flaky.provider(), steady.provider()], failure_threshold=2, open_s=0.2
+        )
+        try:
+            await router.complete(REQUEST)
+            await router.complete(REQUEST)
+            assert _states(router) == ["open", "closed"]
+
+            # While open the backend gets no traffic
+            await router.complete(REQUEST)
+            assert flaky.requests == 2
+
+            flaky.status = 200
+            await asyncio.sleep(0.25)
+            response = await router.complete(REQUEST)
+        finally:
+            await router.aclose()
+
+    assert response.content == "flaky"
+    assert flaky.requests == 3
+    assert _states(router) == ["closed", "closed"]
+
+
+async def test_failed_probe_reopens_breaker():
+    async with stub_servers("flaky", "steady") as (flaky, steady):
+        flaky.status = 500
+        router = RoutingProvider(
+            [flaky.provider(), steady.provider()], failure_threshold=1, open_s=0.1
+        )
+        try:
+            await router.complete(REQUEST)
+            await asyncio.sleep(0.15)
+            response = await router.complete(REQUEST)
+        finally:
+            await router.aclose()
+
+    assert response.content == "steady"
+    assert flaky.requests == 2
+    assert _states(router) == ["open", "closed"]
+
+
+async def test_half_open_backend_admits_a_single_probe():
+    async with stub_servers("flaky", "steady") as (flaky, steady):
+        flaky.status = 500
+        router = RoutingProvider(
+            [flaky.provider(), steady.provider()], failure_threshold=1, open_s=0.1
+        )
+        try:
+            await router.complete(REQUEST)
+            flaky.status = 200
+            flaky.delay_s = 0.1
+            await asyncio.sleep(0.15)
+            replies = await asyncio.gather(*(router.complete(REQUEST) for _ in range(3)))
+        finally:
+            await router.aclose()
+
+    assert sorted(r.content for r in replies) == ["flaky", "steady", "steady"]
+    assert flaky.requests == 2
+
+
+async def test_all_breakers_open_still_tries_one_backend():
+    async with stub_servers("a", "b") as (a, b):
+        a.status = b.status = 500
+        router = RoutingProvider([a.provider(), b.provider()], failure_threshold=1, open_s=60)
+        try:
+            try:
+                await router.complete(REQUEST)
+            except Exception:
+                pass
+            assert _states(router) == ["open", "open"]
+            a.status = 200
+            response = await router.complete(REQUEST)
+        finally:
+            await router.aclose()
+
+    assert response.content == "a"
+
+
+async def test_stream_fails_over_before_first_delta():
+    async with stub_servers("down", "streamed reply") as (down, up):
+        down.status = 500
+        router = RoutingProvider([down.provider(), up.provider()])
+        request = LLMChatRequest(messages=[ChatMessage(role="user", content="hi")])
+        try:
+            chunks = [chunk async for chunk in router.chat_stream(request)]
+        finally:
+            await router.aclose()
+
+    deltas = "".join(c.delta for c in chunks if c.delta)
+    assert deltas == "streamed reply "
+    assert chunks[-1].done and chunks[-1].response is not None
+    assert chunks[-1].response.content == "streamed reply "
+
+
+async def test_abandoned_stream_releases_half_open_probe():
+    async with stub_servers("one two three") as (flaky,):
+        flaky.status = 500
+        router = RoutingProvider([flaky.provider()], failure_threshold=1, open_s=0.05)
+        request = LLMChatRequest(messages=[ChatMessage(role="user", content="hi")])
+        try:
+            try:
+                await router.complete(REQUEST)
+            except Exception:
+                pass
+            flaky.status = 200
+            flaky.chunk_delay_s = 0.05
+            await asyncio.sleep(0.1)
+
+            stream = router.chat_stream(request)
+            async for _ in stream:
+                break
+            await stream.aclose()
+
+            # Neither failed nor closed, and the probe is free again
+            assert _states(router) == ["half_open"]
+            assert router._backends[0].available(time.monotonic(), 0.05)
+            flaky.chunk_delay_s = 0.0
+            response = await router.complete(REQUEST)
+        finally:
+            await router.aclose()
+
+    assert response.content == "one two three"
+    assert _states(router) == ["closed"]
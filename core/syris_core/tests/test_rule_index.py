@@ -0,0 +1,68 @@
+"""Condition semantics and RuleIndex bucketing."""
+import itertools
+import uuid
+
+from syris_core.rules.compiled import RuleIndex, compile_condition
+from syris_core.schemas.events import MessageEvent
+from syris_core.storage.models import RuleRow
+
+EVENT = MessageEvent(
+    source="ha.sensor",
+    content="Door OPEN in hallway",
+    structured={"door": "front", "alarm": {"level": 3}},
+)
+
+
+def _rule(*conditions) -> RuleRow:
+    return RuleRow(rule_id=uuid.uuid4(), name="r", conditions=list(conditions))
+
+
+def test_operators():
+    cases = [
+        ({"op": "eq", "field": "source", "value": "ha.sensor"}, True),
+        ({"op": "eq", "field": "structured.alarm.level", "value": 3}, True),
+        ({"op": "contains", "field": "content", "value": "OPEN"}, True),
+        ({"op": "contains", "field": "content", "value": "open"}, False),
+        ({"op": "matches", "field": "content", "value": "door\\s+open"}, True),
+        ({"op": "matches", "field": "content", "value": "("}, False),
+        ({"op": "has_key", "field": "structured.door"}, True),
+        ({"op": "has_key", "field": "content"}, False),
+        ({"op": "eq", "field": "structured.missing", "value": "None"}, False),
+        ({"op": "eq", "field": "structured.door.inner", "value": "x"}, False),
+        ({"op": "eq", "field": "unknown", "value": "x"}, False),
+        ({"op": "bogus", "field": "source", "value": "ha.sensor"}, False),
+        ({"op": "eq", "field": 7, "value": "x"}, False),
+    ]
+    for cond, expected in cases:
+        assert compile_condition(cond)(EVENT) is expected, cond
+
+
+def test_index_matches_the_same_rules_as_a_full_scan():
+    conditions = [
+        {"op": "eq", "field": "source", "value": "ha.sensor"},
+        {"op": "eq", "field": "source", "value": "cron"},
+        {"op": "has_key", "field": "structured.door"},
+        {"op": "eq", "field": "structured.door", "value": "back"},
+        {"op": "matches", "field": "structured.alarm.level", "value": "^3$"},
+        {"op": "contains", "field": "content", "value": "OPEN"},
+    ]
+    rows = [_rule(*combo) for n in range(3) for combo in itertools.combinations(conditions, n)]
+    rows.append(RuleRow(rule_id=uuid.uuid4(), name="malformed", conditions=["nope"]))
+    index = RuleIndex(rows)
+
+    events = [
+        EVENT,
+        MessageEvent(source="cron", content="tick"),
+        MessageEvent(source="ha.sensor", content="x", structured={"door": "back"}),
+        MessageEvent(source="other", content="OPEN", structured={"alarm": {"level": "3"}}),
+    ]
+    for event in events:
+        expected = {
+            row.rule_id
+            for row in rows
+            if all(isinstance(c, dict) for c in row.conditions)
+            and all(compile_condition(c)(event) for c in row.conditions)
+        }
+        assert {rule.rule_id for rule in index.match(event)} == expected
+
+    assert index.size == len(rows) - 1